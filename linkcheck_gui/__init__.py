@@ -15,8 +15,11 @@
 # 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 
 from enum import Enum
+import copy
+import functools
 import os
 import re
+import sqlite3
 import sys
 import webbrowser
 
@@ -25,26 +28,42 @@ from linkcheck import checker as linkchecker_checker
 from linkcheck import configuration as linkchecker_configuration
 from linkcheck import (director, get_link_pat, httputil, logconf,
                        mimeutil, strformat)
-from linkcheck.parser import parse_text
 from PyQt6 import QtCore, QtGui, QtWidgets
 
 from . import configuration
 from .checker import CheckerThread
+from .checkpoint import (Checkpoint, CheckpointInterval, CheckpointUrlQueue,
+                         add_cached_results, get_checkpoint_filename,
+                         get_queued_url)
+from .checkstats import CheckStats
+from .contentcache import add_plugin, ContentCache
 from .contextmenu import ContextMenu
+from .dashboard import Dashboard
 from .debug import LinkCheckerDebug
-from .editor import EditorWindow
+from .editor import EditorWindow, get_local_filename, read_file
 from .help import HelpWindow
-from .library import url as urlutil
+from .history import CheckHistory, get_unchanged
+from .hoststats import HostStatsDock
+from .jobs import JobDock, JobStatus
 from .linkchecker_ui_main import Ui_MainWindow
-from .logger import GuiLogHandler, SignalLogger, StatusLogger
+from .logger import GuiLogHandler, get_progress, SignalLogger, StatusLogger
 from .options import LinkCheckerOptions
 from .projects import ProjectExt, loadproject, openproject, saveproject
 from .properties import clear_properties, set_properties
 from .recentdocs import RecentDocumentModel
+from .resultdb import ResultDB
+from .resultdiff import (compare, count_categories, DiffDock, DiffFixed, DiffNew,
+                         DiffNotRechecked, get_db_entries, get_entries)
+from .sessions import SessionDock, ThreadBudget
+from .sourcefetch import SourceFetch
 from .settings import Settings
+from .sqlmodel import get_database_filename, ResultWriter, SqlResultModel
 from .statistics import clear_statistics, set_statistics
+from .urlfilter import FilterStatus, UrlFilterProxyModel
+from .urllist import is_url_list, UrlListReader
 from .urlmodel import UrlItemModel
-from .urlsave import urlsave
+from .urlsave import get_logger, get_save_filename, UrlSaveThread
+from .urltree import UrlTreeModel
 
 DocBaseUrl = "qthelp://linkchecker.app.linkchecker-gui/doc/"
 RegistryBase = "LinkChecker-GUI"
@@ -70,7 +89,6 @@ class LinkCheckerMain(QtWidgets.QMainWindow, Ui_MainWindow):
     """The main window displaying checked URLs."""
 
     log_url_signal = QtCore.pyqtSignal(object)
-    log_status_signal = QtCore.pyqtSignal(int, int, int, float, int)
     log_stats_signal = QtCore.pyqtSignal(object)
     error_signal = QtCore.pyqtSignal(str)
 
@@ -90,6 +108,13 @@ class LinkCheckerMain(QtWidgets.QMainWindow, Ui_MainWindow):
         self.checker = CheckerThread(parent=self)
         self.contextmenu = ContextMenu(parent=self)
         self.editor = EditorWindow(parent=self)
+        # download of the source shown in the editor
+        self.sourcefetch = None
+        # pages parsed by the last check
+        self.contentcache = ContentCache()
+        # True if the last check ended without being canceled
+        self.check_complete = False
+        self.editor.closed.connect(self.cancel_view_source)
         self.assistant = HelpWindow(self, self.get_qhcpath())
         self.actionHelp.setVisible(True)
         self.config_error = None
@@ -99,10 +124,18 @@ class LinkCheckerMain(QtWidgets.QMainWindow, Ui_MainWindow):
         self.movie.setCacheMode(QtGui.QMovie.CacheMode.CacheAll)
         self.label_busy.setText("")
         self.label_busy.setMovie(self.movie)
+        # updates the progress labels, see start_check()
+        self.status_timer = QtCore.QTimer(self)
         # init the rest
         self.init_logging()
         self.init_url(url)
         self.init_treeview()
+        self.init_docks()
+        self.init_checkpoint()
+        self.init_database()
+        self.init_urllist()
+        self.init_filter()
+        self.init_saver()
         self.connect_widgets()
         self.init_shortcuts()
         self.init_config()
@@ -129,6 +162,11 @@ class LinkCheckerMain(QtWidgets.QMainWindow, Ui_MainWindow):
     def init_menu(self):
         """Add menu entries for bookmark file checking."""
         self.urlinput.addMenuEntries(self.menuEdit)
+        self.menuView.addAction(self.dashboard.toggleViewAction())
+        self.menuView.addAction(self.hostsdock.toggleViewAction())
+        self.menuView.addAction(self.diffdock.toggleViewAction())
+        self.menuView.addAction(self.jobsdock.toggleViewAction())
+        self.menuView.addAction(self.sessionsdock.toggleViewAction())
         """  # XXX
         self.menuLang = self.menuEdit.addMenu(_('Languages'))
         self.menuLang.setTitle(_("&Language"))
@@ -168,6 +206,8 @@ class LinkCheckerMain(QtWidgets.QMainWindow, Ui_MainWindow):
             self.set_statusmsg(msg)
         data = self.settings.read_misc()
         self.saveresultas = data['saveresultas']
+        # (filename, logtype) results are written to while checking
+        self.streamresults = None
 
     def get_qhcpath(self):
         """Helper function to search for the QHC help file in different
@@ -186,16 +226,31 @@ class LinkCheckerMain(QtWidgets.QMainWindow, Ui_MainWindow):
 
         def set_idle():
             """Set application status to idle."""
+            self.save_checkpoint(final=True)
+            canceled = self.aggregate is not None and self.aggregate.urlqueue.shutdown
+            self.check_complete = not canceled
+            if self.writedatabase:
+                self.dbwriter.finish(complete=self.check_complete)
             self.status = Status.idle
-            self.set_statusmsg(_("Check finished."))
+            if self.streamresults:
+                msg = _("Check finished, results written to %s.")
+                self.set_statusmsg(msg % self.streamresults[0])
+            else:
+                self.set_statusmsg(_("Check finished."))
             self.controlButton.clicked.disconnect(self.checker.cancel)
+            self.threadbudget.release(self.checkthreads)
+            self.checkthreads = 0
+            self.sessionsdock.start_waiting()
+            self.finish_job(canceled)
 
         self.checker.finished.connect(set_idle)
-        self.log_url_signal.connect(self.model.log_url)
+        self.checker.warning.connect(self.set_statusmsg)
+        self.log_url_signal.connect(self.model.log_urls)
+        self.log_url_signal.connect(self.write_database)
         self.log_stats_signal.connect(self.log_stats)
         self.error_signal.connect(self.internal_error)
         self.options.editor.saved.connect(self.read_config)
-        self.log_status_signal.connect(self.log_status)
+        self.status_timer.timeout.connect(self.update_status)
         self.prop_url.linkHovered.connect(self.hover_link)
         self.prop_parenturl.linkHovered.connect(self.hover_link)
 
@@ -212,15 +267,152 @@ class LinkCheckerMain(QtWidgets.QMainWindow, Ui_MainWindow):
 
     def init_treeview(self):
         """Set treeview model and layout."""
-        self.model = UrlItemModel()
-        self.treeView.setModel(self.model)
+        self.model = UrlItemModel(parent=self)
+        self.proxy = UrlFilterProxyModel(parent=self)
+        self.proxy.setSourceModel(self.model)
+        self.tree = UrlTreeModel(self.model, parent=self)
+        self.treeView.setModel(self.proxy)
         data = self.settings.read_treeviewcols()
         self.treeView.setColumnWidth(0, data["col1"])
         self.treeView.setColumnWidth(1, data["col2"])
         self.treeView.setColumnWidth(2, data["col3"])
+        # results stay sorted while they are added during checks
+        self.treeView.sortByColumn(0, QtCore.Qt.SortOrder.AscendingOrder)
+        self.treeView.setSortingEnabled(True)
         selectionModel = self.treeView.selectionModel()
         selectionModel.selectionChanged.connect(self.set_properties)
 
+    def init_docks(self):
+        """Add the hidden dashboard, host statistics, changes, job and
+        session docks."""
+        self.checkstats = CheckStats()
+        self.dashboard = Dashboard(self.checkstats, parent=self)
+        self.hostsdock = HostStatsDock(self.checkstats, parent=self)
+        self.hostsdock.host_activated.connect(self.filterhost.setText)
+        self.diffdock = DiffDock(parent=self)
+        self.jobsdock = JobDock(self.urlinput, parent=self)
+        self.jobsdock.run_jobs.connect(self.start_next_job)
+        self.jobsdock.cancel_job.connect(self.cancel_job)
+        # job being checked
+        self.job = None
+        # checker threads of all checks, and request times of all hosts so
+        # concurrent checks do not overload a host
+        self.threadbudget = ThreadBudget()
+        self.checkthreads = 0
+        self.hosttimes = {}
+        self.sessionsdock = SessionDock(self.threadbudget, self.hosttimes, parent=self)
+        self.sessionsdock.new_session.connect(self.new_session)
+        docks = (self.dashboard, self.hostsdock, self.diffdock, self.jobsdock,
+                 self.sessionsdock)
+        for dock in docks:
+            self.addDockWidget(QtCore.Qt.DockWidgetArea.RightDockWidgetArea, dock)
+            dock.hide()
+        for first, second in zip(docks, docks[1:]):
+            self.tabifyDockWidget(first, second)
+
+    def init_checkpoint(self):
+        """Save running checks periodically so they can be resumed."""
+        self.checkpoint = Checkpoint(get_checkpoint_filename())
+        self.checkpointing = False
+        # checked URLs for incremental checks
+        self.checkhistory = CheckHistory()
+        self.checkpoint_timer = QtCore.QTimer(self)
+        self.checkpoint_timer.setInterval(CheckpointInterval * 1000)
+        self.checkpoint_timer.timeout.connect(self.save_checkpoint)
+        self.update_resume_action()
+
+    def update_resume_action(self):
+        """Enable the resume action if an unfinished check was saved."""
+        try:
+            resumable = self.checkpoint.is_resumable()
+        except (OSError, sqlite3.Error):
+            resumable = False
+        self.actionResume.setEnabled(resumable)
+
+    def init_database(self):
+        """Initialize writing results to and showing results from a
+        results database."""
+        self.dbwriter = ResultWriter(parent=self)
+        self.dbwriter.error.connect(self.database_error)
+        self.dbwriter.finished.connect(self.database_written)
+        # filename of the database written while checking
+        self.writedatabase = None
+        # SqlResultModel shown instead of the check results
+        self.dbmodel = None
+
+    def init_urllist(self):
+        """Initialize reading URL list files while checking."""
+        self.urllistreader = UrlListReader(parent=self)
+        self.urllistreader.progress.connect(self.urllist_progress)
+        self.urllistreader.error.connect(self.urllist_error)
+
+    def set_tree_model(self, model):
+        """Show given model in the result tree, keeping column widths."""
+        widths = [self.treeView.columnWidth(i) for i in range(self.model.columnCount())]
+        self.treeView.setModel(model)
+        for i, width in enumerate(widths):
+            self.treeView.setColumnWidth(i, width)
+        selectionModel = self.treeView.selectionModel()
+        selectionModel.selectionChanged.connect(self.set_properties)
+        clear_properties(self)
+
+    def on_actionGroupByParent_toggled(self, checked):
+        """Switch between the result list and the results grouped by
+        parent URL."""
+        self.set_tree_model(self.tree if checked else self.proxy)
+        self.treeView.setRootIsDecorated(checked)
+        # the grouped results are ordered by line and column
+        self.treeView.setSortingEnabled(not checked)
+        for widget in (self.filtertext, self.filterstatus, self.filterhost,
+                       self.filtertype):
+            widget.setEnabled(not checked)
+
+    def init_filter(self):
+        """Fill the status filter and filter results on each change."""
+        for name, status in FilterStatus:
+            self.filterstatus.addItem(name)
+        self.filtertext.textChanged.connect(self.set_filter)
+        self.filterstatus.currentIndexChanged.connect(self.set_filter)
+        self.filterhost.textChanged.connect(self.set_filter)
+        self.filtertype.textChanged.connect(self.set_filter)
+
+    def set_filter(self):
+        """Show only results matching the filter bar settings."""
+        status = FilterStatus[max(self.filterstatus.currentIndex(), 0)][1]
+        model = self.proxy if self.dbmodel is None else self.dbmodel
+        model.set_filter(
+            text=self.filtertext.text(),
+            status=status,
+            host=self.filterhost.text(),
+            content_type=self.filtertype.text(),
+        )
+        if model.is_active():
+            shown = model.rowCount()
+            if self.dbmodel is None:
+                total = self.model.rowCount()
+            else:
+                total = self.dbmodel.total
+            self.set_statusmsg(_("%d of %d URLs shown.") % (shown, total))
+        else:
+            self.set_statusmsg(_("Ready."))
+
+    def init_saver(self):
+        """Initialize background saving of results with a progress bar
+        and cancel button in the status bar."""
+        self.saver = UrlSaveThread(parent=self)
+        self.save_progress = QtWidgets.QProgressBar()
+        self.save_progress.setMaximumWidth(200)
+        self.save_progress.hide()
+        self.save_cancel = QtWidgets.QToolButton()
+        self.save_cancel.setIcon(get_icon(":/icons/cancel.png"))
+        self.save_cancel.setToolTip(_("Cancel saving results"))
+        self.save_cancel.hide()
+        self.statusBar.addPermanentWidget(self.save_progress)
+        self.statusBar.addPermanentWidget(self.save_cancel)
+        self.save_cancel.clicked.connect(self.saver.cancel)
+        self.saver.progress.connect(self.save_progressed)
+        self.saver.finished.connect(self.save_finished)
+
     def get_treeviewcols(self):
         """Return URL treeview column widths."""
         return dict(
@@ -232,8 +424,8 @@ class LinkCheckerMain(QtWidgets.QMainWindow, Ui_MainWindow):
     def init_config(self):
         """Create a configuration object."""
         self.config = linkchecker_configuration.Configuration()
-        status = StatusLogger(self.log_status_signal)
-        self.config.set_status_logger(status)
+        self.statuslogger = StatusLogger()
+        self.config.set_status_logger(self.statuslogger)
         # dictionary holding overwritten values
         self.config_backup = {}
         # set standard GUI configuration values
@@ -242,9 +434,10 @@ class LinkCheckerMain(QtWidgets.QMainWindow, Ui_MainWindow):
             SignalLogger.LoggerName,
             signal=self.log_url_signal,
             stats=self.log_stats_signal,
+            checkstats=self.checkstats,
+            history=self.checkhistory,
         )
         self.config["status"] = True
-        self.config["status_wait_seconds"] = 2
 
     def read_config(self, filename=None):
         """Read user and system configuration file."""
@@ -258,6 +451,9 @@ class LinkCheckerMain(QtWidgets.QMainWindow, Ui_MainWindow):
         data = self.options.get_options()
         self.config["recursionlevel"] = data["recursionlevel"]
         self.config["verbose"] = data["verbose"]
+        self.config["logger"].batchsize = data["batchsize"]
+        self.config["logger"].batchinterval = data["batchinterval"] / 1000
+        self.config["status_wait_seconds"] = data["statusinterval"]
         if data["debug"]:
             logconf.set_debug(["all"])
             # make sure at least one thread is used
@@ -282,6 +478,12 @@ class LinkCheckerMain(QtWidgets.QMainWindow, Ui_MainWindow):
                 except re.error as err:
                     msg = _("Invalid regular expression %r: %s") % (pat, err)
                     self.set_statusmsg(msg)
+        # write results to a file while checking
+        if self.streamresults:
+            filename, logtype = self.streamresults
+            self.backup_config("fileoutput")
+            logger = get_logger(self.config, filename, logtype)
+            self.config["fileoutput"].append(logger)
         # make sure the configuration is sane
         self.config.sanitize()
 
@@ -319,20 +521,21 @@ class LinkCheckerMain(QtWidgets.QMainWindow, Ui_MainWindow):
             self.controlButton.setEnabled(True)
             self.actionSave.setEnabled(True)
             self.actionDebug.setEnabled(self.options.get_options()["debug"])
-            self.treeView.sortByColumn(0, QtCore.Qt.SortOrder.AscendingOrder)
-            self.treeView.setSortingEnabled(True)
-            self.treeView.scrollToTop()
             self.movie.stop()
+            self.status_timer.stop()
+            self.checkpoint_timer.stop()
+            self.statuslogger.get_status()
             # Reset progress information.
             self.label_active.setText("0")
             self.label_queued.setText("0")
             self.label_checked.setText("0")
+            self.label_rate.setText("-")
+            self.label_eta.setText("-")
             self.label_busy.hide()
             self.menubar.setEnabled(True)
             self.urlinput.setEnabled(True)
             self.restore_config()
         elif status == Status.checking:
-            self.treeView.setSortingEnabled(False)
             self.debug.reset()
             self.set_statusmsg(_("Checking site..."))
             # disable commands
@@ -344,6 +547,9 @@ class LinkCheckerMain(QtWidgets.QMainWindow, Ui_MainWindow):
             self.controlButton.clicked.connect(self.checker.cancel)
             self.movie.start()
             self.label_busy.show()
+            self.status_timer.start()
+            self.checkpoint_timer.start()
+            self.actionResume.setEnabled(False)
 
     status = property(get_status, set_status)
 
@@ -376,6 +582,16 @@ class LinkCheckerMain(QtWidgets.QMainWindow, Ui_MainWindow):
             if e is not None:
                 e.ignore()
         else:
+            self.sessionsdock.cancel_all()
+            self.sessionsdock.wait()
+            if self.saver.isRunning():
+                self.saver.cancel()
+                self.saver.wait()
+            self.urllistreader.wait()
+            # write the remaining results to the results database
+            self.dbwriter.wait()
+            self.close_database()
+            self.contentcache.clear()
             self.settings.save_geometry(dict(size=self.size(), pos=self.pos()))
             self.settings.save_treeviewcols(self.get_treeviewcols())
             self.settings.save_options(self.options.get_options())
@@ -438,10 +654,58 @@ and licensed under the GNU LGPL version 3 or later.
 
     @QtCore.pyqtSlot()
     def on_actionSave_triggered(self):
-        """Save URL results."""
-        saveresultas = urlsave(self, self.config, self.model.urls)
-        if saveresultas:
-            self.saveresultas = saveresultas
+        """Save URL results, or the results of an opened results database,
+        in a background thread."""
+        if self.saver.isRunning():
+            self.set_statusmsg(_("Results are already being saved."))
+            return
+        filename, logtype = get_save_filename(self)
+        if not filename:
+            # user canceled
+            return
+        self.saveresultas = logtype
+        logger = get_logger(self.config, filename, logtype)
+        if self.dbmodel is None:
+            url_datas = self.model.get_url_datas()
+            stats = self.config['logger'].stats
+        else:
+            # the statistics of the last check do not belong to the
+            # results database
+            url_datas = self.dbmodel.db.get_results()
+            stats = None
+        self.save_progress.setRange(0, max(1, len(url_datas)))
+        self.save_progress.setValue(0)
+        self.save_progress.show()
+        self.save_cancel.show()
+        self.set_statusmsg(_("Saving results to %s...") % filename)
+        self.saver.save(logger, url_datas, stats, filename)
+
+    def save_progressed(self, done, total):
+        """Update progress bar of background saving."""
+        self.save_progress.setValue(done)
+
+    def save_finished(self):
+        """Hide progress bar and report result of background saving."""
+        self.save_progress.hide()
+        self.save_cancel.hide()
+        if self.saver.saved:
+            msg = _("Results saved to %s.")
+        else:
+            msg = _("Saving results to %s canceled.")
+        self.set_statusmsg(msg % self.saver.filename)
+
+    @QtCore.pyqtSlot(bool)
+    def on_actionStreamResults_toggled(self, checked):
+        """Select or reset the file results are written to while checking."""
+        self.streamresults = None
+        if checked:
+            filename, logtype = get_save_filename(self)
+            if filename:
+                self.streamresults = (filename, logtype)
+                self.saveresultas = logtype
+            else:
+                # user canceled
+                self.actionStreamResults.setChecked(False)
 
     def start(self):
         """Start a new check."""
@@ -466,9 +730,52 @@ and licensed under the GNU LGPL version 3 or later.
         else:
             raise ValueError("Invalid application status %r" % self.status)
 
-    def get_url(self):
-        """Return URL to check from the urlinput widget."""
-        url = strformat.stripurl(self.urlinput.text())
+    def start_next_job(self):
+        """Check the next queued job unless a check is running."""
+        if self.status != Status.idle:
+            return
+        jobmodel = self.jobsdock.jobmodel
+        job = jobmodel.next_job()
+        if job is None:
+            return
+        if job.project:
+            self.set_statusmsg(loadproject(self, job.project))
+        else:
+            self.urlinput.setText(job.url)
+        self.job = job
+        job.set_running()
+        jobmodel.update_job(job)
+        self.check()
+        if self.status == Status.idle:
+            # the check did not start, e.g. for an empty URL
+            self.job = None
+            job.set_done(JobStatus.failed)
+            jobmodel.update_job(job)
+            QtCore.QTimer.singleShot(0, self.start_next_job)
+
+    def finish_job(self, canceled):
+        """Note that the check of the running job ended and check the next
+        job unless the check was canceled."""
+        job, self.job = self.job, None
+        if job is None:
+            return
+        job.set_done(JobStatus.canceled if canceled else JobStatus.finished)
+        self.jobsdock.jobmodel.update_job(job)
+        if not canceled:
+            QtCore.QTimer.singleShot(0, self.start_next_job)
+
+    def cancel_job(self):
+        """Cancel the check of the running job."""
+        if self.job is not None and self.status == Status.checking:
+            self.cancel()
+            self.checker.cancel()
+
+    def get_url(self, text=None):
+        """Return URL to check from given text, by default the text of the
+        urlinput widget."""
+        if text is None:
+            text = self.urlinput.text()
+        url = strformat.stripurl(text)
         url = linkchecker_checker.guess_url(url)
         if url and ":" not in url:
             # Look for local file, else assume it's an HTTP URL.
@@ -476,13 +783,21 @@ and licensed under the GNU LGPL version 3 or later.
                 url = "http://%s" % url
         return url
 
-    def check(self):
-        """Check given URL."""
+    @QtCore.pyqtSlot()
+    def on_actionRecheck_triggered(self):
+        """Start an incremental check."""
+        if self.status == Status.idle:
+            self.check(incremental=True)
+
+    def check(self, incremental=False):
+        """Check given URL. An incremental check does not check the URLs
+        which the last finished check of the same URL found unchanged, see
+        skip_unchanged()."""
         self.model.clear()
         clear_properties(self)
         clear_statistics(self)
         self.set_config()
-        aggregate = director.get_aggregate(self.config)
+        aggregate = self.get_aggregate()
         url = self.get_url()
         if not url:
             self.set_statusmsg(_("Error, empty URL"))
@@ -491,23 +806,311 @@ and licensed under the GNU LGPL version 3 or later.
         url_data = linkchecker_checker.get_url_from(url, 0, aggregate, extern=(0, 0))
         self.recent.add_document(url)
 
-        # if a local file with .lst extension, assume it is a list of URLs
-        if (url.startswith("file://") or os.path.exists(url)) and url.endswith(".lst"):
-            url_data.check_connection()
-            parse_text(url_data)
-
+        history = []
+        if incremental:
+            history = self.skip_unchanged(aggregate, url, url_data)
         aggregate.urlqueue.put(url_data)
+        # if a local file with .lst extension, assume it is a list of URLs
+        if is_url_list(url) and url_data.scheme == "file":
+            self.urllistreader.read(url_data)
+        self.checkpointing = self.run_checkpoint(
+            self.checkpoint.start, url, history)
+        self.start_check(aggregate)
+
+    def urllist_progress(self, urls, done, total):
+        """Show progress of reading a URL list file."""
+        percent = 100 * done / total if total else 100
+        self.set_statusmsg(_n("Read %(urls)d URL from list (%(percent)d%%).",
+                              "Read %(urls)d URLs from list (%(percent)d%%).", urls)
+                           % dict(urls=urls, percent=percent))
+
+    def urllist_error(self, msg):
+        """Show error reading a URL list file."""
+        self.set_statusmsg(_("Could not read URL list: %s") % msg)
+
+    def skip_unchanged(self, aggregate, url, url_data):
+        """Add the URLs of the last finished check of given URL found
+        unchanged by get_unchanged() to the result cache of given
+        aggregate, so they are not checked again. The given start URL data
+        is always checked. Their saved results are shown again. Return the
+        history entries of the skipped URLs, which keep their check
+        time."""
+        try:
+            previous = self.checkpoint.load_history(url)
+        except (OSError, sqlite3.Error) as msg:
+            self.set_statusmsg(_("Could not load previous check: %s") % msg)
+            return []
+        if previous is None:
+            self.set_statusmsg(_("No finished check of '%s' found, checking all URLs.")
+                               % strformat.limit(url, 40))
+            return []
+        results, entries = previous
+        unchanged = get_unchanged(entries)
+        unchanged.discard(url_data.cache_url)
+        add_cached_results(aggregate.result_cache,
+                           ((cache_url, None) for cache_url in unchanged))
+        self.model.log_urls([result for result in results
+                             if result.cache_url in unchanged])
+        self.set_statusmsg(_n("Checking '%(url)s', skipping %(num)d unchanged URL.",
+                              "Checking '%(url)s', skipping %(num)d unchanged URLs.",
+                              len(unchanged))
+                           % dict(url=strformat.limit(url, 40), num=len(unchanged)))
+        return [entry for entry in entries if entry.cache_url in unchanged]
+
+    def get_aggregate(self):
+        """Return a new aggregate whose URL queue can be saved in
+        checkpoints. Hosts are throttled together with the check
+        sessions."""
+        aggregate = director.get_aggregate(self.config)
+        aggregate.urlqueue = CheckpointUrlQueue(
+            max_allowed_urls=self.config["maxnumurls"])
+        aggregate.times = self.hosttimes
+        return aggregate
+
+    def get_session_config(self):
+        """Return a copy of the configuration with the current options for
+        a check session, without the changes of a running check."""
+        config = copy.copy(self.config)
+        for key, value in config.items():
+            if isinstance(value, list):
+                config[key] = value[:]
+        for key, value in self.config_backup.items():
+            config[key] = value[:] if isinstance(value, list) else value
+        config.set_status_logger(None)
+        saved = self.config, self.config_backup
+        self.config, self.config_backup = config, {}
+        try:
+            self.set_config()
+        finally:
+            self.config, self.config_backup = saved
+        return config
+
+    def new_session(self, text):
+        """Check URL of given text in a new session tab."""
+        url = self.get_url(text)
+        if not url:
+            self.set_statusmsg(_("Error, empty URL"))
+            return
+        self.sessionsdock.add_session(url, self.get_session_config())
+
+    def start_check(self, aggregate):
+        """Check the queued URLs of given aggregate in background, in a
+        separate process if the option is set and no URL list is being
+        read into the queue. Parsed pages are cached for viewing sources
+        unless the check runs in a separate process. The check gets its
+        configured threads even if check sessions use up the thread
+        budget. The progress labels are updated at the status interval of
+        the options."""
+        self.checkthreads = self.threadbudget.acquire(
+            self.config["threads"], force=True)
+        self.close_database()
+        self.check_complete = False
+        if self.writedatabase:
+            self.dbwriter.wait()
+            self.dbwriter.write(self.writedatabase, self.urlinput.text(),
+                                self.model.store.url_data)
         self.aggregate = aggregate
-        # check in background
-        self.checker.check(self.aggregate)
+        options = self.options.get_options()
+        # the labels show the status logged at the same interval
+        self.status_timer.setInterval(options["statusinterval"] * 1000)
+        process = options["checkprocess"] and not self.urllistreader.isRunning()
+        if not self.checkpointing:
+            aggregate.urlqueue.stop_tracking()
+        self.contentcache.clear()
+        if options["contentcache"] and not process:
+            add_plugin(aggregate, self.contentcache)
+        self.checker.check(self.aggregate, process=process)
         self.status = Status.checking
 
+    @QtCore.pyqtSlot()
+    def on_actionResume_triggered(self):
+        """Load the results of the last unfinished check and check its
+        unchecked URLs."""
+        if self.status != Status.idle:
+            return
+        try:
+            url, results, queue = self.checkpoint.load()
+        except (OSError, sqlite3.Error) as msg:
+            self.set_statusmsg(_("Could not resume check: %s") % msg)
+            return
+        self.model.clear()
+        clear_properties(self)
+        clear_statistics(self)
+        self.set_config()
+        aggregate = self.get_aggregate()
+        self.urlinput.setText(url or "")
+        # add all results at once like a large batch of checked URLs
+        self.model.log_urls(results)
+        add_cached_results(aggregate.result_cache,
+                           ((url_data.cache_url, url_data) for url_data in results))
+        for data in queue:
+            aggregate.urlqueue.put(get_queued_url(data, aggregate))
+        self.set_statusmsg(_n("Resuming check with %d unchecked URL.",
+                              "Resuming check with %d unchecked URLs.",
+                              len(queue)) % len(queue))
+        self.checkpointing = True
+        self.start_check(aggregate)
+
+    def write_database(self, url_datas):
+        """Write checked URL data to the results database while checking."""
+        if self.writedatabase and self.status == Status.checking:
+            self.dbwriter.add(url_datas)
+
+    @QtCore.pyqtSlot(bool)
+    def on_actionWriteDatabase_toggled(self, checked):
+        """Select or reset the results database written while checking."""
+        self.writedatabase = None
+        if checked:
+            filename = get_database_filename(
+                self, _("Write results to database while checking"), save=True)
+            if filename:
+                self.writedatabase = filename
+            else:
+                # user canceled
+                self.actionWriteDatabase.setChecked(False)
+
+    @QtCore.pyqtSlot()
+    def on_actionSaveDatabase_triggered(self):
+        """Save the check results in a results database."""
+        filename = get_database_filename(
+            self, _("Save results database"), save=True)
+        if not filename:
+            return
+        self.dbwriter.wait()
+        self.dbwriter.write(filename, self.urlinput.text(),
+                            self.model.store.url_data)
+        self.dbwriter.finish(complete=self.check_complete)
+
+    @QtCore.pyqtSlot()
+    def on_actionOpenDatabase_triggered(self):
+        """Show the results of a results database instead of the check
+        results. Starting a check shows the check results again."""
+        filename = get_database_filename(self, _("Open results database"))
+        if not filename:
+            return
+        try:
+            dbmodel = SqlResultModel(filename, parent=self)
+        except (OSError, sqlite3.Error) as msg:
+            self.set_statusmsg(_("Could not open results database: %s") % msg)
+            return
+        self.close_database()
+        self.dbmodel = dbmodel
+        self.actionGroupByParent.setChecked(False)
+        self.actionGroupByParent.setEnabled(False)
+        self.set_tree_model(self.dbmodel)
+        self.urlinput.setText(self.dbmodel.url or "")
+        clear_statistics(self)
+        self.set_filter()
+        msg = _n("%(num)d result loaded from %(filename)s.",
+                 "%(num)d results loaded from %(filename)s.", self.dbmodel.total)
+        self.set_statusmsg(msg % dict(num=self.dbmodel.total, filename=filename))
+
+    @QtCore.pyqtSlot()
+    def on_actionCompareDatabase_triggered(self):
+        """Compare the shown results with the results of a results
+        database."""
+        filename = get_database_filename(self, _("Compare with results database"))
+        if not filename:
+            return
+        QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.CursorShape.WaitCursor)
+        try:
+            diffs = self.compare_database(filename)
+        except (OSError, sqlite3.Error) as msg:
+            self.set_statusmsg(_("Could not compare results: %s") % msg)
+            return
+        finally:
+            QtWidgets.QApplication.restoreOverrideCursor()
+        self.diffdock.set_diffs(diffs, filename)
+        self.diffdock.show()
+        self.diffdock.raise_()
+        counts = count_categories(diffs)
+        self.set_statusmsg(
+            _("Compared with %(filename)s: %(new)d new errors, %(fixed)d fixed,"
+              " %(unchecked)d not rechecked.")
+            % dict(filename=filename, new=counts[DiffNew], fixed=counts[DiffFixed],
+                   unchecked=counts[DiffNotRechecked]))
+
+    def compare_database(self, filename):
+        """Return list of Diff objects comparing the results of given
+        results database with the shown results."""
+        olddb = ResultDB(filename)
+        try:
+            if self.dbmodel is None:
+                entries = get_entries(self.model.store.url_data)
+                complete = self.check_complete
+            else:
+                entries = get_db_entries(self.dbmodel.db)
+                complete = self.dbmodel.complete
+            return compare(get_db_entries(olddb), entries, complete=complete)
+        finally:
+            olddb.close()
+
+    def close_database(self):
+        """Show the check results instead of the results database."""
+        if self.dbmodel is None:
+            return
+        self.set_tree_model(self.proxy)
+        self.actionGroupByParent.setEnabled(True)
+        self.dbmodel.close()
+        self.dbmodel = None
+        self.set_filter()
+
+    def database_error(self, msg):
+        """Show error writing the results database."""
+        self.set_statusmsg(_("Could not write results database: %s") % msg)
+
+    def database_written(self):
+        """Show that the results database has been written."""
+        if not self.dbwriter.failed and self.status == Status.idle:
+            self.set_statusmsg(_("Results written to %s.") % self.dbwriter.filename)
+
+    def save_checkpoint(self, final=False):
+        """Save results and unchecked URLs of the running check. The last
+        checkpoint of a check that was not canceled marks it as finished."""
+        if self.aggregate is None or not self.checkpointing:
+            return
+        urlqueue = self.aggregate.urlqueue
+        checkprocess = self.checker.checkprocess
+        if checkprocess is None:
+            self.checkpointing = self.run_checkpoint(
+                self.checkpoint.save, self.model.store, urlqueue, self.checkhistory)
+        else:
+            # the check process empties its own queue, not the one of the
+            # aggregate
+            queue_rows, logged = checkprocess.get_snapshot()
+            if queue_rows is None:
+                # the check process did not start yet
+                return
+            if final and not urlqueue.shutdown:
+                logged = ()
+            self.checkpointing = self.run_checkpoint(
+                self.checkpoint.save_rows, self.model.store, queue_rows, logged,
+                self.checkhistory)
+        if not self.checkpointing:
+            urlqueue.stop_tracking()
+        if final:
+            if self.checkpointing and not urlqueue.shutdown:
+                self.run_checkpoint(self.checkpoint.finish)
+            self.update_resume_action()
+
+    def run_checkpoint(self, func, *args):
+        """Call checkpoint function with given arguments and return True,
+        or False after showing the error if saving failed."""
+        try:
+            func(*args)
+            return True
+        except (OSError, sqlite3.Error) as msg:
+            self.set_statusmsg(_("Could not save checkpoint: %s") % msg)
+            return False
+
     def set_properties(self, selected, deselected):
-        """Set URL properties for selected item."""
+        """Set URL properties for selected item and cancel downloading the
+        source of the previously selected item."""
+        self.cancel_view_source()
         indexes = selected.indexes()
         if len(indexes):
             index = indexes[0]
-            urlitem = self.model.getUrlItem(index)
+            urlitem = self.treeView.model().getUrlItem(index)
             if urlitem is not None:
                 set_properties(self, urlitem.url_data)
         selected_rows = len(self.treeView.selectionModel().selectedRows())
@@ -521,7 +1124,7 @@ and licensed under the GNU LGPL version 3 or later.
 
     def on_treeView_customContextMenuRequested(self, point):
         """Show item context menu."""
-        urlitem = self.model.getUrlItem(self.treeView.currentIndex())
+        urlitem = self.treeView.model().getUrlItem(self.treeView.currentIndex())
         if urlitem is not None:
             self.contextmenu.enableFromItem(urlitem)
             self.contextmenu.popup(QtGui.QCursor.pos())
@@ -529,21 +1132,21 @@ and licensed under the GNU LGPL version 3 or later.
     @QtCore.pyqtSlot()
     def on_actionViewOnline_triggered(self):
         """View item URL online."""
-        urlitem = self.model.getUrlItem(self.treeView.currentIndex())
+        urlitem = self.treeView.model().getUrlItem(self.treeView.currentIndex())
         if urlitem is not None:
             webbrowser.open(urlitem.url_data.url)
 
     @QtCore.pyqtSlot()
     def on_actionViewParentOnline_triggered(self):
         """View item parent URL online."""
-        urlitem = self.model.getUrlItem(self.treeView.currentIndex())
+        urlitem = self.treeView.model().getUrlItem(self.treeView.currentIndex())
         if urlitem is not None:
             webbrowser.open(urlitem.url_data.parent_url)
 
     @QtCore.pyqtSlot()
     def on_actionViewParentSource_triggered(self):
         """View item parent URL source in local text editor (read-only)."""
-        urlitem = self.model.getUrlItem(self.treeView.currentIndex())
+        urlitem = self.treeView.model().getUrlItem(self.treeView.currentIndex())
         if urlitem is not None:
             self.view_source(
                 urlitem.url_data.parent_url,
@@ -552,12 +1155,45 @@ and licensed under the GNU LGPL version 3 or later.
             )
 
     def view_source(self, url, line, col):
-        """View URL source in editor window."""
-        self.editor.setWindowTitle("View %s" % url)
+        """View URL source in editor window. Pages parsed by the last check
+        are shown from the content cache, local files are read from disk
+        and other pages are shown while they are downloaded in background.
+        A previous download is canceled."""
+        self.cancel_view_source()
         self.editor.setUrl(url)
-        data, info = urlutil.get_content(url)
+        cached = self.contentcache.get(url)
+        filename = get_local_filename(url)
+        if cached is not None:
+            text, content_type = cached
+            self.editor.setText(text, line=line, col=col)
+            self.editor.finishLoading(url, content_type)
+        elif filename is not None and os.path.isfile(filename):
+            try:
+                self.editor.setParts(read_file(filename), line=line, col=col)
+            except OSError as msg:
+                self.show_source(url, None, str(msg))
+            else:
+                self.editor.finishLoading(url, mimeutil.guess_mimetype(filename))
+        else:
+            self.view_url_source(url, line, col)
+        self.editor.show()
+
+    def view_url_source(self, url, line, col):
+        """Download URL source in background and show it in the editor
+        window while it arrives."""
+        self.editor.setLoading(url, line=line, col=col)
+        self.sourcefetch = SourceFetch(url, timeout=self.config["timeout"])
+        self.sourcefetch.received.connect(self.editor.appendText)
+        self.sourcefetch.done.connect(
+            functools.partial(self.show_source, url))
+        self.sourcefetch.start()
+
+    def show_source(self, url, data, info):
+        """Show downloaded URL source or error message in editor window."""
+        self.sourcefetch = None
         if data is None:
             msg = _("An error occurred retreiving URL `%s': %s.") % (url, info)
+            self.editor.setWindowTitle(_("View %s") % url)
             self.editor.setText(msg)
         else:
             content_type = httputil.get_content_type(info)
@@ -565,14 +1201,20 @@ and licensed under the GNU LGPL version 3 or later.
                 # read function for content type guessing
                 def read(): return data
                 content_type = mimeutil.guess_mimetype(url, read=read)
-            self.editor.setContentType(content_type)
-            self.editor.setText(data, line=line, col=col)
-        self.editor.show()
+            self.editor.finishLoading(url, content_type)
+
+    def cancel_view_source(self):
+        """Cancel downloading a URL source."""
+        if self.sourcefetch is not None:
+            self.sourcefetch.received.disconnect()
+            self.sourcefetch.done.disconnect()
+            self.sourcefetch.cancel()
+            self.sourcefetch = None
 
     @QtCore.pyqtSlot()
     def on_actionCopyToClipboard_triggered(self):
         """Copy item URL to clipboard."""
-        urlitem = self.model.getUrlItem(self.treeView.currentIndex())
+        urlitem = self.treeView.model().getUrlItem(self.treeView.currentIndex())
         if urlitem:
             clipboard = QtWidgets.QApplication.clipboard()
             clipboard.setText(urlitem.url_data.url)
@@ -593,15 +1235,37 @@ and licensed under the GNU LGPL version 3 or later.
         """Show given link in status bar."""
         self.statusBar.showMessage(link)
 
+    def update_status(self):
+        """Show the latest status logged since the last update."""
+        status = self.statuslogger.get_status()
+        if status is not None:
+            self.log_status(*status)
+
     def log_status(self, checked, in_progress, queued, duration, num_urls):
-        """Update number of checked, active and queued links."""
+        """Update number of checked, active and queued links, the checked
+        links per second and the estimated remaining time."""
         self.label_checked.setText("%d" % checked)
         self.label_active.setText("%d" % in_progress)
         self.label_queued.setText("%d" % queued)
+        if self.job is not None:
+            self.job.set_progress(checked, in_progress + queued)
+            self.jobsdock.jobmodel.update_job(self.job)
+        rate, remaining = get_progress(checked, in_progress, queued, duration)
+        self.label_rate.setText("%.1f" % rate)
+        if remaining is None:
+            self.label_eta.setText("-")
+        else:
+            minutes, seconds = divmod(int(remaining), 60)
+            hours, minutes = divmod(minutes, 60)
+            self.label_eta.setText("%d:%02d:%02d" % (hours, minutes, seconds))
 
     def log_stats(self, statistics):
         """Set statistic information for selected URL."""
         set_statistics(self, statistics)
+        if self.job is not None:
+            self.job.checked = statistics.number
+            self.job.errors = statistics.errors
+            self.job.warnings = statistics.warnings
 
     def internal_error(self, msg):
         """Display internal error message. Triggered by sys.excepthook()."""
@@ -16,18 +16,28 @@
 from PyQt6 import QtCore
 from linkcheck import director
 
+from .checkprocess import CheckProcess
+
 
 class CheckerThread(QtCore.QThread):
     """Separate checker thread."""
 
+    # message about a crashed check process
+    warning = QtCore.pyqtSignal(str)
+
     def __init__(self, parent=None):
         """Reset check variables."""
         super().__init__(parent)
         self.aggregate = None
+        self.checkprocess = None
 
-    def check(self, aggregate):
-        """Set check variables and start the thread."""
+    def check(self, aggregate, process=False):
+        """Set check variables and start the thread. If process is True,
+        the URLs are checked in a separate process."""
         self.aggregate = aggregate
+        self.checkprocess = None
+        if process:
+            self.checkprocess = CheckProcess(aggregate, warn=self.warning.emit)
         # setup the thread and call run()
         self.start()
 
@@ -37,8 +47,13 @@ class CheckerThread(QtCore.QThread):
             aggregate = self.aggregate
             self.aggregate = None
             aggregate.cancel()
+            if self.checkprocess is not None:
+                self.checkprocess.cancel()
 
     def run(self):
         """Start checking."""
         assert self.aggregate.config["threads"] > 0
-        director.check_urls(self.aggregate)
+        if self.checkprocess is not None:
+            self.checkprocess.run()
+        else:
+            director.check_urls(self.aggregate)
@@ -0,0 +1,243 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+Checkpoints of running checks which can be resumed later.
+"""
+import os
+
+from linkcheck import checker as linkchecker_checker
+from linkcheck import configuration as linkchecker_configuration
+from linkcheck.cache.urlqueue import UrlQueue
+
+from .history import CheckedUrl
+from .resultdb import ResultDB
+
+# seconds between checkpoints of a running check
+CheckpointInterval = 30
+
+StatusUnfinished = "unfinished"
+StatusFinished = "finished"
+
+
+def get_checkpoint_filename():
+    """Return filename of the checkpoint database in the user data
+    directory."""
+    return os.path.join(
+        linkchecker_configuration.get_user_data(), "gui-checkpoint.sqlite")
+
+
+def add_cached_results(result_cache, results):
+    """Add given (cache key, result) pairs to given ResultCache. Its size
+    limit is raised by their number, so no pair is dropped because the
+    cache is full and the check keeps the configured room for its own
+    results."""
+    results = list(results)
+    result_cache.max_size += len(results)
+    for key, result in results:
+        result_cache.add_result(key, result)
+
+
+def get_queued_url(data, aggregate):
+    """Return URL data for given aggregate of given attribute dictionary
+    of an unchecked URL, see ResultDB.get_queue()."""
+    return linkchecker_checker.get_url_from(
+        data["base_url"],
+        data["recursion_level"],
+        aggregate,
+        parent_url=data["parent_url"],
+        base_ref=data["base_ref"],
+        line=data["line"],
+        column=data["column"],
+        page=data["page"],
+        name=data["name"],
+        extern=data["extern"],
+    )
+
+
+class CheckpointUrlQueue(UrlQueue):
+    """URL queue which can list all URLs not checked completely: the
+    queued URLs, the URLs being checked, the URLs checked since the last
+    snapshot whose results might not have been saved yet, and the URLs
+    removed from the queue when the check was canceled. Threads adding
+    URLs while checking keep the queue unfinished."""
+
+    def __init__(self, max_allowed_urls=None):
+        """Initialize an empty queue."""
+        super().__init__(max_allowed_urls=max_allowed_urls)
+        # URLs being checked by object id
+        self.active = {}
+        # URLs checked since the last snapshot
+        self.done = []
+        # URLs removed by do_shutdown()
+        self.canceled = []
+        # False when no more checkpoints are saved
+        self.tracking = True
+
+    def _get(self, timeout):
+        """Get next URL and remember it as being checked."""
+        url_data = super()._get(timeout)
+        if self.tracking:
+            self.active[id(url_data)] = url_data
+        return url_data
+
+    def task_done(self, url_data):
+        """Mark URL as checked."""
+        super().task_done(url_data)
+        with self.mutex:
+            if self.active.pop(id(url_data), None) is not None:
+                self.done.append(url_data)
+
+    def do_shutdown(self):
+        """Keep the queued URLs when the queue is shut down."""
+        with self.mutex:
+            if self.tracking:
+                self.canceled.extend(self.queue)
+        super().do_shutdown()
+
+    def add_producer(self):
+        """Keep the queue unfinished until remove_producer() is called, so
+        the check does not end while another thread adds URLs."""
+        with self.mutex:
+            self.unfinished_tasks += 1
+
+    def remove_producer(self):
+        """Note that a thread stopped adding URLs."""
+        with self.all_tasks_done:
+            self.unfinished_tasks -= 1
+            if self.unfinished_tasks <= 0:
+                self.all_tasks_done.notify_all()
+
+    def stop_tracking(self):
+        """Forget all URLs and stop remembering them, because no more
+        checkpoints are saved."""
+        with self.mutex:
+            self.tracking = False
+            self.active = {}
+            self.done = []
+            self.canceled = []
+
+    def snapshot(self):
+        """Return list of URLs not checked completely and forget the URLs
+        checked since the last snapshot."""
+        with self.mutex:
+            url_datas = self.canceled + list(self.queue)
+            url_datas.extend(self.active.values())
+            url_datas.extend(self.done)
+            self.done = []
+        return url_datas
+
+
+class Checkpoint:
+    """Checkpoint database of a running check. Each checkpoint appends the
+    results logged since the last checkpoint and replaces the stored
+    unchecked URLs."""
+
+    def __init__(self, filename):
+        """Store filename; the database is opened when needed."""
+        self.filename = filename
+        self.db = None
+        # number of saved results of the URL store
+        self.saved = 0
+
+    def open(self):
+        """Return the opened database."""
+        if self.db is None:
+            linkchecker_configuration.make_userdir(self.filename)
+            self.db = ResultDB(self.filename)
+        return self.db
+
+    def close(self):
+        """Close the database."""
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+
+    def is_resumable(self):
+        """Return True if an unfinished check has been saved."""
+        if self.db is None and not os.path.exists(self.filename):
+            return False
+        return self.open().get_meta("status") == StatusUnfinished
+
+    def start(self, url, history=()):
+        """Remove the previous checkpoint and start a new one for a check
+        of given URL. The given CheckedUrl entries of URLs that are not
+        checked again are kept for the next incremental check."""
+        db = self.open()
+        db.clear()
+        db.set_meta("url", url)
+        db.set_meta("status", StatusUnfinished)
+        db.add_history(history)
+        self.saved = 0
+
+    def save(self, store, urlqueue, history=None):
+        """Save the results added to given URL store since the last
+        checkpoint, the URLs of given CheckpointUrlQueue not checked
+        completely and the entries of given CheckHistory. The queue
+        snapshot is taken first, so each URL is either saved as result or
+        as unchecked URL."""
+        db = self.open()
+        db.set_queue(urlqueue.snapshot())
+        self.save_results(db, len(store), store, history)
+
+    def save_rows(self, store, queue_rows, logged=(), history=None):
+        """Save like save() the given queue database rows of the unchecked
+        URLs of a check process snapshot. The results at the end of the URL
+        store with given cache keys, logged after the snapshot, are saved
+        with the next checkpoint: a page is only saved as result once its
+        links are in a snapshot."""
+        db = self.open()
+        db.set_queue_rows(queue_rows)
+        logged = set(logged)
+        end = len(store)
+        while end > self.saved and store.url_data[end - 1].cache_url in logged:
+            end -= 1
+        self.save_results(db, end, store, history)
+
+    def save_results(self, db, end, store, history):
+        """Save the results of the URL store up to given end index and the
+        entries of given CheckHistory."""
+        db.add_results(store.url_data[self.saved:end])
+        self.saved = end
+        if history is not None:
+            db.add_history(history.take())
+
+    def finish(self):
+        """Mark the check as finished."""
+        db = self.open()
+        db.set_queue([])
+        db.set_meta("status", StatusFinished)
+
+    def load(self):
+        """Return start URL, list of saved results and list of attribute
+        dictionaries of the unchecked URLs without saved result."""
+        db = self.open()
+        results = db.get_results()
+        checked = {url_data.cache_url for url_data in results}
+        queue = [data for data in db.get_queue()
+                 if data["cache_url"] not in checked]
+        self.saved = len(results)
+        return db.get_meta("url"), results, queue
+
+    def load_history(self, url):
+        """Return list of saved results and list of CheckedUrl entries of
+        the last check if it was a finished check of given URL, else
+        None."""
+        if self.db is None and not os.path.exists(self.filename):
+            return None
+        db = self.open()
+        if db.get_meta("status") != StatusFinished or db.get_meta("url") != url:
+            return None
+        return db.get_results(), [CheckedUrl(*row) for row in db.get_history()]
@@ -0,0 +1,384 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+Check URLs in a separate process, so parsing pages and checking their
+content does not compete with the user interface for the interpreter lock,
+and a crashing check does not take down the user interface.
+
+The check process sends pickled messages through a pipe: the checked URLs
+in batches of attribute tuples, the status, and periodic snapshots of the
+unchecked URLs as the changes since the previous snapshot. The GUI process
+only logs and shows the URLs, and starts a new check process with the last
+snapshot if the process crashed.
+"""
+import multiprocessing
+import pickle
+import threading
+import time
+
+from linkcheck import configuration as linkchecker_configuration
+from linkcheck import director
+from linkcheck.checker.urlbase import CompactUrlData, urlDataAttr
+
+from .checkpoint import CheckpointUrlQueue, add_cached_results, get_queued_url
+from .logger import SignalLogger
+from .resultdb import from_queue_row, get_values, to_queue_row
+
+# configuration values of the GUI process which are not sent
+LocalConfigKeys = frozenset(("logger", "fileoutput"))
+# seconds between snapshots of the unchecked URLs
+SnapshotInterval = 10
+# maximum number of added queue rows and of removed cache keys in one
+# snapshot message
+SnapshotRows = 10000
+# number of times a crashed check process is started again
+MaxRestarts = 3
+# seconds between checks whether a canceled process has ended
+PollInterval = 0.5
+# seconds to wait for a terminated process before it is killed
+KillTimeout = 5
+
+
+def get_config_values(config):
+    """Return dictionary of the configuration values which can be sent to
+    the check process."""
+    values = {}
+    for key, value in config.items():
+        if key in LocalConfigKeys:
+            continue
+        try:
+            pickle.dumps(value)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            continue
+        values[key] = value
+    return values
+
+
+def get_url_data(values):
+    """Return CompactUrlData of given tuple of urlDataAttr values."""
+    return CompactUrlData(dict(zip(urlDataAttr, values)))
+
+
+class PipeSender:
+    """Send messages through a pipe from several threads."""
+
+    def __init__(self, conn):
+        """Send through given connection."""
+        self.conn = conn
+        self.lock = threading.Lock()
+
+    def send(self, kind, data):
+        """Send given kind of message with given data. Messages are lost if
+        the GUI process closed the pipe."""
+        with self.lock:
+            try:
+                self.conn.send((kind, data))
+            except OSError:
+                pass
+
+
+class PipeSignal:
+    """Signal replacement sending emitted data through a pipe."""
+
+    def __init__(self, sender, kind):
+        """Send emitted data with given PipeSender as given kind of
+        message."""
+        self.sender = sender
+        self.kind = kind
+
+    def emit(self, data):
+        """Send given data."""
+        self.sender.send(self.kind, data)
+
+
+class PipeLogger(SignalLogger):
+    """Send the attribute values of all checked URLs in batches, so the GUI
+    process can log them with its own loggers. Whether a URL is shown is
+    decided there."""
+
+    def log_filter_url(self, url_data, do_print):
+        """Buffer the attribute values of given URL data."""
+        self.log_url(get_values(url_data))
+
+    def end_output(self, **kwargs):
+        """Send the remaining URLs and the arguments of the end of the
+        log output."""
+        self.flush_urls()
+        self.log_stats_signal.emit(kwargs)
+
+
+class PipeStatusLogger:
+    """Send the check status through a pipe."""
+
+    def __init__(self, sender):
+        """Send with given PipeSender."""
+        self.sender = sender
+
+    def log_status(self, *status):
+        """Send given status information."""
+        self.sender.send("status", status)
+
+
+def wait_for_cancel(conn, aggregate):
+    """Cancel the check of given aggregate when a message arrives or the
+    GUI process closed the pipe."""
+    try:
+        conn.recv()
+    except (EOFError, OSError):
+        pass
+    aggregate.cancel()
+
+
+def send_snapshots(sender, urlqueue, done, queue_rows):
+    """Send the unchecked URLs of given CheckpointUrlQueue every
+    SnapshotInterval seconds until given event is set. Only the changes
+    since the previous snapshot, starting with given queue rows, are sent:
+    the cache keys of the removed URLs and the queue rows of the added
+    URLs, split into messages of at most SnapshotRows of each. The last
+    message of a snapshot is marked as final."""
+    sent = {row[0]: row for row in queue_rows}
+    while not done.wait(SnapshotInterval):
+        url_datas = {url_data.cache_url: url_data
+                     for url_data in urlqueue.snapshot()}
+        removed = [key for key in sent if key not in url_datas]
+        added = [to_queue_row(url_data) for key, url_data in url_datas.items()
+                 if key not in sent]
+        for key in removed:
+            del sent[key]
+        sent.update((row[0], row) for row in added)
+        parts = max(1, -(-max(len(removed), len(added)) // SnapshotRows))
+        for part in range(parts):
+            rows = slice(part * SnapshotRows, (part + 1) * SnapshotRows)
+            sender.send("queue", (removed[rows], added[rows], part == parts - 1))
+
+
+def check_in_process(conn, values, queue_rows, cached, batchsize, batchinterval):
+    """Check the URLs of given queue database rows with given configuration
+    values, sending the results through given connection. The URLs with
+    given cache keys are not checked."""
+    sender = PipeSender(conn)
+    config = linkchecker_configuration.Configuration()
+    config.update(values)
+    config.set_status_logger(PipeStatusLogger(sender))
+    config["fileoutput"] = []
+    config["logger"] = PipeLogger(
+        signal=PipeSignal(sender, "urls"),
+        stats=PipeSignal(sender, "end"),
+        batchsize=batchsize,
+        batchinterval=batchinterval,
+    )
+    aggregate = director.get_aggregate(config)
+    aggregate.urlqueue = CheckpointUrlQueue(max_allowed_urls=config["maxnumurls"])
+    add_cached_results(aggregate.result_cache, ((key, None) for key in cached))
+    for row in queue_rows:
+        aggregate.urlqueue.put(get_queued_url(from_queue_row(row), aggregate))
+    threading.Thread(target=wait_for_cancel, args=(conn, aggregate),
+                     daemon=True).start()
+    done = threading.Event()
+    threading.Thread(target=send_snapshots,
+                     args=(sender, aggregate.urlqueue, done, queue_rows),
+                     daemon=True).start()
+    try:
+        director.check_urls(aggregate)
+    finally:
+        done.set()
+        sender.send("done", None)
+
+
+class CheckProcess:
+    """Supervisor of a check of the queued URLs of an aggregate in a
+    separate process. The results are logged with the loggers of the
+    aggregate and the status with its status logger, as if the aggregate
+    had checked them.
+
+    A canceled process which does not end within the abort timeout of the
+    configuration is terminated. A crashed process is started again up to
+    MaxRestarts times with the unchecked URLs of its last snapshot; URLs
+    checked again after the snapshot are logged twice."""
+
+    def __init__(self, aggregate, warn=None):
+        """Check the queued URLs of given aggregate. Cached URLs are not
+        checked. Messages about crashed processes are passed to given
+        function."""
+        self.aggregate = aggregate
+        self.warn = warn
+        self.lock = threading.Lock()
+        self.conn = None
+        self.process = None
+        self.cancel_time = None
+        # cache keys of the URLs logged before the last snapshot
+        self.checked = set()
+        # cache keys of the URLs logged since the last snapshot in the order
+        # they were logged
+        self.logged = []
+        # queue rows by cache key of the unchecked URLs of the last
+        # snapshot, or of the start, or None before the check started
+        self.snapshot = None
+        # (removed keys, added rows) of the snapshot messages received
+        # before the final message of a snapshot
+        self.changes = []
+
+    def cancel(self):
+        """Stop the check process."""
+        with self.lock:
+            if self.cancel_time is None:
+                self.cancel_time = time.monotonic()
+            if self.conn is not None:
+                try:
+                    self.conn.send("cancel")
+                except OSError:
+                    pass
+
+    def run(self):
+        """Check in a process, started again after crashes, and log the
+        results until the check ended."""
+        aggregate = self.aggregate
+        url_datas = list(aggregate.urlqueue.queue)
+        queue_rows = [to_queue_row(url_data) for url_data in url_datas]
+        # the queue adds its URLs to the cache
+        queued = {url_data.cache_url for url_data in url_datas}
+        cached = [key for key in aggregate.result_cache.cache if key not in queued]
+        with self.lock:
+            self.snapshot = {row[0]: row for row in queue_rows}
+        aggregate.logger.start_log_output()
+        kwargs = {}
+        restarts = 0
+        restart_cached = cached
+        try:
+            while True:
+                ended, kwargs = self.run_process(queue_rows, restart_cached)
+                if ended or self.cancel_time is not None:
+                    break
+                if restarts >= MaxRestarts:
+                    self.warning(_("Check process crashed %d times, check stopped.")
+                                 % (restarts + 1))
+                    aggregate.cancel()
+                    break
+                restarts += 1
+                self.warning(_("Check process crashed, restarting it (%d of %d).")
+                             % (restarts, MaxRestarts))
+                with self.lock:
+                    queue_rows = list(self.snapshot.values())
+                    restart_cached = cached + [
+                        key for key in self.checked if key not in self.snapshot]
+        finally:
+            aggregate.logger.end_log_output(**kwargs)
+
+    def get_snapshot(self):
+        """Return the queue rows of the unchecked URLs of the last snapshot
+        and the list of cache keys of the URLs logged since then."""
+        with self.lock:
+            if self.snapshot is None:
+                return None, self.logged[:]
+            return list(self.snapshot.values()), self.logged[:]
+
+    def warning(self, msg):
+        """Pass given message to the warn function."""
+        if self.warn is not None:
+            self.warn(msg)
+
+    def run_process(self, queue_rows, cached):
+        """Check given queue rows without the URLs of given cache keys in a
+        new process. Return True and the end arguments of the log output if
+        the check ended, or False and an empty dictionary if the process
+        crashed or was terminated after the abort timeout."""
+        aggregate = self.aggregate
+        logger = aggregate.config["logger"]
+        # a fresh interpreter, since forking copies the Qt threads
+        context = multiprocessing.get_context("spawn")
+        conn, child_conn = context.Pipe()
+        process = context.Process(
+            target=check_in_process,
+            args=(child_conn, get_config_values(aggregate.config), queue_rows,
+                  cached, logger.batchsize, logger.batchinterval),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        with self.lock:
+            self.changes = []
+            self.conn = conn
+            self.process = process
+            if self.cancel_time is not None:
+                conn.send("cancel")
+        try:
+            return self.receive(conn)
+        finally:
+            with self.lock:
+                self.conn = None
+                conn.close()
+            self.stop_process(process)
+
+    def receive(self, conn):
+        """Log the messages of the check process. Return as run_process()."""
+        aggregate = self.aggregate
+        while True:
+            if not conn.poll(PollInterval):
+                if self.is_abort_timeout():
+                    return False, {}
+                continue
+            try:
+                kind, data = conn.recv()
+            except (EOFError, OSError):
+                return False, {}
+            if kind == "urls":
+                url_datas = [get_url_data(values) for values in data]
+                with self.lock:
+                    self.logged.extend(url_data.cache_url for url_data in url_datas)
+                for url_data in url_datas:
+                    aggregate.logger.log_url(url_data)
+            elif kind == "status":
+                if aggregate.config.status_logger is not None:
+                    aggregate.config.status_logger.log_status(*data)
+            elif kind == "queue":
+                removed, added, final = data
+                self.changes.append((removed, added))
+                if final:
+                    self.apply_changes()
+            elif kind == "end":
+                return True, data
+            elif kind == "done":
+                return True, {}
+
+    def apply_changes(self):
+        """Apply the received changes of a complete snapshot. The URLs
+        logged before it are in the snapshot or have been checked."""
+        with self.lock:
+            for removed, added in self.changes:
+                for key in removed:
+                    self.snapshot.pop(key, None)
+                self.snapshot.update((row[0], row) for row in added)
+            self.changes = []
+            self.checked.update(self.logged)
+            self.logged = []
+
+    def is_abort_timeout(self):
+        """Return True if the check was canceled longer than the abort
+        timeout ago."""
+        return (self.cancel_time is not None and time.monotonic() - self.cancel_time
+                > self.aggregate.config["aborttimeout"])
+
+    def stop_process(self, process):
+        """Wait for given process to end, terminating it after the abort
+        timeout of a canceled check."""
+        while process.is_alive() and not self.is_abort_timeout():
+            process.join(PollInterval)
+        if process.is_alive():
+            process.terminate()
+            process.join(KillTimeout)
+            if process.is_alive():
+                process.kill()
+                process.join()
@@ -0,0 +1,202 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+Live statistics of checked URLs.
+"""
+import collections
+import operator
+import threading
+import time
+
+from .library.sketch import QuantileSketch
+from .urlindex import get_host
+
+# seconds of the rolling window for URL and byte rates
+RateWindow = 10
+# maximum number of hosts with check time statistics
+MaxHosts = 1000
+# quantiles shown for check and download times
+Quantiles = (0.5, 0.95, 0.99)
+
+
+class HostStats:
+    """Aggregated check results of one host."""
+
+    __slots__ = ("host", "count", "errors", "checktime", "max_checktime",
+                 "dltime", "dlcount", "size")
+
+    def __init__(self, host):
+        """Initialize empty statistics of given host."""
+        self.host = host
+        self.count = 0
+        self.errors = 0
+        self.checktime = 0.0
+        self.max_checktime = 0.0
+        self.dltime = 0.0
+        # number of URLs with a download time
+        self.dlcount = 0
+        self.size = 0
+
+    def add(self, url_data, checktime):
+        """Add check result of given URL data with given check time."""
+        self.count += 1
+        self.errors += not url_data.valid
+        self.checktime += checktime
+        if checktime > self.max_checktime:
+            self.max_checktime = checktime
+        if url_data.dltime is not None and url_data.dltime >= 0:
+            self.dltime += url_data.dltime
+            self.dlcount += 1
+        if url_data.size is not None and url_data.size > 0:
+            self.size += url_data.size
+
+    def copy(self):
+        """Return a copy of the statistics."""
+        stats = HostStats(self.host)
+        for name in self.__slots__:
+            setattr(stats, name, getattr(self, name))
+        return stats
+
+    @property
+    def mean_checktime(self):
+        """Return mean check time in seconds."""
+        return self.checktime / self.count if self.count else 0.0
+
+    @property
+    def mean_dltime(self):
+        """Return mean download time in seconds."""
+        return self.dltime / self.dlcount if self.dlcount else 0.0
+
+
+class CheckStats:
+    """Statistics of all checked URLs, updated from the checker threads.
+
+    Memory use does not grow with the number of URLs: rates are counted
+    per second for the last seconds only, check and download times are
+    kept in quantile sketches, and when more than maxhosts hosts are
+    seen, the hosts with the least total check time are forgotten.
+
+    The per-host statistics are shared by the dashboard and the hosts
+    dock, which takes the hosts changed since its last update.
+    """
+
+    def __init__(self, window=RateWindow, maxhosts=MaxHosts, clock=time.monotonic):
+        """Initialize empty statistics."""
+        self.window = window
+        self.maxhosts = maxhosts
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.generation = 0
+        self.clear()
+
+    def clear(self):
+        """Remove all statistics."""
+        with self.lock:
+            # incremented each time hosts are removed
+            self.generation += 1
+            self.count = 0
+            self.bytes = 0
+            self.start = None
+            # [second, URLs, bytes] of the last seconds
+            self.seconds = collections.deque(maxlen=self.window + 1)
+            self.checktimes = QuantileSketch()
+            self.dltimes = QuantileSketch()
+            # HostStats by host name
+            self.hosts = {}
+            # names of the hosts changed since the last take_host_changes(),
+            # in the order they were first changed
+            self.changed = {}
+
+    def add(self, url_data):
+        """Add statistics of given checked URL data."""
+        now = int(self.clock())
+        host = get_host(url_data)
+        size = max(url_data.size or 0, 0)
+        checktime = max(url_data.checktime or 0.0, 0.0)
+        with self.lock:
+            if self.start is None:
+                self.start = now
+            self.count += 1
+            self.bytes += size
+            if self.seconds and self.seconds[-1][0] == now:
+                second = self.seconds[-1]
+                second[1] += 1
+                second[2] += size
+            else:
+                self.seconds.append([now, 1, size])
+            self.checktimes.add(checktime)
+            if url_data.dltime is not None and url_data.dltime >= 0:
+                self.dltimes.add(url_data.dltime)
+            stats = self.hosts.get(host)
+            if stats is None:
+                if len(self.hosts) >= self.maxhosts:
+                    self.prune_hosts()
+                stats = self.hosts[host] = HostStats(host)
+            stats.add(url_data, checktime)
+            self.changed[host] = None
+
+    def prune_hosts(self):
+        """Forget the half of the hosts with the least total check time.
+        The remaining hosts are marked as changed in a new generation, so
+        the hosts dock shows no more than maxhosts hosts either. The lock
+        must be held."""
+        hosts = sorted(self.hosts.values(), key=operator.attrgetter("checktime"))
+        for stats in hosts[:len(hosts) // 2]:
+            del self.hosts[stats.host]
+        self.generation += 1
+        self.changed = dict.fromkeys(self.hosts)
+
+    def get_rates(self):
+        """Return checked URLs and downloaded bytes per second over the
+        last completed seconds of the rolling window."""
+        now = int(self.clock())
+        with self.lock:
+            if self.start is None:
+                return 0.0, 0.0
+            seconds = min(self.window, now - self.start)
+            if seconds <= 0:
+                return 0.0, 0.0
+            urls = size = 0
+            for second, second_urls, second_size in self.seconds:
+                if now - seconds <= second < now:
+                    urls += second_urls
+                    size += second_size
+        return urls / seconds, size / seconds
+
+    def get_quantiles(self):
+        """Return lists of check time and download time quantiles in
+        seconds, or None for unknown quantiles."""
+        with self.lock:
+            return (
+                [self.checktimes.quantile(q) for q in Quantiles],
+                [self.dltimes.quantile(q) for q in Quantiles],
+            )
+
+    def take_host_changes(self):
+        """Return the generation and a list of HostStats copies of the
+        hosts changed since the last call."""
+        with self.lock:
+            changed = [self.hosts[host].copy() for host in self.changed
+                       if host in self.hosts]
+            self.changed = {}
+            return self.generation, changed
+
+    def get_slowest_hosts(self, num=10):
+        """Return HostStats of the hosts with the highest mean check time."""
+        with self.lock:
+            hosts = list(self.hosts.values())
+        return sorted(hosts, key=operator.attrgetter("mean_checktime"),
+                      reverse=True)[:num]
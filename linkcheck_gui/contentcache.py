@@ -0,0 +1,201 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+Cache of the page contents downloaded by the checker, used to view page
+sources without downloading them again.
+"""
+from collections import OrderedDict
+import os
+import shutil
+import tempfile
+import threading
+
+from linkcheck.plugins import _ContentPlugin
+
+# maximum number of characters kept in memory
+MaxMemorySize = 16 * 1024 * 1024
+# maximum number of bytes written to disk
+MaxDiskSize = 256 * 1024 * 1024
+# page types of linkcheck content types that are cached as text
+TextPageTypes = frozenset(("html", "css", "text", "wml", "sitemap", "sitemapindex"))
+
+
+class ContentCache:
+    """Thread-safe cache of page texts and content types by URL. The least
+    recently used pages are written to files in a temporary directory
+    when the memory limit is exceeded, and removed when the disk limit is
+    exceeded. Files are written and read without holding the lock, so
+    checker threads adding pages do not wait for the disk."""
+
+    def __init__(self, maxmemory=MaxMemorySize, maxdisk=MaxDiskSize):
+        """Initialize an empty cache with given limits."""
+        self.maxmemory = maxmemory
+        self.maxdisk = maxdisk
+        self.lock = threading.Lock()
+        # (text, content type) by URL
+        self.memory = OrderedDict()
+        self.memorysize = 0
+        # (text, content type) by URL of the pages being written to disk
+        self.spilling = {}
+        # (filename, size, content type) by URL
+        self.disk = OrderedDict()
+        self.disksize = 0
+        self.directory = None
+        # number of written files, used for file names
+        self.files = 0
+
+    def __len__(self):
+        """Return number of cached pages."""
+        with self.lock:
+            return len(self.memory) + len(self.spilling) + len(self.disk)
+
+    def add(self, url, text, content_type):
+        """Cache text and content type of given URL."""
+        spilled = []
+        with self.lock:
+            self.remove(url)
+            self.memory[url] = (text, content_type)
+            self.memorysize += len(text)
+            while self.memorysize > self.maxmemory:
+                old_url, entry = self.memory.popitem(last=False)
+                self.memorysize -= len(entry[0])
+                self.spilling[old_url] = entry
+                spilled.append((old_url, entry, self.get_filename()))
+        for old_url, entry, filename in spilled:
+            self.spill(old_url, entry, filename)
+
+    def get_filename(self):
+        """Return a new file name in the temporary directory, or None if
+        the directory cannot be created. The lock must be held."""
+        if self.directory is None:
+            try:
+                self.directory = tempfile.mkdtemp(prefix="linkchecker-gui-")
+            except OSError:
+                return None
+        self.files += 1
+        return os.path.join(self.directory, "%d.txt" % self.files)
+
+    def get(self, url):
+        """Return cached text and content type of given URL, or None.
+        Files that cannot be read or decoded are removed from the cache."""
+        with self.lock:
+            entry = self.memory.get(url)
+            if entry is not None:
+                self.memory.move_to_end(url)
+                return entry
+            entry = self.spilling.get(url)
+            if entry is not None:
+                return entry
+            entry = self.disk.get(url)
+            if entry is None:
+                return None
+        filename, size, content_type = entry
+        try:
+            with open(filename, encoding="utf-8", errors="surrogatepass") as f:
+                return f.read(), content_type
+        except (OSError, UnicodeDecodeError):
+            with self.lock:
+                if self.disk.get(url) is entry:
+                    self.remove(url)
+            return None
+
+    def spill(self, url, entry, filename):
+        """Write given entry removed from memory to given file, without
+        holding the lock. Entries larger than the disk limit, entries that
+        cannot be written and entries replaced or cleared in the meantime
+        are dropped."""
+        text, content_type = entry
+        data = text.encode("utf-8", "surrogatepass")
+        if len(data) > self.maxdisk:
+            filename = None
+        if filename is not None:
+            try:
+                with open(filename, "wb") as f:
+                    f.write(data)
+            except OSError:
+                filename = None
+        with self.lock:
+            if self.spilling.get(url) is not entry:
+                if filename is not None:
+                    self.remove_file(url, (filename, 0, content_type))
+                return
+            del self.spilling[url]
+            if filename is None:
+                return
+            self.disk[url] = (filename, len(data), content_type)
+            self.disksize += len(data)
+            while self.disksize > self.maxdisk:
+                self.remove_file(*self.disk.popitem(last=False))
+
+    def remove(self, url):
+        """Remove given URL from the cache. The lock must be held."""
+        entry = self.memory.pop(url, None)
+        if entry is not None:
+            self.memorysize -= len(entry[0])
+        self.spilling.pop(url, None)
+        entry = self.disk.pop(url, None)
+        if entry is not None:
+            self.remove_file(url, entry)
+
+    def remove_file(self, url, entry):
+        """Remove the file of given disk entry."""
+        filename, size, content_type = entry
+        self.disksize -= size
+        try:
+            os.remove(filename)
+        except OSError:
+            pass
+
+    def clear(self):
+        """Remove all pages and the temporary directory."""
+        with self.lock:
+            self.memory.clear()
+            self.memorysize = 0
+            self.spilling.clear()
+            self.disk.clear()
+            self.disksize = 0
+            if self.directory is not None:
+                shutil.rmtree(self.directory, ignore_errors=True)
+                self.directory = None
+
+
+class ContentCachePlugin(_ContentPlugin):
+    """Content plugin adding the pages the checker parses for links to a
+    ContentCache. The plugin is added to the plugin manager of an
+    aggregate with add_plugin() instead of being enabled in the
+    configuration."""
+
+    def __init__(self, cache):
+        """Store the cache."""
+        super().__init__(None)
+        self.cache = cache
+
+    def applies_to(self, url_data):
+        """Only cache text pages that are parsed, since their content is
+        downloaded anyway."""
+        pagetype = url_data.ContentMimetypes.get(url_data.content_type)
+        return pagetype in TextPageTypes and url_data.allows_recursion()
+
+    def check(self, url_data):
+        """Cache the decoded content that is parsed for links, so the
+        lines and columns of found links match."""
+        self.cache.add(url_data.url, url_data.get_content(), url_data.content_type)
+
+
+def add_plugin(aggregate, cache):
+    """Fill given ContentCache with the pages parsed by the checker of
+    given aggregate."""
+    aggregate.plugin_manager.content_plugins.append(ContentCachePlugin(cache))
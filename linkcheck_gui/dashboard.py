@@ -0,0 +1,80 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+from linkcheck import strformat
+from PyQt6 import QtCore, QtWidgets
+
+from .linkchecker_ui_dashboard import Ui_Dashboard
+
+# milliseconds between dashboard updates
+UpdateInterval = 1000
+# number of hosts shown in the slowest hosts list
+NumHosts = 10
+
+
+def format_times(times):
+    """Format list of times in seconds as milliseconds."""
+    if times[0] is None:
+        return "-"
+    return " / ".join("%.0f" % (value * 1000) for value in times) + " ms"
+
+
+class Dashboard(QtWidgets.QDockWidget, Ui_Dashboard):
+    """Show live throughput and latency of the running check."""
+
+    def __init__(self, checkstats, parent=None):
+        """Setup the dashboard showing given CheckStats."""
+        super().__init__(parent)
+        self.setupUi(self)
+        self.setWidget(self.dockWidgetContents)
+        self.checkstats = checkstats
+        self.timer = QtCore.QTimer(self)
+        self.timer.setInterval(UpdateInterval)
+        self.timer.timeout.connect(self.update_stats)
+        self.hosts.header().setSectionResizeMode(
+            0, QtWidgets.QHeaderView.ResizeMode.Stretch)
+        self.hosts.header().setStretchLastSection(False)
+
+    def showEvent(self, event):
+        """Start updating when the dashboard is shown."""
+        super().showEvent(event)
+        self.update_stats()
+        self.timer.start()
+
+    def hideEvent(self, event):
+        """Stop updating while the dashboard is hidden."""
+        super().hideEvent(event)
+        self.timer.stop()
+
+    def update_stats(self):
+        """Show the current statistics."""
+        urlrate, byterate = self.checkstats.get_rates()
+        self.label_urlrate.setText("%.1f" % urlrate)
+        self.label_byterate.setText(_("%s/s") % strformat.strsize(int(byterate)))
+        checktimes, dltimes = self.checkstats.get_quantiles()
+        self.label_checktime.setText(format_times(checktimes))
+        self.label_dltime.setText(format_times(dltimes))
+        self.hosts.clear()
+        for stats in self.checkstats.get_slowest_hosts(NumHosts):
+            item = QtWidgets.QTreeWidgetItem([
+                stats.host,
+                "%d" % stats.count,
+                "%.0f ms" % (stats.mean_checktime * 1000),
+                "%.0f ms" % (stats.max_checktime * 1000),
+            ])
+            for column in (1, 2, 3):
+                item.setTextAlignment(column, QtCore.Qt.AlignmentFlag.AlignRight)
+            self.hosts.addTopLevelItem(item)
@@ -14,6 +14,8 @@
 # with this program; if not, write to the Free Software Foundation, Inc.,
 # 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 
+import codecs
+import mmap
 import os
 import urllib.parse
 
@@ -27,6 +29,41 @@ try:
 except ImportError:
     from .editor_qt import ContentTypeLexers, Editor
 
+# number of characters added to the editor at once
+ChunkSize = 256 * 1024
+# number of lines loaded after the target line before jumping to it
+PreloadLines = 100
+
+
+def get_local_filename(url):
+    """Return the filename of given file:// URL if it exists, else None."""
+    if url and url.startswith("file://"):
+        urlparts = urllib.parse.urlsplit(url)
+        path = get_os_filename(urlparts[2])
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def read_file(filename, encoding="utf-8"):
+    """Yield decoded parts of given file, read through a memory map so
+    the file is not copied into memory at once. Invalid characters are
+    replaced."""
+    with open(filename, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            decoder = codecs.getincrementaldecoder(encoding)("replace")
+            for start in range(0, len(data), ChunkSize):
+                yield decoder.decode(data[start:start + ChunkSize])
+            yield decoder.decode(b"", final=True)
+
+
+def split_text(text):
+    """Yield parts of ChunkSize characters of given text."""
+    for start in range(0, len(text), ChunkSize):
+        yield text[start:start + ChunkSize]
+
 
 class EditorWindow(QtWidgets.QDialog, Ui_EditorDialog):
     """Editor window."""
@@ -35,6 +72,8 @@ class EditorWindow(QtWidgets.QDialog, Ui_EditorDialog):
     saved = QtCore.pyqtSignal(str)
     # emitted after successful load
     loaded = QtCore.pyqtSignal(str)
+    # emitted when the window is closed
+    closed = QtCore.pyqtSignal()
 
     def __init__(self, parent=None):
         """Initialize the editor widget."""
@@ -42,6 +81,12 @@ class EditorWindow(QtWidgets.QDialog, Ui_EditorDialog):
         self.setupUi(self)
         # filename used for saving
         self.filename = None
+        # iterator of text parts still to be added
+        self.parts = None
+        # line and column to jump to when enough text is loaded
+        self.target = None
+        self.timer = QtCore.QTimer(self)
+        self.timer.timeout.connect(self.addPart)
         # the Scintilla editor widget
         self.editor = Editor(parent=self.frame)
         layout = QtWidgets.QVBoxLayout(self.frame)
@@ -61,20 +106,98 @@ class EditorWindow(QtWidgets.QDialog, Ui_EditorDialog):
         self.editor.highlight(lexerclass)
 
     def setText(self, text, line=1, col=1):
-        """Set editor text and jump to given line and column."""
-        self.editor.setText(text)
+        """Set editor text and jump to given line and column, see
+        setParts()."""
+        self.setParts(split_text(text), line=line, col=col)
+
+    def setParts(self, parts, line=1, col=1):
+        """Set editor text from given iterable of text parts. The parts up
+        to some lines after given line are added at once and the cursor
+        jumps to given line and column, the other parts are added in
+        background."""
+        self.stopLoading()
+        self.editor.setText("")
+        self.editor.setModified(False)
+        self.target = (line, col)
+        self.parts = iter(parts)
+        try:
+            while self.target is not None and self.addPart():
+                pass
+        except OSError:
+            self.stopLoading()
+            raise
+        if self.parts is not None:
+            self.timer.start()
+
+    def addPart(self):
+        """Add the next text part. Return False if all parts have been
+        added."""
+        try:
+            text = next(self.parts)
+        except StopIteration:
+            self.stopLoading()
+            if self.target is not None:
+                self.jumpToTarget()
+            return False
+        self.appendText(text)
+        return True
+
+    def addAllParts(self):
+        """Add all remaining text parts at once."""
+        while self.parts is not None and self.addPart():
+            pass
+
+    def stopLoading(self):
+        """Stop adding text parts."""
+        self.timer.stop()
+        if self.parts is not None:
+            close = getattr(self.parts, "close", None)
+            if close is not None:
+                # close the file of read_file()
+                close()
+            self.parts = None
+
+    def jumpToTarget(self):
+        """Move the cursor to the target line and column."""
+        line, col = self.target
+        self.target = None
         self.editor.setCursorPosition(line - 1, col - 1)
+
+    def setLoading(self, url, line=1, col=1):
+        """Show that the content of given URL is being downloaded. The
+        cursor jumps to given line and column once enough text has been
+        appended."""
+        self.stopLoading()
+        self.setWindowTitle(_("Loading %s...") % url)
+        self.editor.setText("")
+        self.editor.highlight(None)
         self.editor.setModified(False)
+        self.target = (line, col)
+
+    def appendText(self, text):
+        """Append loaded text, keeping the modified state of the editor,
+        and jump to the target line if enough lines follow it."""
+        modified = self.editor.isModified()
+        self.editor.append(text)
+        if not modified:
+            self.editor.setModified(False)
+        if (self.target is not None
+                and self.editor.lines() > self.target[0] + PreloadLines):
+            self.jumpToTarget()
+
+    def finishLoading(self, url, content_type):
+        """Highlight the loaded content of given URL according to given
+        content type, and jump to the target line if the text is shorter
+        than expected."""
+        self.setWindowTitle(_("View %s") % url)
+        self.setContentType(content_type)
+        if self.parts is None and self.target is not None:
+            self.jumpToTarget()
 
     def setUrl(self, url):
         """If URL is a file:// URL, store the filename of it as base
         directory for the "save as" dialog."""
-        self.basedir = ""
-        if url and url.startswith("file://"):
-            urlparts = urllib.parse.urlsplit(url)
-            path = get_os_filename(urlparts[2])
-            if os.path.exists(path):
-                self.basedir = path
+        self.basedir = get_local_filename(url) or ""
 
     @QtCore.pyqtSlot()
     def on_actionSave_triggered(self):
@@ -98,6 +221,15 @@ class EditorWindow(QtWidgets.QDialog, Ui_EditorDialog):
         else:
             # unchanged
             e.accept()
+        if e.isAccepted():
+            self.stopLoading()
+            self.closed.emit()
+
+    def reject(self):
+        """Close the window with the escape key."""
+        super().reject()
+        self.stopLoading()
+        self.closed.emit()
 
     def wants_save(self):
         """Ask user if he wants to save changes. Return True if user
@@ -116,6 +248,7 @@ class EditorWindow(QtWidgets.QDialog, Ui_EditorDialog):
 
     def save(self):
         """Save editor contents to file."""
+        self.addAllParts()
         if not self.filename:
             title = _("Save File As")
             filename, _filter = \
@@ -154,7 +287,7 @@ class EditorWindow(QtWidgets.QDialog, Ui_EditorDialog):
         return saved
 
     def load(self, filename):
-        """Load editor contents from file."""
+        """Load editor contents from UTF-8 encoded file."""
         if not os.path.isfile(filename):
             return
         if not os.access(filename, os.R_OK):
@@ -165,22 +298,12 @@ class EditorWindow(QtWidgets.QDialog, Ui_EditorDialog):
         else:
             title = self.filename
         self.setWindowTitle(title)
-        fh = None
-        loaded = False
         try:
-            try:
-                fh = QtCore.QFile(self.filename)
-                if not fh.open(QtCore.QIODevice.OpenModeFlag.ReadOnly):
-                    raise OSError(fh.errorString())
-                stream = QtCore.QTextStream(fh)
-                self.setText(stream.readAll())
-                loaded = True
-            except OSError as e:
-                err = QtWidgets.QMessageBox(self)
-                err.setText(str(e))
-                err.exec()
-        finally:
-            if fh is not None:
-                fh.close()
-        if loaded:
+            # the rest of a large file is added in background
+            self.setParts(read_file(self.filename, encoding="utf-8-sig"))
+        except OSError as e:
+            err = QtWidgets.QMessageBox(self)
+            err.setText(str(e))
+            err.exec()
+        else:
             self.loaded.emit(self.filename)
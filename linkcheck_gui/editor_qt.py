@@ -49,6 +49,7 @@ class Editor(QtWidgets.QPlainTextEdit):
         font.setFixedPitch(True)
         self.document().setDefaultFont(font)
         self.lineNumberArea = LineNumberArea(self)
+        self.lexer = None
         self.blockCountChanged.connect(self.updateLineNumberAreaWidth)
         self.updateRequest.connect(self.updateLineNumberArea)
         self.cursorPositionChanged.connect(self.highlightCurrentLine)
@@ -56,9 +57,15 @@ class Editor(QtWidgets.QPlainTextEdit):
         self.highlightCurrentLine()
 
     def highlight(self, lexerclass):
-        """Set syntax highlighter."""
+        """Set syntax highlighter, which highlights the visible lines
+        first."""
+        if self.lexer is not None:
+            self.lexer.setDocument(None)
         if lexerclass:
             self.lexer = lexerclass(self.document())
+            first = self.firstVisibleBlock().blockNumber()
+            lines = self.viewport().height() // self.fontMetrics().height()
+            self.lexer.highlightVisible(first + lines)
         else:
             self.lexer = None
 
@@ -70,6 +77,16 @@ class Editor(QtWidgets.QPlainTextEdit):
         """Return editor text."""
         return self.toPlainText()
 
+    def append(self, text):
+        """Append text at the end without a line break."""
+        cursor = QtGui.QTextCursor(self.document())
+        cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
+        cursor.insertText(text)
+
+    def lines(self):
+        """Return number of lines."""
+        return self.document().blockCount()
+
     def setModified(self, flag):
         """Set modified flag of underlying document."""
         return self.document().setModified(flag)
@@ -78,6 +95,12 @@ class Editor(QtWidgets.QPlainTextEdit):
         """Return modified flag of underlying document."""
         return self.document().isModified()
 
+    def getCursorPosition(self):
+        """Return line and column of the cursor. Line counting starts with
+        zero."""
+        cursor = self.textCursor()
+        return cursor.blockNumber(), cursor.positionInBlock()
+
     def setCursorPosition(self, line, column=0):
         """Move cursor to given line and column. Line counting starts
         with zero."""
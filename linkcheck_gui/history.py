@@ -0,0 +1,113 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+History of all checked URLs, used by incremental checks to skip the URLs
+that do not need to be checked again.
+"""
+import collections
+import datetime
+import threading
+
+from .resultdb import HistoryAttrs
+
+# seconds after which an incremental check checks a valid URL again
+RecheckAge = 7 * 24 * 60 * 60
+
+CheckedUrl = collections.namedtuple("CheckedUrl", HistoryAttrs)
+
+
+def get_now():
+    """Return the current time in UTC."""
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+def get_checked_url(url_data, now=None):
+    """Return CheckedUrl entry of given URL data checked at given time,
+    by default now."""
+    modified = url_data.modified
+    return CheckedUrl(
+        url_data.url,
+        url_data.cache_url,
+        bool(url_data.valid),
+        bool(url_data.warnings),
+        None if modified is None else modified.isoformat(),
+        url_data.size,
+        url_data.parent_url,
+        (now or get_now()).isoformat(),
+    )
+
+
+def is_recent(entry, now, maxage):
+    """Return True if given entry was checked less than maxage seconds
+    before given time."""
+    if not entry.checked:
+        return False
+    try:
+        checked = datetime.datetime.fromisoformat(entry.checked)
+    except ValueError:
+        return False
+    return (now - checked).total_seconds() < maxage
+
+
+def get_unchanged(entries, now=None, maxage=RecheckAge):
+    """Return set of cache URLs an incremental check does not check again:
+    URLs which were valid without warnings each time they were checked,
+    which are not the parent of another URL and which were checked less
+    than maxage seconds ago.
+
+    Pages with links are always checked again, since a changed page can
+    only be detected by downloading it. Their links are found again by
+    parsing, and only the new, failed and warned links are checked. The
+    entries of skipped URLs keep their check time, so a link that breaks
+    later is found at the latest when its entry is maxage seconds old."""
+    now = now or get_now()
+    parents = {entry.parent_url for entry in entries if entry.parent_url}
+    unchanged = set()
+    recheck = set()
+    for entry in entries:
+        if (not entry.valid or entry.warning or entry.url in parents
+                or entry.cache_url in parents or not is_recent(entry, now, maxage)):
+            recheck.add(entry.cache_url)
+        else:
+            unchanged.add(entry.cache_url)
+    return unchanged - recheck
+
+
+class CheckHistory:
+    """CheckedUrl entries of the URLs checked since the entries were last
+    taken, added from the checker threads."""
+
+    def __init__(self):
+        """Initialize an empty history."""
+        self.lock = threading.Lock()
+        self.entries = []
+
+    def clear(self):
+        """Remove all entries."""
+        with self.lock:
+            self.entries = []
+
+    def add(self, url_data):
+        """Add entry of given checked URL data."""
+        entry = get_checked_url(url_data)
+        with self.lock:
+            self.entries.append(entry)
+
+    def take(self):
+        """Return and remove all entries."""
+        with self.lock:
+            entries, self.entries = self.entries, []
+        return entries
@@ -0,0 +1,197 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+Check results aggregated by host.
+"""
+from linkcheck import strformat
+from PyQt6 import QtCore, QtWidgets
+
+from .urlmodel import EmptyQVariant
+
+# milliseconds between updates of the shown hosts
+UpdateInterval = 1000
+
+HostHeaders = [
+    _("Host"),
+    _("URLs"),
+    _("Errors"),
+    _("Check time"),
+    _("Mean check time"),
+    _("Max check time"),
+    _("Download time"),
+    _("Mean download time"),
+    _("Size"),
+]
+
+
+def get_values(stats):
+    """Return list of sort values of each column of given HostStats."""
+    return [
+        stats.host,
+        stats.count,
+        stats.errors / stats.count,
+        stats.checktime,
+        stats.mean_checktime,
+        stats.max_checktime,
+        stats.dltime,
+        stats.mean_dltime,
+        stats.size,
+    ]
+
+
+def get_texts(stats):
+    """Return list of display texts of each column of given HostStats."""
+    return [
+        stats.host or _("(no host)"),
+        "%d" % stats.count,
+        "%d (%.1f%%)" % (stats.errors, stats.errors / stats.count * 100),
+        strformat.strduration_long(stats.checktime),
+        format_ms(stats.mean_checktime),
+        format_ms(stats.max_checktime),
+        strformat.strduration_long(stats.dltime),
+        format_ms(stats.mean_dltime),
+        strformat.strsize(stats.size),
+    ]
+
+
+def format_ms(seconds):
+    """Format seconds as milliseconds."""
+    return "%.0f ms" % (seconds * 1000)
+
+
+class HostStatsModel(QtCore.QAbstractTableModel):
+    """Model with one row of aggregated results per host, updated from
+    the host statistics of CheckStats. The rows are in the order the hosts
+    were first seen; the sort role returns numbers for a sorting proxy."""
+
+    def __init__(self, checkstats, parent=None):
+        """Show the hosts of given CheckStats."""
+        super().__init__(parent)
+        self.checkstats = checkstats
+        self.generation = None
+        # HostStats copies in row order
+        self.hosts = []
+        # row numbers by host name
+        self.rows = {}
+
+    def update(self):
+        """Show the hosts changed since the last update."""
+        generation, changes = self.checkstats.take_host_changes()
+        if generation != self.generation:
+            self.beginResetModel()
+            self.generation = generation
+            self.hosts = []
+            self.rows = {}
+            self.endResetModel()
+        new_hosts = []
+        first = last = None
+        for stats in changes:
+            row = self.rows.get(stats.host)
+            if row is None:
+                self.rows[stats.host] = len(self.hosts) + len(new_hosts)
+                new_hosts.append(stats)
+                continue
+            self.hosts[row] = stats
+            first = row if first is None else min(first, row)
+            last = row if last is None else max(last, row)
+        if first is not None:
+            self.dataChanged.emit(self.index(first, 0),
+                                  self.index(last, len(HostHeaders) - 1))
+        if new_hosts:
+            row = len(self.hosts)
+            self.beginInsertRows(QtCore.QModelIndex(), row,
+                                 row + len(new_hosts) - 1)
+            self.hosts.extend(new_hosts)
+            self.endInsertRows()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """Return number of hosts."""
+        if parent.isValid():
+            return 0
+        return len(self.hosts)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        """Return number of header columns."""
+        return len(HostHeaders)
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        """Return host data at given index for given role."""
+        if not index.isValid() or index.row() >= len(self.hosts):
+            return EmptyQVariant
+        stats = self.hosts[index.row()]
+        column = index.column()
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return get_texts(stats)[column]
+        if role == QtCore.Qt.ItemDataRole.UserRole:
+            return get_values(stats)[column]
+        if role == QtCore.Qt.ItemDataRole.TextAlignmentRole and column > 0:
+            return (QtCore.Qt.AlignmentFlag.AlignRight
+                    | QtCore.Qt.AlignmentFlag.AlignVCenter)
+        return EmptyQVariant
+
+    def headerData(self, section, orientation, role):
+        """Return header column data for given parameters."""
+        if (orientation == QtCore.Qt.Orientation.Horizontal
+                and role == QtCore.Qt.ItemDataRole.DisplayRole):
+            return HostHeaders[section]
+        return EmptyQVariant
+
+
+class HostStatsDock(QtWidgets.QDockWidget):
+    """Sortable table of the check results aggregated by host, updated
+    while the dock is shown."""
+
+    # emitted with the host name of an activated row
+    host_activated = QtCore.pyqtSignal(str)
+
+    def __init__(self, checkstats, parent=None):
+        """Show a HostStatsModel of given CheckStats."""
+        super().__init__(_("Hosts"), parent)
+        self.setObjectName("HostStatsDock")
+        self.hoststats = HostStatsModel(checkstats, parent=self)
+        self.timer = QtCore.QTimer(self)
+        self.timer.setInterval(UpdateInterval)
+        self.timer.timeout.connect(self.hoststats.update)
+        self.proxy = QtCore.QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.hoststats)
+        self.proxy.setSortRole(QtCore.Qt.ItemDataRole.UserRole)
+        self.proxy.setDynamicSortFilter(True)
+        self.view = QtWidgets.QTreeView(self)
+        self.view.setRootIsDecorated(False)
+        self.view.setUniformRowHeights(True)
+        self.view.setAlternatingRowColors(True)
+        self.view.setModel(self.proxy)
+        # the slowest hosts come first
+        self.view.sortByColumn(4, QtCore.Qt.SortOrder.DescendingOrder)
+        self.view.setSortingEnabled(True)
+        self.view.activated.connect(self.activate)
+        self.setWidget(self.view)
+
+    def showEvent(self, event):
+        """Start updating when the dock is shown."""
+        super().showEvent(event)
+        self.hoststats.update()
+        self.timer.start()
+
+    def hideEvent(self, event):
+        """Stop updating while the dock is hidden."""
+        super().hideEvent(event)
+        self.timer.stop()
+
+    def activate(self, index):
+        """Emit the host name of the activated row."""
+        index = self.proxy.mapToSource(index)
+        self.host_activated.emit(self.hoststats.hosts[index.row()].host)
@@ -0,0 +1,282 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+Queue of check jobs run one after another.
+"""
+from enum import Enum
+import time
+
+from linkcheck import strformat
+from PyQt6 import QtCore, QtWidgets
+
+from .projects import ProjectFilter
+from .urlmodel import EmptyQVariant
+
+JobStatus = Enum("JobStatus", ["queued", "running", "finished", "canceled", "failed"])
+
+JobStatusNames = {
+    JobStatus.queued: _("Queued"),
+    JobStatus.running: _("Running"),
+    JobStatus.finished: _("Finished"),
+    JobStatus.canceled: _("Canceled"),
+    JobStatus.failed: _("Failed"),
+}
+
+JobHeaders = [
+    _("Start URL"),
+    _("Status"),
+    _("Checked"),
+    _("Queued"),
+    _("Errors"),
+    _("Warnings"),
+    _("Duration"),
+]
+
+
+class Job:
+    """Check of a start URL or of the URL of a project file."""
+
+    def __init__(self, url, project=None):
+        """Initialize a queued job of given URL or project filename."""
+        self.url = url
+        self.project = project
+        self.status = JobStatus.queued
+        self.checked = 0
+        self.queued = 0
+        self.errors = None
+        self.warnings = None
+        self.start = None
+        self.duration = 0.0
+
+    def set_running(self):
+        """Note that the job is being checked."""
+        self.status = JobStatus.running
+        self.start = time.monotonic()
+
+    def set_progress(self, checked, queued):
+        """Set number of checked and queued URLs."""
+        self.checked = checked
+        self.queued = queued
+        self.duration = time.monotonic() - self.start
+
+    def set_done(self, status):
+        """Note that the job ended with given status."""
+        self.status = status
+        self.queued = 0
+        if self.start is not None:
+            self.duration = time.monotonic() - self.start
+
+    def get_texts(self):
+        """Return list of display texts of each column."""
+        running = self.status != JobStatus.queued
+        return [
+            self.url,
+            JobStatusNames[self.status],
+            "%d" % self.checked if running else "",
+            "%d" % self.queued if self.status == JobStatus.running else "",
+            "" if self.errors is None else "%d" % self.errors,
+            "" if self.warnings is None else "%d" % self.warnings,
+            strformat.strduration_long(self.duration) if running else "",
+        ]
+
+
+class JobModel(QtCore.QAbstractTableModel):
+    """Model of the jobs in the order they are checked."""
+
+    def __init__(self, parent=None):
+        """Initialize an empty job list."""
+        super().__init__(parent)
+        self.jobs = []
+
+    def add_jobs(self, jobs):
+        """Append given jobs."""
+        if not jobs:
+            return
+        row = len(self.jobs)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row + len(jobs) - 1)
+        self.jobs.extend(jobs)
+        self.endInsertRows()
+
+    def remove_job(self, row):
+        """Remove job in given row unless it is running."""
+        if self.jobs[row].status == JobStatus.running:
+            return False
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        del self.jobs[row]
+        self.endRemoveRows()
+        return True
+
+    def move_job(self, row, offset):
+        """Move job in given row by given offset and return its new row."""
+        new = min(max(row + offset, 0), len(self.jobs) - 1)
+        if new != row:
+            # beginMoveRows expects the row before which the job is moved
+            dest = new + 1 if new > row else new
+            self.beginMoveRows(QtCore.QModelIndex(), row, row,
+                               QtCore.QModelIndex(), dest)
+            self.jobs.insert(new, self.jobs.pop(row))
+            self.endMoveRows()
+        return new
+
+    def next_job(self):
+        """Return the first queued job or None."""
+        for job in self.jobs:
+            if job.status == JobStatus.queued:
+                return job
+        return None
+
+    def update_job(self, job):
+        """Show the changed data of given job."""
+        row = self.jobs.index(job)
+        self.dataChanged.emit(self.index(row, 0),
+                              self.index(row, len(JobHeaders) - 1))
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """Return number of jobs."""
+        if parent.isValid():
+            return 0
+        return len(self.jobs)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        """Return number of header columns."""
+        return len(JobHeaders)
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        """Return job data at given index for given role."""
+        if not index.isValid() or index.row() >= len(self.jobs):
+            return EmptyQVariant
+        job = self.jobs[index.row()]
+        column = index.column()
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return job.get_texts()[column]
+        if role == QtCore.Qt.ItemDataRole.ToolTipRole and column == 0:
+            return job.project or job.url
+        if role == QtCore.Qt.ItemDataRole.TextAlignmentRole and column > 1:
+            return (QtCore.Qt.AlignmentFlag.AlignRight
+                    | QtCore.Qt.AlignmentFlag.AlignVCenter)
+        return EmptyQVariant
+
+    def headerData(self, section, orientation, role):
+        """Return header column data for given parameters."""
+        if (orientation == QtCore.Qt.Orientation.Horizontal
+                and role == QtCore.Qt.ItemDataRole.DisplayRole):
+            return JobHeaders[section]
+        return EmptyQVariant
+
+
+def get_urls(text):
+    """Return list of the URLs in given text, one per line."""
+    urls = []
+    for line in text.splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            urls.append(line)
+    return urls
+
+
+class JobDock(QtWidgets.QDockWidget):
+    """List of queued check jobs with buttons to add, reorder, cancel and
+    run them."""
+
+    # emitted when the queued jobs should be checked
+    run_jobs = QtCore.pyqtSignal()
+    # emitted when the running job should be canceled
+    cancel_job = QtCore.pyqtSignal()
+
+    def __init__(self, urlinput, parent=None):
+        """Show an empty JobModel. New URL jobs are prefilled with the
+        text of given URL input widget."""
+        super().__init__(_("Jobs"), parent)
+        self.setObjectName("JobDock")
+        self.urlinput = urlinput
+        self.jobmodel = JobModel(parent=self)
+        self.view = QtWidgets.QTreeView(self)
+        self.view.setRootIsDecorated(False)
+        self.view.setUniformRowHeights(True)
+        self.view.setModel(self.jobmodel)
+        buttons = QtWidgets.QHBoxLayout()
+        for text, slot in (
+            (_("Add URLs..."), self.add_urls),
+            (_("Add project..."), self.add_project),
+            (_("Up"), self.move_up),
+            (_("Down"), self.move_down),
+            (_("Cancel"), self.cancel),
+            (_("Remove"), self.remove),
+            (_("Run"), self.run_jobs.emit),
+        ):
+            button = QtWidgets.QPushButton(text, self)
+            button.clicked.connect(slot)
+            buttons.addWidget(button)
+        buttons.addStretch()
+        layout = QtWidgets.QVBoxLayout()
+        layout.addLayout(buttons)
+        layout.addWidget(self.view)
+        widget = QtWidgets.QWidget(self)
+        widget.setLayout(layout)
+        self.setWidget(widget)
+
+    def get_row(self):
+        """Return row of the selected job or None."""
+        index = self.view.currentIndex()
+        return index.row() if index.isValid() else None
+
+    def add_urls(self):
+        """Add jobs for URLs entered in a dialog, one per line."""
+        text, ok = QtWidgets.QInputDialog.getMultiLineText(
+            self, _("Add jobs"), _("Start URLs, one per line:"),
+            self.urlinput.text())
+        if ok:
+            self.jobmodel.add_jobs([Job(url) for url in get_urls(text)])
+
+    def add_project(self):
+        """Add a job for a project file selected in a file dialog."""
+        filenames, _filter = QtWidgets.QFileDialog.getOpenFileNames(
+            self, _("Add LinkChecker projects"), "", ProjectFilter)
+        self.jobmodel.add_jobs([Job(filename, project=filename)
+                                for filename in filenames])
+
+    def move_up(self):
+        """Check the selected job earlier."""
+        self.move(-1)
+
+    def move_down(self):
+        """Check the selected job later."""
+        self.move(1)
+
+    def move(self, offset):
+        """Move the selected job by given offset."""
+        row = self.get_row()
+        if row is not None:
+            row = self.jobmodel.move_job(row, offset)
+            self.view.setCurrentIndex(self.jobmodel.index(row, 0))
+
+    def cancel(self):
+        """Cancel the selected job."""
+        row = self.get_row()
+        if row is None:
+            return
+        job = self.jobmodel.jobs[row]
+        if job.status == JobStatus.queued:
+            job.set_done(JobStatus.canceled)
+            self.jobmodel.update_job(job)
+        elif job.status == JobStatus.running:
+            self.cancel_job.emit()
+
+    def remove(self):
+        """Remove the selected job unless it is running."""
+        row = self.get_row()
+        if row is not None:
+            self.jobmodel.remove_job(row)
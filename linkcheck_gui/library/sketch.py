@@ -0,0 +1,78 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+Streaming quantile estimation with constant memory.
+"""
+import math
+
+
+class QuantileSketch:
+    """Estimate quantiles of a stream of non-negative values.
+
+    Values are counted in buckets with logarithmically growing bounds,
+    so each estimated quantile is within the given relative accuracy of
+    the exact value. Values below min_value are counted as zero. The
+    number of buckets only depends on the range of values and the
+    accuracy, not on the number of values; with the defaults values from
+    one microsecond to one day need at most 1260 buckets.
+    """
+
+    def __init__(self, relative_accuracy=0.01, min_value=1e-6):
+        """Initialize empty sketch."""
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.min_value = min_value
+        self.clear()
+
+    def clear(self):
+        """Remove all values."""
+        # value counts by bucket number
+        self.buckets = {}
+        self.zeros = 0
+        self.count = 0
+        self.max = 0.0
+
+    def __len__(self):
+        """Return number of added values."""
+        return self.count
+
+    def add(self, value):
+        """Add a value."""
+        self.count += 1
+        if value > self.max:
+            self.max = value
+        if value < self.min_value:
+            self.zeros += 1
+            return
+        key = math.ceil(math.log(value) / self.log_gamma)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+
+    def quantile(self, q):
+        """Return estimated value of quantile q between 0 and 1, or None
+        if no values have been added."""
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zeros
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                # the middle of the bucket in relative terms
+                value = 2 * self.gamma ** key / (self.gamma + 1)
+                return min(value, self.max)
+        return self.max
@@ -17,51 +17,197 @@
 Functions for parsing and matching URL strings.
 """
 
+from collections import OrderedDict
+import functools
+from http.cookiejar import DefaultCookiePolicy
+import threading
+
 import requests
 
 from linkcheck import log, LOG_CHECK
 from linkcheck.configuration import get_certifi_file, get_system_cert_file
 
+# maximum number of cached pages
+MaxCachedPages = 32
+# maximum total length of the cached page contents
+MaxCacheSize = 16 * 1024 * 1024
+# bytes read at once when the content is passed on while downloading
+StreamChunkSize = 64 * 1024
 
-def get_content(url, user=None, password=None, data=None, addheaders=None):
-    """Get URL content and info.
-
-    @return: (decoded text content of URL, headers) or
-             (None, errmsg) on error.
-    @rtype: tuple (String, dict) or (None, String)
-    """
-    from linkcheck import configuration
-
-    headers = {
-        'User-Agent': configuration.UserAgent,
-    }
-    if addheaders:
-        headers.update(addheaders)
-    method = 'GET'
-    kwargs = dict(headers=headers)
-    if user and password:
-        kwargs['auth'] = (user, password)
-    if data:
-        kwargs['data'] = data
-        method = 'POST'
 
+@functools.lru_cache(1)
+def get_cert_file():
+    """Return filename of the CA bundle to verify certificates with, or
+    None for the default of requests."""
     try:
-        kwargs["verify"] = get_system_cert_file()
+        return get_system_cert_file()
     except ValueError:
         try:
-            kwargs["verify"] = get_certifi_file()
+            return get_certifi_file()
         except (ValueError, ImportError):
-            pass
-    try:
-        response = requests.request(method, url, **kwargs)
-        return response.text, response.headers
-    except (
-        requests.exceptions.RequestException,
-        requests.exceptions.BaseHTTPError,
-    ) as msg:
-        log.warn(
-            LOG_CHECK,
-            ("Could not get content of URL %(url)s: %(msg)s.")
-            % {"url": url, "msg": str(msg)},
-        )
-        return None, str(msg)
+            return None
+
+
+def get_validators(headers):
+    """Return dictionary of conditional request headers revalidating a
+    response with given headers, empty if it cannot be revalidated."""
+    if "no-store" in headers.get("Cache-Control", "").lower():
+        return {}
+    validators = {}
+    if headers.get("ETag"):
+        validators["If-None-Match"] = headers["ETag"]
+    if headers.get("Last-Modified"):
+        validators["If-Modified-Since"] = headers["Last-Modified"]
+    return validators
+
+
+class Fetcher:
+    """Get URL content with a persistent session reusing its connections,
+    shared by all threads. The session accepts no cookies, so no cookies
+    are kept between requests. The contents of
+    GET requests that have an ETag or Last-Modified header are kept in a
+    size-bounded LRU cache and revalidated with conditional requests, so a
+    page is only downloaded again when it changed."""
+
+    def __init__(self, maxpages=MaxCachedPages, maxsize=MaxCacheSize):
+        """Initialize an empty cache; the session is created when needed."""
+        self.maxpages = maxpages
+        self.maxsize = maxsize
+        self.session = None
+        self.lock = threading.Lock()
+        # (text, headers, validators) by (url, user)
+        self.cache = OrderedDict()
+        # total length of the cached texts
+        self.size = 0
+
+    def get_session(self):
+        """Return the session rejecting all cookies, created with the
+        LinkChecker user agent."""
+        from linkcheck import configuration
+
+        with self.lock:
+            if self.session is None:
+                self.session = requests.Session()
+                self.session.headers["User-Agent"] = configuration.UserAgent
+                self.session.verify = get_cert_file() or True
+                self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            return self.session
+
+    def get_cached(self, key):
+        """Return the cache entry of given key as most recently used, or
+        None."""
+        with self.lock:
+            entry = self.cache.get(key)
+            if entry is not None:
+                self.cache.move_to_end(key)
+            return entry
+
+    def add_cached(self, key, text, headers, validators):
+        """Cache given response, removing the least recently used entries
+        if the cache is too big."""
+        with self.lock:
+            self.remove_cached(key)
+            if len(text) > self.maxsize:
+                return
+            self.cache[key] = (text, headers, validators)
+            self.size += len(text)
+            while len(self.cache) > self.maxpages or self.size > self.maxsize:
+                self.remove_cached(next(iter(self.cache)))
+
+    def remove_cached(self, key):
+        """Remove entry of given key if it is cached. The lock must be
+        held."""
+        entry = self.cache.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry[0])
+
+    def clear(self):
+        """Remove all cached pages."""
+        with self.lock:
+            self.cache.clear()
+            self.size = 0
+
+    def get_content(self, url, user=None, password=None, data=None, addheaders=None,
+                    timeout=None, receive=None):
+        """Get URL content and info, see get_content()."""
+        headers = dict(addheaders or {})
+        method = 'GET'
+        kwargs = dict(headers=headers, timeout=timeout, stream=receive is not None)
+        if user and password:
+            kwargs['auth'] = (user, password)
+        if data:
+            kwargs['data'] = data
+            method = 'POST'
+        # responses depend on extra headers, so only plain GETs are cached
+        key = (url, user) if method == 'GET' and not addheaders else None
+        entry = self.get_cached(key) if key is not None else None
+        if entry is not None:
+            headers.update(entry[2])
+        try:
+            response = self.get_session().request(method, url, **kwargs)
+            if entry is not None and response.status_code == 304:
+                response.close()
+                if receive is not None:
+                    receive(entry[0])
+                return entry[0], entry[1]
+            if receive is None:
+                text = response.text
+            else:
+                text = read_text(response, receive)
+                if text is None:
+                    return None, "canceled"
+        except (
+            requests.exceptions.RequestException,
+            requests.exceptions.BaseHTTPError,
+        ) as msg:
+            log.warn(
+                LOG_CHECK,
+                ("Could not get content of URL %(url)s: %(msg)s.")
+                % {"url": url, "msg": str(msg)},
+            )
+            return None, str(msg)
+        if key is not None:
+            validators = get_validators(response.headers)
+            if validators and response.status_code == 200:
+                self.add_cached(key, text, response.headers, validators)
+            else:
+                with self.lock:
+                    self.remove_cached(key)
+        return text, response.headers
+
+
+def read_text(response, receive):
+    """Return decoded text of given streamed response, passing each part
+    to given function while it is downloaded, or None if the function
+    returned False. Like response.text, content without a declared
+    encoding is decoded with the encoding guessed from the whole content,
+    so it is downloaded before the first part is passed on."""
+    if response.encoding is None:
+        response.encoding = response.apparent_encoding
+    parts = []
+    for part in response.iter_content(StreamChunkSize, decode_unicode=True):
+        parts.append(part)
+        if receive(part) is False:
+            response.close()
+            return None
+    return "".join(parts)
+
+
+# fetcher shared by all get_content() calls
+fetcher = Fetcher()
+
+
+def get_content(url, user=None, password=None, data=None, addheaders=None,
+                timeout=None, receive=None):
+    """Get URL content and info. Connecting and each read wait at most
+    timeout seconds. If a receive function is given, the decoded content
+    is passed to it in parts while it is downloaded, and downloading is
+    canceled when it returns False.
+
+    @return: (decoded text content of URL, headers) or
+             (None, errmsg) on error.
+    @rtype: tuple (String, dict) or (None, String)
+    """
+    return fetcher.get_content(
+        url, user=user, password=password, data=data, addheaders=addheaders,
+        timeout=timeout, receive=receive)
@@ -0,0 +1,78 @@
+# Form implementation generated from reading ui file 'ui/dashboard.ui'
+#
+# Created by: PyQt6 UI code generator 6.6.1
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Dashboard(object):
+    def setupUi(self, Dashboard):
+        Dashboard.setObjectName("Dashboard")
+        Dashboard.resize(360, 420)
+        self.dockWidgetContents = QtWidgets.QWidget()
+        self.dockWidgetContents.setObjectName("dockWidgetContents")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.dockWidgetContents)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.formLayout = QtWidgets.QFormLayout()
+        self.formLayout.setObjectName("formLayout")
+        self.label_1 = QtWidgets.QLabel(parent=self.dockWidgetContents)
+        self.label_1.setObjectName("label_1")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_1)
+        self.label_urlrate = QtWidgets.QLabel(parent=self.dockWidgetContents)
+        self.label_urlrate.setText("-")
+        self.label_urlrate.setObjectName("label_urlrate")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.ItemRole.FieldRole, self.label_urlrate)
+        self.label_2 = QtWidgets.QLabel(parent=self.dockWidgetContents)
+        self.label_2.setObjectName("label_2")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_2)
+        self.label_byterate = QtWidgets.QLabel(parent=self.dockWidgetContents)
+        self.label_byterate.setText("-")
+        self.label_byterate.setObjectName("label_byterate")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.ItemRole.FieldRole, self.label_byterate)
+        self.label_3 = QtWidgets.QLabel(parent=self.dockWidgetContents)
+        self.label_3.setObjectName("label_3")
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_3)
+        self.label_checktime = QtWidgets.QLabel(parent=self.dockWidgetContents)
+        self.label_checktime.setText("-")
+        self.label_checktime.setObjectName("label_checktime")
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.ItemRole.FieldRole, self.label_checktime)
+        self.label_4 = QtWidgets.QLabel(parent=self.dockWidgetContents)
+        self.label_4.setObjectName("label_4")
+        self.formLayout.setWidget(3, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_4)
+        self.label_dltime = QtWidgets.QLabel(parent=self.dockWidgetContents)
+        self.label_dltime.setText("-")
+        self.label_dltime.setObjectName("label_dltime")
+        self.formLayout.setWidget(3, QtWidgets.QFormLayout.ItemRole.FieldRole, self.label_dltime)
+        self.verticalLayout.addLayout(self.formLayout)
+        self.label_5 = QtWidgets.QLabel(parent=self.dockWidgetContents)
+        self.label_5.setObjectName("label_5")
+        self.verticalLayout.addWidget(self.label_5)
+        self.hosts = QtWidgets.QTreeWidget(parent=self.dockWidgetContents)
+        self.hosts.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.hosts.setRootIsDecorated(False)
+        self.hosts.setUniformRowHeights(True)
+        self.hosts.setObjectName("hosts")
+        self.verticalLayout.addWidget(self.hosts)
+        Dashboard.setWidget(self.dockWidgetContents)
+
+        self.retranslateUi(Dashboard)
+        QtCore.QMetaObject.connectSlotsByName(Dashboard)
+
+    def retranslateUi(self, Dashboard):
+        _translate = QtCore.QCoreApplication.translate
+        Dashboard.setWindowTitle(_translate("Dashboard", "Dashboard"))
+        self.label_1.setText(_translate("Dashboard", "URLs/s"))
+        self.label_2.setText(_translate("Dashboard", "Download rate"))
+        self.label_3.setToolTip(_translate("Dashboard", "Median, 95th and 99th percentile"))
+        self.label_3.setText(_translate("Dashboard", "Check time"))
+        self.label_4.setToolTip(_translate("Dashboard", "Median, 95th and 99th percentile"))
+        self.label_4.setText(_translate("Dashboard", "Download time"))
+        self.label_5.setText(_translate("Dashboard", "Slowest hosts"))
+        self.hosts.headerItem().setText(0, _translate("Dashboard", "Host"))
+        self.hosts.headerItem().setText(1, _translate("Dashboard", "URLs"))
+        self.hosts.headerItem().setText(2, _translate("Dashboard", "Mean"))
+        self.hosts.headerItem().setText(3, _translate("Dashboard", "Max"))
@@ -81,6 +81,20 @@ class Ui_MainWindow(object):
         self.label_checked.setMinimumSize(QtCore.QSize(50, 0))
         self.label_checked.setObjectName("label_checked")
         self.horizontalLayout_4.addWidget(self.label_checked)
+        self.label_33 = QtWidgets.QLabel(parent=self.centralwidget)
+        self.label_33.setObjectName("label_33")
+        self.horizontalLayout_4.addWidget(self.label_33)
+        self.label_rate = QtWidgets.QLabel(parent=self.centralwidget)
+        self.label_rate.setMinimumSize(QtCore.QSize(40, 0))
+        self.label_rate.setObjectName("label_rate")
+        self.horizontalLayout_4.addWidget(self.label_rate)
+        self.label_34 = QtWidgets.QLabel(parent=self.centralwidget)
+        self.label_34.setObjectName("label_34")
+        self.horizontalLayout_4.addWidget(self.label_34)
+        self.label_eta = QtWidgets.QLabel(parent=self.centralwidget)
+        self.label_eta.setMinimumSize(QtCore.QSize(60, 0))
+        self.label_eta.setObjectName("label_eta")
+        self.horizontalLayout_4.addWidget(self.label_eta)
         self.label_15 = QtWidgets.QLabel(parent=self.centralwidget)
         self.label_15.setObjectName("label_15")
         self.horizontalLayout_4.addWidget(self.label_15)
@@ -103,6 +117,29 @@ class Ui_MainWindow(object):
         self.label_status.setObjectName("label_status")
         self.horizontalLayout_4.addWidget(self.label_status)
         self.verticalLayout.addLayout(self.horizontalLayout_4)
+        self.filterLayout = QtWidgets.QHBoxLayout()
+        self.filterLayout.setObjectName("filterLayout")
+        self.label_filter = QtWidgets.QLabel(parent=self.centralwidget)
+        self.label_filter.setObjectName("label_filter")
+        self.filterLayout.addWidget(self.label_filter)
+        self.filtertext = QtWidgets.QLineEdit(parent=self.centralwidget)
+        self.filtertext.setClearButtonEnabled(True)
+        self.filtertext.setObjectName("filtertext")
+        self.filterLayout.addWidget(self.filtertext)
+        self.filterstatus = QtWidgets.QComboBox(parent=self.centralwidget)
+        self.filterstatus.setObjectName("filterstatus")
+        self.filterLayout.addWidget(self.filterstatus)
+        self.filterhost = QtWidgets.QLineEdit(parent=self.centralwidget)
+        self.filterhost.setMaximumSize(QtCore.QSize(200, 16777215))
+        self.filterhost.setClearButtonEnabled(True)
+        self.filterhost.setObjectName("filterhost")
+        self.filterLayout.addWidget(self.filterhost)
+        self.filtertype = QtWidgets.QLineEdit(parent=self.centralwidget)
+        self.filtertype.setMaximumSize(QtCore.QSize(160, 16777215))
+        self.filtertype.setClearButtonEnabled(True)
+        self.filtertype.setObjectName("filtertype")
+        self.filterLayout.addWidget(self.filtertype)
+        self.verticalLayout.addLayout(self.filterLayout)
         self.treeView = QtWidgets.QTreeView(parent=self.centralwidget)
         self.treeView.setContextMenuPolicy(QtCore.Qt.ContextMenuPolicy.CustomContextMenu)
         self.treeView.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
@@ -683,6 +720,8 @@ class Ui_MainWindow(object):
         self.menuEdit.setObjectName("menuEdit")
         self.menuFile = QtWidgets.QMenu(parent=self.menubar)
         self.menuFile.setObjectName("menuFile")
+        self.menuView = QtWidgets.QMenu(parent=self.menubar)
+        self.menuView.setObjectName("menuView")
         self.menuHelp = QtWidgets.QMenu(parent=self.menubar)
         self.menuHelp.setObjectName("menuHelp")
         MainWindow.setMenuBar(self.menubar)
@@ -738,16 +777,47 @@ class Ui_MainWindow(object):
         self.actionOpen_project.setObjectName("actionOpen_project")
         self.actionSave_project = QtGui.QAction(parent=MainWindow)
         self.actionSave_project.setObjectName("actionSave_project")
+        self.actionStreamResults = QtGui.QAction(parent=MainWindow)
+        self.actionStreamResults.setCheckable(True)
+        self.actionStreamResults.setObjectName("actionStreamResults")
+        self.actionOpenDatabase = QtGui.QAction(parent=MainWindow)
+        self.actionOpenDatabase.setObjectName("actionOpenDatabase")
+        self.actionCompareDatabase = QtGui.QAction(parent=MainWindow)
+        self.actionCompareDatabase.setObjectName("actionCompareDatabase")
+        self.actionSaveDatabase = QtGui.QAction(parent=MainWindow)
+        self.actionSaveDatabase.setObjectName("actionSaveDatabase")
+        self.actionWriteDatabase = QtGui.QAction(parent=MainWindow)
+        self.actionWriteDatabase.setCheckable(True)
+        self.actionWriteDatabase.setObjectName("actionWriteDatabase")
+        self.actionResume = QtGui.QAction(parent=MainWindow)
+        self.actionResume.setEnabled(False)
+        self.actionResume.setObjectName("actionResume")
+        self.actionRecheck = QtGui.QAction(parent=MainWindow)
+        self.actionRecheck.setObjectName("actionRecheck")
+        self.actionGroupByParent = QtGui.QAction(parent=MainWindow)
+        self.actionGroupByParent.setCheckable(True)
+        self.actionGroupByParent.setObjectName("actionGroupByParent")
         self.menuEdit.addAction(self.actionOptions)
         self.menuFile.addAction(self.actionOpen_project)
         self.menuFile.addAction(self.actionSave_project)
         self.menuFile.addAction(self.actionSave)
+        self.menuFile.addAction(self.actionStreamResults)
+        self.menuFile.addSeparator()
+        self.menuFile.addAction(self.actionOpenDatabase)
+        self.menuFile.addAction(self.actionSaveDatabase)
+        self.menuFile.addAction(self.actionWriteDatabase)
+        self.menuFile.addAction(self.actionCompareDatabase)
+        self.menuFile.addSeparator()
+        self.menuFile.addAction(self.actionResume)
+        self.menuFile.addAction(self.actionRecheck)
         self.menuFile.addAction(self.actionQuit)
+        self.menuView.addAction(self.actionGroupByParent)
         self.menuHelp.addAction(self.actionAbout)
         self.menuHelp.addAction(self.actionHelp)
         self.menuHelp.addAction(self.actionDebug)
         self.menubar.addAction(self.menuFile.menuAction())
         self.menubar.addAction(self.menuEdit.menuAction())
+        self.menubar.addAction(self.menuView.menuAction())
         self.menubar.addAction(self.menuHelp.menuAction())
         self.label.setBuddy(self.urlinput)
 
@@ -767,8 +837,22 @@ class Ui_MainWindow(object):
         self.label_queued.setText(_translate("MainWindow", "0"))
         self.label_28.setText(_translate("MainWindow", "checked"))
         self.label_checked.setText(_translate("MainWindow", "0"))
+        self.label_33.setText(_translate("MainWindow", "URLs/s"))
+        self.label_rate.setToolTip(_translate("MainWindow", "Checked URLs per second"))
+        self.label_rate.setText(_translate("MainWindow", "-"))
+        self.label_34.setText(_translate("MainWindow", "remaining"))
+        self.label_eta.setToolTip(_translate("MainWindow", "Estimated time until the queued URLs are checked"))
+        self.label_eta.setText(_translate("MainWindow", "-"))
         self.label_15.setText(_translate("MainWindow", "Info:"))
         self.label_busy.setText(_translate("MainWindow", "-"))
+        self.label_filter.setText(_translate("MainWindow", "Filter:"))
+        self.filtertext.setToolTip(_translate("MainWindow", "Show URLs whose URL, name, parent URL, result or warnings contain this text."))
+        self.filtertext.setPlaceholderText(_translate("MainWindow", "Search results"))
+        self.filterstatus.setToolTip(_translate("MainWindow", "Show URLs with this check result."))
+        self.filterhost.setToolTip(_translate("MainWindow", "Show URLs of this host and its subdomains."))
+        self.filterhost.setPlaceholderText(_translate("MainWindow", "Host"))
+        self.filtertype.setToolTip(_translate("MainWindow", "Show URLs whose content type starts with this text, eg. image."))
+        self.filtertype.setPlaceholderText(_translate("MainWindow", "Content type"))
         self.url_properties.setTitle(_translate("MainWindow", "URL properties"))
         self.label_2.setText(_translate("MainWindow", "URL"))
         self.label_3.setText(_translate("MainWindow", "Name"))
@@ -799,6 +883,7 @@ class Ui_MainWindow(object):
         self.label_19.setText(_translate("MainWindow", "Max. length"))
         self.menuEdit.setTitle(_translate("MainWindow", "&Edit"))
         self.menuFile.setTitle(_translate("MainWindow", "&File"))
+        self.menuView.setTitle(_translate("MainWindow", "&View"))
         self.menuHelp.setTitle(_translate("MainWindow", "&Help"))
         self.actionAbout.setText(_translate("MainWindow", "A&bout"))
         self.actionAbout.setIconText(_translate("MainWindow", "About"))
@@ -826,4 +911,20 @@ class Ui_MainWindow(object):
         self.actionOpen_project.setShortcut(_translate("MainWindow", "Ctrl+O"))
         self.actionSave_project.setText(_translate("MainWindow", "&Save project..."))
         self.actionSave_project.setShortcut(_translate("MainWindow", "Ctrl+S"))
+        self.actionStreamResults.setText(_translate("MainWindow", "Write results &while checking..."))
+        self.actionStreamResults.setToolTip(_translate("MainWindow", "Write results to a file while checking"))
+        self.actionOpenDatabase.setText(_translate("MainWindow", "Open results data&base..."))
+        self.actionOpenDatabase.setToolTip(_translate("MainWindow", "Show the results stored in a results database"))
+        self.actionCompareDatabase.setText(_translate("MainWindow", "&Compare with results database..."))
+        self.actionCompareDatabase.setToolTip(_translate("MainWindow", "Show new errors, fixed errors and slower URLs compared to the results stored in a results database"))
+        self.actionSaveDatabase.setText(_translate("MainWindow", "Save results &database..."))
+        self.actionSaveDatabase.setToolTip(_translate("MainWindow", "Save the check results in a results database"))
+        self.actionWriteDatabase.setText(_translate("MainWindow", "Write results to database while chec&king..."))
+        self.actionWriteDatabase.setToolTip(_translate("MainWindow", "Write results to a results database while checking"))
+        self.actionResume.setText(_translate("MainWindow", "&Resume check"))
+        self.actionResume.setToolTip(_translate("MainWindow", "Resume the last unfinished check"))
+        self.actionRecheck.setText(_translate("MainWindow", "Re&check changed and failed URLs"))
+        self.actionRecheck.setToolTip(_translate("MainWindow", "Check the URL again, skipping the valid URLs of the last finished check that have no links"))
+        self.actionGroupByParent.setText(_translate("MainWindow", "&Group by parent URL"))
+        self.actionGroupByParent.setToolTip(_translate("MainWindow", "Show checked URLs grouped under their parent URL"))
 from .lineedit import LineEdit
@@ -12,8 +12,8 @@ from PyQt6 import QtCore, QtGui, QtWidgets
 class Ui_Options(object):
     def setupUi(self, Options):
         Options.setObjectName("Options")
-        Options.resize(455, 570)
-        Options.setMinimumSize(QtCore.QSize(400, 570))
+        Options.resize(455, 660)
+        Options.setMinimumSize(QtCore.QSize(400, 660))
         self.verticalLayout_3 = QtWidgets.QVBoxLayout(Options)
         self.verticalLayout_3.setObjectName("verticalLayout_3")
         self.groupBox_2 = QtWidgets.QGroupBox(parent=Options)
@@ -55,6 +55,50 @@ class Ui_Options(object):
         self.debug.setText("")
         self.debug.setObjectName("debug")
         self.formLayout.setWidget(2, QtWidgets.QFormLayout.ItemRole.FieldRole, self.debug)
+        self.label_7 = QtWidgets.QLabel(parent=self.widget)
+        self.label_7.setObjectName("label_7")
+        self.formLayout.setWidget(3, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_7)
+        self.batchsize = QtWidgets.QSpinBox(parent=self.widget)
+        self.batchsize.setMinimumSize(QtCore.QSize(0, 25))
+        self.batchsize.setMinimum(1)
+        self.batchsize.setMaximum(10000)
+        self.batchsize.setProperty("value", 100)
+        self.batchsize.setObjectName("batchsize")
+        self.formLayout.setWidget(3, QtWidgets.QFormLayout.ItemRole.FieldRole, self.batchsize)
+        self.label_8 = QtWidgets.QLabel(parent=self.widget)
+        self.label_8.setObjectName("label_8")
+        self.formLayout.setWidget(4, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_8)
+        self.batchinterval = QtWidgets.QSpinBox(parent=self.widget)
+        self.batchinterval.setMinimumSize(QtCore.QSize(0, 25))
+        self.batchinterval.setMinimum(10)
+        self.batchinterval.setMaximum(5000)
+        self.batchinterval.setProperty("value", 200)
+        self.batchinterval.setObjectName("batchinterval")
+        self.formLayout.setWidget(4, QtWidgets.QFormLayout.ItemRole.FieldRole, self.batchinterval)
+        self.label_9 = QtWidgets.QLabel(parent=self.widget)
+        self.label_9.setObjectName("label_9")
+        self.formLayout.setWidget(5, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_9)
+        self.statusinterval = QtWidgets.QSpinBox(parent=self.widget)
+        self.statusinterval.setMinimumSize(QtCore.QSize(0, 25))
+        self.statusinterval.setMinimum(1)
+        self.statusinterval.setMaximum(60)
+        self.statusinterval.setProperty("value", 1)
+        self.statusinterval.setObjectName("statusinterval")
+        self.formLayout.setWidget(5, QtWidgets.QFormLayout.ItemRole.FieldRole, self.statusinterval)
+        self.label_10 = QtWidgets.QLabel(parent=self.widget)
+        self.label_10.setObjectName("label_10")
+        self.formLayout.setWidget(6, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_10)
+        self.checkprocess = QtWidgets.QCheckBox(parent=self.widget)
+        self.checkprocess.setText("")
+        self.checkprocess.setObjectName("checkprocess")
+        self.formLayout.setWidget(6, QtWidgets.QFormLayout.ItemRole.FieldRole, self.checkprocess)
+        self.label_11 = QtWidgets.QLabel(parent=self.widget)
+        self.label_11.setObjectName("label_11")
+        self.formLayout.setWidget(7, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_11)
+        self.contentcache = QtWidgets.QCheckBox(parent=self.widget)
+        self.contentcache.setText("")
+        self.contentcache.setObjectName("contentcache")
+        self.formLayout.setWidget(7, QtWidgets.QFormLayout.ItemRole.FieldRole, self.contentcache)
         self.verticalLayout.addWidget(self.widget)
         spacerItem = QtWidgets.QSpacerItem(20, 10, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
         self.verticalLayout.addItem(spacerItem)
@@ -129,6 +173,23 @@ class Ui_Options(object):
         self.label_2.setText(_translate("Options", "Verbose output"))
         self.verbose.setToolTip(_translate("Options", "Log all checked URLs once. Default is to log only errors and warnings."))
         self.label_4.setText(_translate("Options", "Debug"))
+        self.label_7.setToolTip(_translate("Options", "Number of checked URLs collected before they are added to the result list at once."))
+        self.label_7.setText(_translate("Options", "Result batch size"))
+        self.batchsize.setToolTip(_translate("Options", "Number of checked URLs collected before they are added to the result list at once."))
+        self.label_8.setToolTip(_translate("Options", "Maximum time checked URLs are held back before they are added to the result list."))
+        self.label_8.setText(_translate("Options", "Result batch interval"))
+        self.batchinterval.setToolTip(_translate("Options", "Maximum time checked URLs are held back before they are added to the result list."))
+        self.batchinterval.setSuffix(_translate("Options", " ms"))
+        self.label_9.setToolTip(_translate("Options", "Time between updates of the number of active, queued and checked links."))
+        self.label_9.setText(_translate("Options", "Status update interval"))
+        self.statusinterval.setToolTip(_translate("Options", "Time between updates of the number of active, queued and checked links."))
+        self.statusinterval.setSuffix(_translate("Options", " s"))
+        self.label_10.setToolTip(_translate("Options", "Check in a separate process, so parsing pages does not slow down the user interface. Not used for URL list files."))
+        self.label_10.setText(_translate("Options", "Check in separate process"))
+        self.checkprocess.setToolTip(_translate("Options", "Check in a separate process, so parsing pages does not slow down the user interface. Not used for URL list files."))
+        self.label_11.setToolTip(_translate("Options", "Keep the pages parsed by the checker, so viewing the source of a parent URL does not download it again. Not used when checking in a separate process."))
+        self.label_11.setText(_translate("Options", "Cache page sources"))
+        self.contentcache.setToolTip(_translate("Options", "Keep the pages parsed by the checker, so viewing the source of a parent URL does not download it again. Not used when checking in a separate process."))
         self.label_5.setText(_translate("Options", "Warn when one of these strings are found (one per line):"))
         self.label_6.setText(_translate("Options", "Ignore URLs matching one of these patterns (one per line):"))
         self.groupBox.setTitle(_translate("Options", "Configuration file"))
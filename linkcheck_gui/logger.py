@@ -15,8 +15,14 @@
 # 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 
 from logging import Handler
+import threading
 from linkcheck.logger import _Logger
 
+# default number of URLs emitted at once to the GUI
+DefaultBatchSize = 100
+# default maximum delay in seconds before buffered URLs are emitted
+DefaultBatchInterval = 0.2
+
 
 class GuiLogHandler(Handler):
     """Delegate log messages to the UI."""
@@ -32,7 +38,16 @@ class GuiLogHandler(Handler):
 
 
 class SignalLogger(_Logger):
-    """Use Qt signals for logged URLs and statistics."""
+    """Use Qt signals for logged URLs and statistics.
+
+    Logged URLs are collected in a buffer and emitted as a list, either
+    when the buffer holds batchsize entries or when batchinterval seconds
+    have passed since the first buffered entry. This keeps the number of
+    queued signals and model updates in the GUI thread low.
+
+    If a CheckStats or CheckHistory object is given, every
+    checked URL is added to it, including URLs that are not shown.
+    """
 
     LoggerName = "gui"
 
@@ -41,6 +56,13 @@ class SignalLogger(_Logger):
         super().__init__(**args)
         self.log_url_signal = args["signal"]
         self.log_stats_signal = args["stats"]
+        self.batchsize = args.get("batchsize", DefaultBatchSize)
+        self.batchinterval = args.get("batchinterval", DefaultBatchInterval)
+        self.checkstats = args.get("checkstats")
+        self.history = args.get("history")
+        self.buffer = []
+        self.lock = threading.Lock()
+        self.timer = None
 
     def start_fileoutput(self):
         """Override fileoutput handling of base class."""
@@ -50,23 +72,94 @@ class SignalLogger(_Logger):
         """Override fileoutput handling of base class."""
         pass
 
+    def start_output(self):
+        """Discard URL data left over from a previous check."""
+        super().start_output()
+        with self.lock:
+            self.cancel_timer()
+            self.buffer = []
+        if self.checkstats is not None:
+            self.checkstats.clear()
+        if self.history is not None:
+            self.history.clear()
+
+    def log_filter_url(self, url_data, do_print):
+        """Add URL data to the live statistics and the history before
+        logging it."""
+        if self.checkstats is not None:
+            self.checkstats.add(url_data)
+        if self.history is not None:
+            self.history.add(url_data)
+        super().log_filter_url(url_data, do_print)
+
     def log_url(self, url_data):
-        """Emit URL data which gets logged in the main window."""
-        self.log_url_signal.emit(url_data)
+        """Buffer URL data which gets logged in the main window."""
+        with self.lock:
+            self.buffer.append(url_data)
+            if len(self.buffer) >= self.batchsize:
+                self.cancel_timer()
+                self.emit_buffer()
+            elif self.timer is None:
+                self.timer = threading.Timer(self.batchinterval, self.flush_urls)
+                self.timer.daemon = True
+                self.timer.start()
+
+    def flush_urls(self):
+        """Emit all buffered URL data."""
+        with self.lock:
+            self.cancel_timer()
+            self.emit_buffer()
+
+    def emit_buffer(self):
+        """Emit buffered URL data as one list. The lock must be held."""
+        if self.buffer:
+            urls, self.buffer = self.buffer, []
+            self.log_url_signal.emit(urls)
+
+    def cancel_timer(self):
+        """Stop a pending flush timer. The lock must be held."""
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
 
     def end_output(self, **kwargs):
-        """Emit statistic data which gets logged in the main window."""
+        """Emit remaining URL data and the statistic data which gets logged
+        in the main window."""
+        self.flush_urls()
         self.stats.downloaded_bytes = kwargs.get("downloaded_bytes")
         self.log_stats_signal.emit(self.stats)
 
 
 class StatusLogger:
-    """GUI status logger, signaling to progress labels."""
+    """GUI status logger keeping the latest status for the progress labels.
 
-    def __init__(self, signal):
-        """Store given signal object."""
-        self.signal = signal
+    The status is logged from the linkchecker status thread. Only the
+    latest status is kept, and the main window shows it on a timer, so
+    the progress labels are updated at a fixed rate.
+    """
+
+    def __init__(self):
+        """Initialize without status."""
+        self.lock = threading.Lock()
+        self.status = None
 
     def log_status(self, checked, in_progress, queued, duration, num_urls):
-        """Emit signal with given status information."""
-        self.signal.emit(checked, in_progress, queued, duration, num_urls)
+        """Store given status information, replacing older status."""
+        with self.lock:
+            self.status = (checked, in_progress, queued, duration, num_urls)
+
+    def get_status(self):
+        """Return and clear the latest status, or None if no status has
+        been logged since the last call."""
+        with self.lock:
+            status, self.status = self.status, None
+        return status
+
+
+def get_progress(checked, in_progress, queued, duration):
+    """Return checked URLs per second and estimated seconds until the
+    active and queued URLs are checked, or None if unknown."""
+    if duration <= 0 or not checked:
+        return 0.0, None
+    rate = checked / duration
+    return rate, (in_progress + queued) / rate
@@ -47,6 +47,11 @@ class LinkCheckerOptions(QtWidgets.QDialog, Ui_Options):
         self.debug.setChecked(False)
         self.warninglines.setPlainText("")
         self.ignorelines.setPlainText("")
+        self.batchsize.setValue(100)
+        self.batchinterval.setValue(200)
+        self.statusinterval.setValue(1)
+        self.checkprocess.setChecked(False)
+        self.contentcache.setChecked(True)
 
     def reset_config_options(self):
         """Reset configuration file edit buttons."""
@@ -70,6 +75,11 @@ class LinkCheckerOptions(QtWidgets.QDialog, Ui_Options):
             recursionlevel=self.recursionlevel.value(),
             warninglines=self.warninglines.toPlainText(),
             ignorelines=self.ignorelines.toPlainText(),
+            batchsize=self.batchsize.value(),
+            batchinterval=self.batchinterval.value(),
+            statusinterval=self.statusinterval.value(),
+            checkprocess=self.checkprocess.isChecked(),
+            contentcache=self.contentcache.isChecked(),
         )
 
     def set_options(self, data):
@@ -84,6 +94,16 @@ class LinkCheckerOptions(QtWidgets.QDialog, Ui_Options):
             self.warninglines.setPlainText(data["warninglines"])
         if data.get("ignorelines") is not None:
             self.ignorelines.setPlainText(data["ignorelines"])
+        if data.get("batchsize") is not None:
+            self.batchsize.setValue(data["batchsize"])
+        if data.get("batchinterval") is not None:
+            self.batchinterval.setValue(data["batchinterval"])
+        if data.get("statusinterval") is not None:
+            self.statusinterval.setValue(data["statusinterval"])
+        if data.get("checkprocess") is not None:
+            self.checkprocess.setChecked(data["checkprocess"])
+        if data.get("contentcache") is not None:
+            self.contentcache.setChecked(data["contentcache"])
 
 
 def start_editor(filename, writable, editor):
@@ -72,6 +72,21 @@ class ProjectParser(confparse.LCConfigParser):
         option = "ignorelines"
         if self.has_option(section, option):
             data[option] = self.get(section, option)
+        option = "batchsize"
+        if self.has_option(section, option):
+            data[option] = self.getint(section, option)
+        option = "batchinterval"
+        if self.has_option(section, option):
+            data[option] = self.getint(section, option)
+        option = "statusinterval"
+        if self.has_option(section, option):
+            data[option] = self.getint(section, option)
+        option = "checkprocess"
+        if self.has_option(section, option):
+            data[option] = self.getboolean(section, option)
+        option = "contentcache"
+        if self.has_option(section, option):
+            data[option] = self.getboolean(section, option)
         self.gui_options.set_options(data)
 
     def write(self, fp):
@@ -0,0 +1,393 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+Store check results and unchecked URLs in an SQLite database.
+"""
+import datetime
+import json
+import operator
+import sqlite3
+
+from linkcheck.checker.urlbase import CompactUrlData, urlDataAttr
+
+from .urlindex import StatusError, StatusValid, StatusWarning
+
+# attributes stored as JSON text
+JsonAttrs = frozenset(("extern", "warnings", "info"))
+
+# attributes of queued URLs needed to create them again
+QueueAttrs = (
+    "cache_url",
+    "base_url",
+    "recursion_level",
+    "parent_url",
+    "base_ref",
+    "line",
+    "column",
+    "page",
+    "name",
+    "extern",
+)
+
+# attributes of all checked URLs, logged or not, used by incremental checks
+HistoryAttrs = (
+    "url",
+    "cache_url",
+    "valid",
+    "warning",
+    "modified",
+    "size",
+    "parent_url",
+    "checked",
+)
+
+# ORDER BY terms of the URL tree columns, see UrlStore.sort_keys()
+SortColumns = (
+    ("parent_url", "line", '"column"'),
+    ("url",),
+    ("name",),
+    ("valid", "result"),
+)
+
+# SQL conditions of the status filter values
+StatusConditions = {
+    StatusValid: "(valid AND warnings = '[]')",
+    StatusWarning: "(valid AND warnings != '[]')",
+    StatusError: "NOT valid",
+}
+
+Schema = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS results (id INTEGER PRIMARY KEY, %s);
+CREATE TABLE IF NOT EXISTS queue (id INTEGER PRIMARY KEY, %s);
+CREATE TABLE IF NOT EXISTS history (id INTEGER PRIMARY KEY, %s);
+""" % (
+    ", ".join('"%s"' % attr for attr in urlDataAttr),
+    ", ".join('"%s"' % attr for attr in QueueAttrs),
+    ", ".join(HistoryAttrs),
+) + "".join(
+    "CREATE INDEX IF NOT EXISTS results_sort%d ON results (%s, id);\n"
+    % (column, ", ".join(terms)) for column, terms in enumerate(SortColumns)
+)
+
+ResultColumns = ", ".join('"%s"' % attr for attr in urlDataAttr)
+
+get_values = operator.attrgetter(*urlDataAttr)
+json_dumps = json.JSONEncoder(ensure_ascii=False).encode
+# positions of JSON values and of the modification date in result rows
+JsonPositions = [pos for pos, attr in enumerate(urlDataAttr) if attr in JsonAttrs]
+ModifiedPosition = urlDataAttr.index("modified")
+
+
+def to_row(url_data):
+    """Return list of database values of given URL data."""
+    row = list(get_values(url_data))
+    for pos in JsonPositions:
+        value = row[pos]
+        # most results have no warnings and no info
+        row[pos] = "[]" if value == [] else json_dumps(value)
+    if row[ModifiedPosition] is not None:
+        row[ModifiedPosition] = row[ModifiedPosition].isoformat()
+    return row
+
+
+def from_row(row):
+    """Return CompactUrlData of given database values."""
+    data = dict(zip(urlDataAttr, row))
+    for attr in JsonAttrs:
+        value = data[attr]
+        value = [] if value == "[]" else json.loads(value)
+        if attr == "extern" and isinstance(value, list):
+            value = tuple(value)
+        elif attr == "warnings":
+            value = [tuple(warning) for warning in value]
+        data[attr] = value
+    if data["modified"] is not None:
+        data["modified"] = datetime.datetime.fromisoformat(data["modified"])
+    data["valid"] = bool(data["valid"])
+    return CompactUrlData(data)
+
+
+def escape_like(text):
+    """Escape LIKE wildcards of text with backslashes."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def get_filter(text="", status=None, host="", content_type=""):
+    """Return SQL WHERE condition and parameters selecting the results
+    that UrlFilterProxyModel.set_filter() shows for the same settings.
+    The text search ignores case only for ASCII letters."""
+    conditions = []
+    params = []
+    if status is not None and set(status) != set(StatusConditions):
+        conditions.append("(%s)" % (" OR ".join(
+            StatusConditions[value] for value in sorted(status)) or "0"))
+    host = host.strip().lower()
+    if host:
+        conditions.append(
+            "(lower(domain) = ? OR lower(domain) LIKE ? ESCAPE '\\'"
+            " OR lower(domain) LIKE ? ESCAPE '\\' OR lower(domain) LIKE ? ESCAPE '\\')")
+        host = escape_like(host)
+        params.extend((host, "%." + host, host + ":%", "%." + host + ":%"))
+    content_type = content_type.strip().lower()
+    if content_type:
+        conditions.append("lower(content_type) LIKE ? ESCAPE '\\'")
+        params.append(escape_like(content_type) + "%")
+    if text:
+        pattern = "%" + escape_like(text) + "%"
+        conditions.append("(%s)" % " OR ".join(
+            "%s LIKE ? ESCAPE '\\'" % attr
+            for attr in ("url", "name", "parent_url", "result", "warnings")))
+        params.extend([pattern] * 5)
+    if not conditions:
+        return "", ()
+    return "WHERE " + " AND ".join(conditions), tuple(params)
+
+
+def get_sort_terms(column):
+    """Return tuple of ORDER BY terms of given URL tree column, ending
+    with the unique result id."""
+    if column is None:
+        return ("id",)
+    return SortColumns[column] + ("id",)
+
+
+def get_order(column, descending=False):
+    """Return SQL ORDER BY clause of given URL tree column, or the order
+    the results were added for column None."""
+    direction = " DESC" if descending else ""
+    return "ORDER BY " + ", ".join(
+        term + direction for term in get_sort_terms(column))
+
+
+def get_after(column, key, descending=False):
+    """Return list of SQL conditions and parameters selecting, one after
+    the other, the results that come after the result with given sort key
+    in the order of get_order(). The key is the tuple of values of
+    get_sort_terms(). NULL values sort before all other values, like in
+    SQLite, and the result id is never NULL. Each condition starts with a
+    range of the first sort term, so SQLite reads it from the sort index
+    without sorting."""
+    first, *terms = get_sort_terms(column)
+    value = key[0]
+    rest, rest_params = get_rest_after(terms, key[1:], descending)
+    if value is None:
+        conditions = [("%s IS NULL AND %s" % (first, rest), rest_params)]
+        if not descending:
+            conditions.append(("%s IS NOT NULL" % first, ()))
+        return conditions
+    compare = "<" if descending else ">"
+    conditions = [("%s %s= ? AND (%s %s ? OR %s)" % (
+        first, compare, first, compare, rest),
+        (value, value) + rest_params)]
+    if descending and first != "id":
+        conditions.append(("%s IS NULL" % first, ()))
+    return conditions
+
+
+def get_rest_after(terms, key, descending):
+    """Return SQL condition and parameters selecting the results whose
+    values of given sort terms come after given values."""
+    alternatives = []
+    params = []
+    for pos, (term, value) in enumerate(zip(terms, key)):
+        if value is None:
+            if descending:
+                # nothing sorts after NULL in descending order
+                continue
+            condition = "%s IS NOT NULL" % term
+            values = ()
+        elif descending and term != "id":
+            condition = "(%s < ? OR %s IS NULL)" % (term, term)
+            values = (value,)
+        elif descending:
+            condition = "%s < ?" % term
+            values = (value,)
+        else:
+            condition = "%s > ?" % term
+            values = (value,)
+        alternatives.append(" AND ".join(
+            ["%s IS ?" % prev for prev in terms[:pos]] + [condition]))
+        params.extend(key[:pos])
+        params.extend(values)
+    if not alternatives:
+        return "0", ()
+    return "(%s)" % " OR ".join(alternatives), tuple(params)
+
+
+def add_after(where, params, column, descending, after):
+    """Return list of given SQL WHERE condition and parameters restricted
+    to the results after the result with given sort key, see
+    get_after()."""
+    if after is None:
+        return [(where, params)]
+    wheres = []
+    for condition, after_params in get_after(column, after, descending):
+        if where:
+            wheres.append(("%s AND %s" % (where, condition), params + after_params))
+        else:
+            wheres.append(("WHERE " + condition, after_params))
+    return wheres
+
+
+def to_queue_row(url_data):
+    """Return tuple of database values of a queued URL."""
+    row = [getattr(url_data, attr) for attr in QueueAttrs]
+    row[-1] = json.dumps(row[-1])
+    return tuple(row)
+
+
+def from_queue_row(row):
+    """Return dictionary of queued URL attributes of given database
+    values."""
+    data = dict(zip(QueueAttrs, row))
+    extern = json.loads(data["extern"])
+    data["extern"] = tuple(extern) if isinstance(extern, list) else extern
+    return data
+
+
+class ResultDB:
+    """SQLite database with check results, unchecked URLs and metadata
+    like the start URL of the check."""
+
+    def __init__(self, filename):
+        """Open or create the database."""
+        self.filename = filename
+        self.conn = sqlite3.connect(filename)
+        self.conn.executescript(Schema)
+        self.upgrade()
+
+    def upgrade(self):
+        """Add the history columns missing in databases of older
+        versions."""
+        columns = {row[1] for row in
+                   self.conn.execute("PRAGMA table_info(history)")}
+        with self.conn:
+            for attr in HistoryAttrs:
+                if attr not in columns:
+                    self.conn.execute("ALTER TABLE history ADD COLUMN %s" % attr)
+
+    def close(self):
+        """Close the database."""
+        self.conn.close()
+
+    def clear(self):
+        """Remove all results, queued URLs, history and metadata."""
+        with self.conn:
+            for table in ("meta", "results", "queue", "history"):
+                self.conn.execute("DELETE FROM %s" % table)
+
+    def get_meta(self, key, default=None):
+        """Return metadata value of given key."""
+        row = self.conn.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return default if row is None else row[0]
+
+    def set_meta(self, key, value):
+        """Store metadata value of given key."""
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                (key, value))
+
+    def count_results(self, where="", params=()):
+        """Return number of stored results matching given WHERE condition."""
+        sql = "SELECT COUNT(*) FROM results " + where
+        return self.conn.execute(sql, params).fetchone()[0]
+
+    def add_results(self, url_datas):
+        """Append given URL data in one transaction."""
+        sql = "INSERT INTO results (%s) VALUES (%s)" % (
+            ResultColumns, ", ".join("?" * len(urlDataAttr)))
+        with self.conn:
+            self.conn.executemany(sql, map(to_row, url_datas))
+
+    def get_results(self, where="", params=(), order="ORDER BY id"):
+        """Return list of stored URL data matching given WHERE condition
+        in given order, by default the order they were added."""
+        sql = "SELECT %s FROM results %s %s" % (ResultColumns, where, order)
+        return [from_row(row) for row in self.conn.execute(sql, params)]
+
+    def get_page(self, where, params, column, descending, after, limit):
+        """Return list of at most limit (URL data, sort key) tuples of the
+        stored results matching given WHERE condition in the order of given
+        column, starting after the result with given sort key, or at the
+        first result for key None."""
+        terms = get_sort_terms(column)
+        results = []
+        for where, params in add_after(where, params, column, descending, after):
+            if len(results) >= limit:
+                break
+            sql = "SELECT %s, %s FROM results %s %s LIMIT ?" % (
+                ResultColumns, ", ".join(terms), where,
+                get_order(column, descending))
+            rows = self.conn.execute(sql, params + (limit - len(results),))
+            results.extend((from_row(row[:-len(terms)]), row[-len(terms):])
+                           for row in rows)
+        return results
+
+    def iter_keys(self, where, params, column, descending, after):
+        """Return iterator of the sort keys of the stored results matching
+        given WHERE condition in the order of given column, starting after
+        the result with given sort key, or at the first result for key
+        None. Only the sort index is read."""
+        for where, params in add_after(where, params, column, descending, after):
+            sql = "SELECT %s FROM results %s %s" % (
+                ", ".join(get_sort_terms(column)), where,
+                get_order(column, descending))
+            yield from self.conn.execute(sql, params)
+
+    def iter_values(self, attrs):
+        """Return iterator of tuples of given attribute values of all
+        results in the order they were added, without creating URL data
+        objects."""
+        sql = "SELECT %s FROM results ORDER BY id" % ", ".join(
+            '"%s"' % attr for attr in attrs)
+        return self.conn.execute(sql)
+
+    def set_queue(self, url_datas):
+        """Replace the stored unchecked URLs with given URL objects."""
+        self.set_queue_rows(map(to_queue_row, url_datas))
+
+    def set_queue_rows(self, rows):
+        """Replace the stored unchecked URLs with given tuples of database
+        values, see to_queue_row()."""
+        sql = "INSERT INTO queue (%s) VALUES (%s)" % (
+            ", ".join('"%s"' % attr for attr in QueueAttrs),
+            ", ".join("?" * len(QueueAttrs)))
+        with self.conn:
+            self.conn.execute("DELETE FROM queue")
+            self.conn.executemany(sql, rows)
+
+    def get_queue(self):
+        """Return list of attribute dictionaries of the stored unchecked
+        URLs."""
+        sql = "SELECT %s FROM queue ORDER BY id" % ", ".join(
+            '"%s"' % attr for attr in QueueAttrs)
+        return [from_queue_row(row) for row in self.conn.execute(sql)]
+
+    def add_history(self, entries):
+        """Append given tuples of HistoryAttrs values of checked URLs."""
+        sql = "INSERT INTO history (%s) VALUES (%s)" % (
+            ", ".join(HistoryAttrs), ", ".join("?" * len(HistoryAttrs)))
+        with self.conn:
+            self.conn.executemany(sql, entries)
+
+    def get_history(self):
+        """Return list of tuples of HistoryAttrs values of the checked
+        URLs."""
+        sql = "SELECT %s FROM history ORDER BY id" % ", ".join(HistoryAttrs)
+        return self.conn.execute(sql).fetchall()
@@ -0,0 +1,284 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+Compare two result sets by URL.
+"""
+import collections
+import operator
+
+from linkcheck import strformat
+from PyQt6 import QtCore, QtWidgets
+
+from .urlmodel import EmptyQVariant
+
+# result attributes needed for comparisons; entries are plain tuples of
+# these values as returned by SQLite, use DiffEntry to access them by name
+DiffAttrs = ("url", "parent_url", "valid", "result", "checktime")
+
+DiffEntry = collections.namedtuple("DiffEntry", DiffAttrs)
+
+# change categories, in the order they are shown
+DiffNew = 0
+DiffFixed = 1
+DiffRegressed = 2
+DiffUnchanged = 3
+# an old error missing from new results which are not complete
+DiffNotRechecked = 4
+
+DiffCategories = [
+    _("New error"),
+    _("Fixed"),
+    _("Slower"),
+    _("Unchanged"),
+    _("Not rechecked"),
+]
+
+# category filter entries, by default all changes are shown
+DiffFilters = [
+    (_("All changes"), {DiffNew, DiffFixed, DiffRegressed, DiffNotRechecked}),
+    (_("New errors"), {DiffNew}),
+    (_("Fixed"), {DiffFixed}),
+    (_("Slower"), {DiffRegressed}),
+    (_("Not rechecked"), {DiffNotRechecked}),
+    (_("All URLs"), {DiffNew, DiffFixed, DiffRegressed, DiffUnchanged,
+                     DiffNotRechecked}),
+]
+
+DiffHeaders = [
+    _("Change"),
+    _("URL"),
+    _("Parent"),
+    _("Old result"),
+    _("New result"),
+    _("Old check time"),
+    _("New check time"),
+]
+
+# a check time regressed if it grew by this factor and by at least
+# this many seconds
+RegressionFactor = 1.5
+RegressionDelta = 0.5
+
+Diff = collections.namedtuple("Diff", ("category", "old", "new"))
+
+get_diff_entry = operator.attrgetter(*DiffAttrs)
+
+
+def get_entries(url_datas):
+    """Return iterator of entries of given URL data."""
+    return map(get_diff_entry, url_datas)
+
+
+def get_db_entries(db):
+    """Return iterator of entries of the results in given ResultDB."""
+    return db.iter_values(DiffAttrs)
+
+
+def is_regressed(old_checktime, new_checktime,
+                 factor=RegressionFactor, delta=RegressionDelta):
+    """Return True if the new check time is much longer than the old."""
+    if old_checktime is None or new_checktime is None:
+        return False
+    return (new_checktime >= old_checktime * factor
+            and new_checktime - old_checktime >= delta)
+
+
+def compare(old_entries, new_entries, complete=False):
+    """Return list of Diff objects of the new entries and of the old
+    errors that are gone. Entries are tuples of DiffAttrs values. The
+    entries are joined by URL with a hash table of the old entries, so
+    each entry is visited once.
+
+    A URL is an error of the old results if any of its entries is not
+    valid. Result sets usually contain only errors and warnings, so an
+    old error that is not in the new results counts as fixed if the new
+    results are complete, that is of a check that was not canceled. Else
+    the URL might not have been checked again and counts as not
+    rechecked."""
+    old = {}
+    for entry in old_entries:
+        url, valid = entry[0], entry[2]
+        known = old.get(url)
+        if known is None or (known[2] and not valid):
+            old[url] = entry
+    diffs = []
+    seen = set()
+    for entry in new_entries:
+        url, _parent_url, valid, _result, checktime = entry
+        seen.add(url)
+        previous = old.get(url)
+        failed = previous is not None and not previous[2]
+        if not valid:
+            category = DiffUnchanged if failed else DiffNew
+        elif failed:
+            category = DiffFixed
+        elif previous is not None and is_regressed(previous[4], checktime):
+            category = DiffRegressed
+        else:
+            category = DiffUnchanged
+        diffs.append(Diff(category, previous, entry))
+    gone = DiffFixed if complete else DiffNotRechecked
+    for url, entry in old.items():
+        if not entry[2] and url not in seen:
+            diffs.append(Diff(gone, entry, None))
+    return diffs
+
+
+def count_categories(diffs):
+    """Return list of the number of diffs of each category."""
+    counts = [0] * len(DiffCategories)
+    for diff in diffs:
+        counts[diff.category] += 1
+    return counts
+
+
+def format_checktime(entry):
+    """Format check time of given DiffEntry as milliseconds."""
+    if entry is None or entry.checktime is None:
+        return ""
+    return "%.0f ms" % (entry.checktime * 1000)
+
+
+class DiffModel(QtCore.QAbstractTableModel):
+    """Model of the compared results of the categories selected with
+    set_categories(). The sort role returns the category number and the
+    check times for a sorting proxy."""
+
+    def __init__(self, parent=None):
+        """Initialize an empty model."""
+        super().__init__(parent)
+        self.diffs = []
+        self.categories = DiffFilters[0][1]
+        # shown Diff objects
+        self.rows = []
+
+    def set_diffs(self, diffs):
+        """Show given list of Diff objects."""
+        self.beginResetModel()
+        self.diffs = diffs
+        self.rows = [diff for diff in diffs if diff.category in self.categories]
+        self.endResetModel()
+
+    def set_categories(self, categories):
+        """Show only the diffs of given categories."""
+        self.categories = categories
+        self.set_diffs(self.diffs)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """Return number of shown diffs."""
+        if parent.isValid():
+            return 0
+        return len(self.rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        """Return number of header columns."""
+        return len(DiffHeaders)
+
+    def get_texts(self, diff):
+        """Return list of display texts of each column."""
+        old = None if diff.old is None else DiffEntry(*diff.old)
+        new = None if diff.new is None else DiffEntry(*diff.new)
+        entry = old if new is None else new
+        return [
+            DiffCategories[diff.category],
+            entry.url,
+            entry.parent_url or "",
+            "" if old is None else old.result,
+            "" if new is None else new.result,
+            format_checktime(old),
+            format_checktime(new),
+        ]
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        """Return diff data at given index for given role."""
+        if not index.isValid() or index.row() >= len(self.rows):
+            return EmptyQVariant
+        diff = self.rows[index.row()]
+        column = index.column()
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return self.get_texts(diff)[column]
+        if role == QtCore.Qt.ItemDataRole.UserRole:
+            if column == 0:
+                return diff.category
+            if column >= 5:
+                entry = diff.old if column == 5 else diff.new
+                if entry is None or entry[4] is None:
+                    return -1.0
+                return entry[4]
+            return self.get_texts(diff)[column]
+        if role == QtCore.Qt.ItemDataRole.ToolTipRole and column in (1, 2):
+            return self.get_texts(diff)[column]
+        if role == QtCore.Qt.ItemDataRole.TextAlignmentRole and column >= 5:
+            return (QtCore.Qt.AlignmentFlag.AlignRight
+                    | QtCore.Qt.AlignmentFlag.AlignVCenter)
+        return EmptyQVariant
+
+    def headerData(self, section, orientation, role):
+        """Return header column data for given parameters."""
+        if (orientation == QtCore.Qt.Orientation.Horizontal
+                and role == QtCore.Qt.ItemDataRole.DisplayRole):
+            return DiffHeaders[section]
+        return EmptyQVariant
+
+
+class DiffDock(QtWidgets.QDockWidget):
+    """Sortable table of the changes between two result sets."""
+
+    def __init__(self, parent=None):
+        """Show an empty DiffModel."""
+        super().__init__(_("Changes"), parent)
+        self.setObjectName("DiffDock")
+        self.diffmodel = DiffModel(parent=self)
+        self.proxy = QtCore.QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.diffmodel)
+        self.proxy.setSortRole(QtCore.Qt.ItemDataRole.UserRole)
+        self.filter = QtWidgets.QComboBox(self)
+        for name, categories in DiffFilters:
+            self.filter.addItem(name)
+        self.filter.currentIndexChanged.connect(self.set_filter)
+        self.label = QtWidgets.QLabel(self)
+        self.view = QtWidgets.QTreeView(self)
+        self.view.setRootIsDecorated(False)
+        self.view.setUniformRowHeights(True)
+        self.view.setAlternatingRowColors(True)
+        self.view.setModel(self.proxy)
+        self.view.sortByColumn(0, QtCore.Qt.SortOrder.AscendingOrder)
+        self.view.setSortingEnabled(True)
+        top = QtWidgets.QHBoxLayout()
+        top.addWidget(self.filter)
+        top.addWidget(self.label, 1)
+        layout = QtWidgets.QVBoxLayout()
+        layout.addLayout(top)
+        layout.addWidget(self.view)
+        widget = QtWidgets.QWidget(self)
+        widget.setLayout(layout)
+        self.setWidget(widget)
+
+    def set_diffs(self, diffs, title):
+        """Show given list of Diff objects with a title describing the
+        compared result sets."""
+        counts = count_categories(diffs)
+        self.label.setText(
+            _("%(title)s: %(new)d new errors, %(fixed)d fixed, %(slower)d slower,"
+              " %(unchecked)d not rechecked")
+            % dict(title=strformat.limit(title, 60), new=counts[DiffNew],
+                   fixed=counts[DiffFixed], slower=counts[DiffRegressed],
+                   unchecked=counts[DiffNotRechecked]))
+        self.diffmodel.set_diffs(diffs)
+
+    def set_filter(self, index):
+        """Show the diffs of the selected filter entry."""
+        self.diffmodel.set_categories(DiffFilters[max(index, 0)][1])
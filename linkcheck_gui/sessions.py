@@ -0,0 +1,281 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+Check sessions running concurrently with the check of the main window.
+"""
+from enum import Enum
+import functools
+import os
+
+from linkcheck import checker as linkchecker_checker
+from linkcheck import director, strformat
+from PyQt6 import QtCore, QtWidgets
+
+from .checker import CheckerThread
+from .logger import SignalLogger, StatusLogger
+from .urlmodel import UrlItemModel
+
+# total number of checker threads, and so of connections, of all checks
+MaxThreads = 10 * (os.cpu_count() or 1)
+# milliseconds between progress updates of the sessions
+UpdateInterval = 1000
+
+SessionState = Enum("SessionState", ["waiting", "running", "done"])
+
+
+class ThreadBudget:
+    """Checker threads shared by all checks."""
+
+    def __init__(self, total=MaxThreads):
+        """Initialize an unused budget of given number of threads."""
+        self.total = total
+        self.used = 0
+
+    def acquire(self, wanted, force=False):
+        """Return number of threads given to a check wanting given number
+        of threads: the wanted threads if available, else the remaining
+        threads. Forced requests get the wanted threads even if the budget
+        is exceeded."""
+        num = wanted if force else max(min(wanted, self.total - self.used), 0)
+        self.used += num
+        return num
+
+    def release(self, num):
+        """Return given number of threads to the budget."""
+        self.used -= num
+
+
+class CheckSession(QtWidgets.QWidget):
+    """Check of one URL with its own checker thread, aggregate and
+    result model."""
+
+    # lists of checked URL data
+    log_url_signal = QtCore.pyqtSignal(list)
+    # statistics at the end of the check
+    log_stats_signal = QtCore.pyqtSignal(object)
+    # emitted when the check ended or was canceled before it started
+    done = QtCore.pyqtSignal()
+
+    def __init__(self, url, config, hosttimes, parent=None):
+        """Prepare a check of given URL with given configuration, which is
+        changed to log to this session. Hosts are throttled with given
+        shared dictionary of request times."""
+        super().__init__(parent)
+        self.url = url
+        self.hosttimes = hosttimes
+        self.state = SessionState.waiting
+        self.threads = 0
+        # close the session when the check ended
+        self.close_when_done = False
+        self.statuslogger = StatusLogger()
+        self.config = config
+        config.set_status_logger(self.statuslogger)
+        config["fileoutput"] = []
+        config[SignalLogger.LoggerName] = {}
+        config["logger"] = config.logger_new(
+            SignalLogger.LoggerName,
+            signal=self.log_url_signal,
+            stats=self.log_stats_signal,
+        )
+        self.model = UrlItemModel(parent=self)
+        self.checker = CheckerThread(parent=self)
+        self.checker.finished.connect(self.finish)
+        self.log_url_signal.connect(self.model.log_urls)
+        self.log_stats_signal.connect(self.log_stats)
+        self.label = QtWidgets.QLabel(_("Waiting for free threads..."), self)
+        self.stopButton = QtWidgets.QPushButton(_("Stop"), self)
+        self.stopButton.clicked.connect(self.cancel)
+        self.view = QtWidgets.QTreeView(self)
+        self.view.setRootIsDecorated(False)
+        self.view.setUniformRowHeights(True)
+        self.view.setModel(self.model)
+        self.view.sortByColumn(0, QtCore.Qt.SortOrder.AscendingOrder)
+        self.view.setSortingEnabled(True)
+        top = QtWidgets.QHBoxLayout()
+        top.addWidget(self.label, 1)
+        top.addWidget(self.stopButton)
+        layout = QtWidgets.QVBoxLayout()
+        layout.addLayout(top)
+        layout.addWidget(self.view)
+        self.setLayout(layout)
+
+    def start(self, threads):
+        """Start checking with given number of threads."""
+        self.threads = self.config["threads"] = threads
+        aggregate = director.get_aggregate(self.config)
+        aggregate.times = self.hosttimes
+        url_data = linkchecker_checker.get_url_from(
+            self.url, 0, aggregate, extern=(0, 0))
+        aggregate.urlqueue.put(url_data)
+        self.state = SessionState.running
+        self.label.setText(_n("Checking with %d thread...",
+                              "Checking with %d threads...", threads) % threads)
+        self.checker.check(aggregate)
+
+    def cancel(self):
+        """Stop the check, or do not start it if it is waiting."""
+        self.stopButton.setEnabled(False)
+        if self.state == SessionState.running:
+            self.label.setText(_("Stopping..."))
+            self.checker.cancel()
+        elif self.state == SessionState.waiting:
+            self.state = SessionState.done
+            self.label.setText(_("Canceled."))
+            self.done.emit()
+
+    def finish(self):
+        """Note that the check ended."""
+        self.state = SessionState.done
+        self.stopButton.setEnabled(False)
+        self.done.emit()
+
+    def update_status(self):
+        """Show the latest status logged since the last update."""
+        status = self.statuslogger.get_status()
+        if status is None or self.state != SessionState.running:
+            return
+        checked, in_progress, queued, duration, num_urls = status
+        self.label.setText(
+            _("%(checked)d checked, %(active)d active, %(queued)d queued,"
+              " %(threads)d threads, %(duration)s")
+            % dict(checked=checked, active=in_progress, queued=queued,
+                   threads=self.threads,
+                   duration=strformat.strduration_long(duration)))
+
+    def log_stats(self, statistics):
+        """Show the statistics of the finished check."""
+        self.label.setText(
+            _("Finished: %(checked)d URLs checked, %(errors)d errors,"
+              " %(warnings)d warnings.")
+            % dict(checked=statistics.number, errors=statistics.errors,
+                   warnings=statistics.warnings))
+
+
+class SessionDock(QtWidgets.QDockWidget):
+    """Tabs of check sessions which run concurrently as long as the
+    thread budget allows, and wait for free threads otherwise."""
+
+    # emitted with the entered URL when a new session is wanted
+    new_session = QtCore.pyqtSignal(str)
+
+    def __init__(self, budget, hosttimes, parent=None):
+        """Show no sessions. Sessions share the given ThreadBudget and
+        dictionary of host request times with the main window."""
+        super().__init__(_("Sessions"), parent)
+        self.setObjectName("SessionDock")
+        self.budget = budget
+        self.hosttimes = hosttimes
+        self.tabs = QtWidgets.QTabWidget(self)
+        self.tabs.setTabsClosable(True)
+        self.tabs.tabCloseRequested.connect(self.close_session)
+        self.urlinput = QtWidgets.QLineEdit(self)
+        self.urlinput.setPlaceholderText(_("URL to check in a new session"))
+        self.urlinput.returnPressed.connect(self.request_session)
+        button = QtWidgets.QPushButton(_("New session"), self)
+        button.clicked.connect(self.request_session)
+        top = QtWidgets.QHBoxLayout()
+        top.addWidget(self.urlinput, 1)
+        top.addWidget(button)
+        layout = QtWidgets.QVBoxLayout()
+        layout.addLayout(top)
+        layout.addWidget(self.tabs)
+        widget = QtWidgets.QWidget(self)
+        widget.setLayout(layout)
+        self.setWidget(widget)
+        self.timer = QtCore.QTimer(self)
+        self.timer.setInterval(UpdateInterval)
+        self.timer.timeout.connect(self.update_status)
+
+    def request_session(self):
+        """Emit the entered URL if it is not empty."""
+        url = self.urlinput.text().strip()
+        if url:
+            self.new_session.emit(url)
+
+    @property
+    def sessions(self):
+        """Return list of the sessions in tab order."""
+        return [self.tabs.widget(index) for index in range(self.tabs.count())]
+
+    def add_session(self, url, config):
+        """Add a session checking given URL with given configuration and
+        start it if threads are available."""
+        session = CheckSession(url, config, self.hosttimes, parent=self)
+        session.done.connect(functools.partial(self.session_done, session))
+        index = self.tabs.addTab(session, strformat.limit(url, 30))
+        self.tabs.setTabToolTip(index, url)
+        self.tabs.setCurrentIndex(index)
+        self.start_waiting()
+        self.timer.start()
+        return session
+
+    def start_waiting(self):
+        """Start the waiting sessions in tab order while threads are
+        available."""
+        for session in self.sessions:
+            if session.state != SessionState.waiting:
+                continue
+            # checks without threads would block the GUI
+            threads = self.budget.acquire(max(session.config["threads"], 1))
+            if not threads:
+                break
+            session.start(threads)
+
+    def session_done(self, session):
+        """Return the threads of the ended session to the budget and start
+        waiting sessions."""
+        self.budget.release(session.threads)
+        session.threads = 0
+        if session.close_when_done:
+            self.remove_session(session)
+        self.start_waiting()
+        if not self.is_running():
+            self.timer.stop()
+
+    def close_session(self, index):
+        """Close the session in given tab, stopping its check first."""
+        session = self.tabs.widget(index)
+        if session.state == SessionState.running:
+            session.close_when_done = True
+            session.cancel()
+        else:
+            if session.state == SessionState.waiting:
+                session.cancel()
+            self.remove_session(session)
+
+    def remove_session(self, session):
+        """Remove the tab of given session which is not running."""
+        self.tabs.removeTab(self.tabs.indexOf(session))
+        session.deleteLater()
+
+    def is_running(self):
+        """Return True if a session is running or waiting."""
+        return any(session.state != SessionState.done for session in self.sessions)
+
+    def cancel_all(self):
+        """Stop all sessions."""
+        for session in self.sessions:
+            session.cancel()
+
+    def wait(self):
+        """Wait until the checker threads of all sessions ended."""
+        for session in self.sessions:
+            session.checker.wait()
+
+    def update_status(self):
+        """Show the progress of the running sessions."""
+        for session in self.sessions:
+            session.update_status()
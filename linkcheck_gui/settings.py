@@ -90,6 +90,11 @@ class Settings:
             recursionlevel=None,
             warninglines=None,
             ignorelines=None,
+            batchsize=None,
+            batchinterval=None,
+            statusinterval=None,
+            checkprocess=None,
+            contentcache=None,
         )
         self.settings.beginGroup('output')
         for key in ("debug", "verbose"):
@@ -112,6 +117,21 @@ class Settings:
         if self.settings.contains('ignorelines'):
             value = self.settings.value('ignorelines')
             data['ignorelines'] = value
+        if self.settings.contains('checkprocess'):
+            data['checkprocess'] = self.settings.value('checkprocess', type=bool)
+        if self.settings.contains('contentcache'):
+            data['contentcache'] = self.settings.value('contentcache', type=bool)
+        self.settings.endGroup()
+        self.settings.beginGroup('display')
+        if self.settings.contains('batchsize'):
+            value = int(self.settings.value('batchsize'))
+            data['batchsize'] = min(max(value, 1), 10000)
+        if self.settings.contains('batchinterval'):
+            value = int(self.settings.value('batchinterval'))
+            data['batchinterval'] = min(max(value, 10), 5000)
+        if self.settings.contains('statusinterval'):
+            value = int(self.settings.value('statusinterval'))
+            data['statusinterval'] = min(max(value, 1), 60)
         self.settings.endGroup()
         return data
 
@@ -122,7 +142,12 @@ class Settings:
             self.settings.setValue(key, data[key])
         self.settings.endGroup()
         self.settings.beginGroup('checking')
-        for key in ("recursionlevel", "warninglines", "ignorelines"):
+        for key in ("recursionlevel", "warninglines", "ignorelines", "checkprocess",
+                    "contentcache"):
+            self.settings.setValue(key, data[key])
+        self.settings.endGroup()
+        self.settings.beginGroup('display')
+        for key in ("batchsize", "batchinterval", "statusinterval"):
             self.settings.setValue(key, data[key])
         self.settings.endGroup()
 
@@ -0,0 +1,66 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+Download page sources for the editor without blocking the user interface.
+"""
+import threading
+
+from PyQt6 import QtCore
+
+from .library import url as urlutil
+
+
+class SourceFetch(QtCore.QObject):
+    """Download of a URL content in a daemon thread which passes the text
+    on while it arrives. A daemon thread is used instead of a QThread, so a
+    hanging server does not delay quitting the application."""
+
+    # downloaded part of the text
+    received = QtCore.pyqtSignal(str)
+    # text or None, and headers or error message of the finished download
+    done = QtCore.pyqtSignal(object, object)
+
+    def __init__(self, url, timeout=None):
+        """Download given URL, waiting at most timeout seconds for the
+        connection and each read."""
+        super().__init__()
+        self.url = url
+        self.timeout = timeout
+        self.canceled = False
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        """Start downloading."""
+        self.thread.start()
+
+    def cancel(self):
+        """Stop downloading and emit no more signals. A blocking read ends
+        after the timeout at the latest."""
+        self.canceled = True
+
+    def run(self):
+        """Download the URL content."""
+        data, info = urlutil.get_content(
+            self.url, timeout=self.timeout, receive=self.receive)
+        if not self.canceled:
+            self.done.emit(data, info)
+
+    def receive(self, text):
+        """Emit downloaded text and return False if canceled."""
+        if self.canceled:
+            return False
+        self.received.emit(text)
+        return True
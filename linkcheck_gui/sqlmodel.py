@@ -0,0 +1,267 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+Write check results to a result database and show them page by page.
+"""
+from collections import OrderedDict
+import queue
+import sqlite3
+
+from PyQt6 import QtCore, QtWidgets
+
+from .resultdb import get_filter, ResultDB
+from .urlfilter import AllStatus
+from .urlmodel import EmptyQVariant, Headers, UrlItem
+
+DatabaseFilter = _("SQLite database (*.sqlite)")
+# maximum number of results written in one transaction
+WriteBatchSize = 5000
+# number of rows read from the database at once
+PageSize = 256
+# number of pages kept in memory
+MaxPages = 32
+
+
+class ResultWriter(QtCore.QThread):
+    """Append check results to a result database in a separate thread.
+    Results added while a transaction is written are collected and
+    written together in the next transaction."""
+
+    # error message if writing failed
+    error = QtCore.pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        """Reset writer variables."""
+        super().__init__(parent)
+        self.filename = None
+        self.url = None
+        self.queue = queue.SimpleQueue()
+        self.failed = False
+        self.complete = False
+
+    def write(self, filename, url, url_datas=()):
+        """Replace the results in given database with given URL data and
+        start the thread. Call add() to write more results and finish()
+        to end writing."""
+        self.filename = filename
+        self.url = url
+        self.queue = queue.SimpleQueue()
+        self.failed = False
+        self.complete = False
+        self.add(url_datas)
+        self.start()
+
+    def add(self, url_datas):
+        """Queue list of URL data for writing."""
+        if url_datas and not self.failed:
+            self.queue.put(list(url_datas))
+
+    def finish(self, complete=False):
+        """Stop the thread after the queued URL data has been written.
+        Complete results of a check that was not canceled are marked as
+        such in the metadata."""
+        self.complete = complete
+        self.queue.put(None)
+
+    def run(self):
+        """Write queued URL data until finish() is called."""
+        db = None
+        try:
+            db = ResultDB(self.filename)
+            db.clear()
+            db.set_meta("url", self.url)
+            done = False
+            while not done:
+                url_datas = self.queue.get()
+                if url_datas is None:
+                    break
+                while len(url_datas) < WriteBatchSize:
+                    try:
+                        more = self.queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if more is None:
+                        done = True
+                        break
+                    url_datas.extend(more)
+                db.add_results(url_datas)
+            if self.complete:
+                db.set_meta("complete", "1")
+        except (OSError, sqlite3.Error) as msg:
+            self.failed = True
+            self.error.emit(str(msg))
+        finally:
+            if db is not None:
+                db.close()
+
+
+class SqlResultModel(QtCore.QAbstractItemModel):
+    """Read-only model of the results in a result database. Rows are read
+    in pages of PageSize rows in the order of an index of the sort column,
+    and only the last MaxPages pages are kept in memory.
+
+    Pages are read with keyset pagination: each page starts after the
+    sort key of the last row of the previous page, so reading a page does
+    not step over all rows before it like OFFSET does. The start keys of
+    all pages seen so far are kept."""
+
+    def __init__(self, filename, parent=None):
+        """Open given result database."""
+        super().__init__(parent)
+        self.db = ResultDB(filename)
+        self.filename = filename
+        self.url = self.db.get_meta("url", "")
+        # True if the results are of a check that was not canceled
+        self.complete = self.db.get_meta("complete") == "1"
+        self.sort_column = None
+        self.sort_order = QtCore.Qt.SortOrder.AscendingOrder
+        self.filter_active = False
+        self.where, self.params = "", ()
+        self.total = self.size = self.db.count_results()
+        # lists of UrlItem objects by page number
+        self.pages = OrderedDict()
+        # sort keys of the rows before each page by page number
+        self.page_keys = {0: None}
+
+    def close(self):
+        """Close the database."""
+        self.db.close()
+
+    def is_active(self):
+        """Return True if a filter is set."""
+        return self.filter_active
+
+    def set_filter(self, text="", status=AllStatus, host="", content_type=""):
+        """Show only results matching given settings, see
+        UrlFilterProxyModel.set_filter()."""
+        self.beginResetModel()
+        self.where, self.params = get_filter(text, status, host, content_type)
+        self.filter_active = bool(self.where)
+        self.size = self.db.count_results(self.where, self.params)
+        self.clear_pages()
+        self.endResetModel()
+
+    def get_page(self, page):
+        """Return list of UrlItem objects of given page."""
+        items = self.pages.get(page)
+        if items is not None:
+            self.pages.move_to_end(page)
+            return items
+        descending = self.sort_order == QtCore.Qt.SortOrder.DescendingOrder
+        if page not in self.page_keys:
+            self.find_page_keys(page, descending)
+            if page not in self.page_keys:
+                # the page is after the last result
+                return []
+        results = self.db.get_page(
+            self.where, self.params, self.sort_column, descending,
+            self.page_keys.get(page), PageSize)
+        if len(results) == PageSize:
+            self.page_keys[page + 1] = results[-1][1]
+        items = self.pages[page] = [UrlItem(url_data) for url_data, key in results]
+        if len(self.pages) > MaxPages:
+            self.pages.popitem(last=False)
+        return items
+
+    def find_page_keys(self, page, descending):
+        """Store the start keys of the pages from the last page with a
+        known start key up to given page, reading only the sort index."""
+        start = max(known for known in self.page_keys if known < page)
+        keys = self.db.iter_keys(self.where, self.params, self.sort_column,
+                                 descending, self.page_keys[start])
+        for row, key in enumerate(keys, 1):
+            if row % PageSize == 0:
+                start += 1
+                self.page_keys[start] = key
+                if start == page:
+                    break
+
+    def clear_pages(self):
+        """Forget the read pages and their start keys."""
+        self.pages.clear()
+        self.page_keys = {0: None}
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """Return number of shown results."""
+        if parent.isValid():
+            return 0
+        return self.size
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        """Return number of header columns."""
+        return len(Headers)
+
+    def parent(self, child=QtCore.QModelIndex()):
+        """Return empty QModelIndex since the result list is not
+        hierarchical."""
+        return QtCore.QModelIndex()
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        """Return index of given row and column."""
+        if parent.isValid() or not (0 <= row < self.size):
+            return QtCore.QModelIndex()
+        return self.createIndex(row, column)
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        """Return result data at given index for given role."""
+        urlitem = self.getUrlItem(index)
+        if urlitem is None:
+            return EmptyQVariant
+        return urlitem.data(index.column(), role)
+
+    def headerData(self, section, orientation, role):
+        """Return header column data for given parameters."""
+        if (orientation == QtCore.Qt.Orientation.Horizontal
+                and role == QtCore.Qt.ItemDataRole.DisplayRole):
+            return Headers[section]
+        return EmptyQVariant
+
+    def flags(self, index):
+        """Return flags that given valid item index is enabled and
+        selected."""
+        if not index.isValid():
+            return QtCore.Qt.ItemFlag.NoItemFlags
+        return QtCore.Qt.ItemFlag.ItemIsEnabled | QtCore.Qt.ItemFlag.ItemIsSelectable
+
+    def sort(self, column, order=QtCore.Qt.SortOrder.AscendingOrder):
+        """Sort results by given column and order using the database
+        index of the column."""
+        self.layoutAboutToBeChanged.emit()
+        self.sort_column = column if column >= 0 else None
+        self.sort_order = order
+        self.clear_pages()
+        self.layoutChanged.emit()
+
+    def getUrlItem(self, index):
+        """Get URL item object at given index."""
+        if not index.isValid() or not (0 <= index.row() < self.size):
+            return None
+        page, row = divmod(index.row(), PageSize)
+        items = self.get_page(page)
+        return items[row] if row < len(items) else None
+
+
+def get_database_filename(parent, title, save=False):
+    """Return filename of a result database selected in a file dialog, or
+    an empty string if the dialog was canceled."""
+    if save:
+        func = QtWidgets.QFileDialog.getSaveFileName
+        filename = "linkchecker-out.sqlite"
+    else:
+        func = QtWidgets.QFileDialog.getOpenFileName
+        filename = ""
+    filename, _filter = func(parent, title, filename, DatabaseFilter)
+    return filename
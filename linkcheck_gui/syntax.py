@@ -14,8 +14,13 @@
 # with this program; if not, write to the Free Software Foundation, Inc.,
 # 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 
+import re
+
 from PyQt6 import QtCore, QtGui
 
+# number of blocks highlighted at once in background
+ChunkBlocks = 500
+
 
 def format(color, style=''):
     """Return a QTextCharFormat with the given attributes."""
@@ -28,27 +33,172 @@ def format(color, style=''):
     return format
 
 
+def get_utf16_offsets(text):
+    """Return function converting character positions of text to the
+    UTF-16 positions used by Qt, which differ after characters outside
+    the basic multilingual plane."""
+    if text.isascii() or len(text.encode("utf-16-le")) == 2 * len(text):
+        return None
+    return lambda pos: len(text[:pos].encode("utf-16-le")) // 2
+
+
 class Highlighter(QtGui.QSyntaxHighlighter):
-    """Base class for all highlighters."""
+    """Base class for all highlighters. All rules are combined into one
+    regular expression, so each block is tokenized in a single pass. At
+    the same position, rules added first take precedence. A multi-line
+    rule keeps its number as block state while its end has not been
+    found, so a change only highlights the following blocks again while
+    their state changes.
+
+    Blocks are highlighted in document order in background, in chunks of
+    ChunkBlocks blocks, after the blocks up to the one given to
+    highlightVisible(). Blocks whose state is still -1 have not been
+    highlighted yet."""
 
     def __init__(self, document):
         """Initialize rules and styles."""
         super().__init__(document)
+        # (pattern, format, end expression or None) of each rule
         self.rules = []
         self.styles = {}
-
-    def highlightBlock(self, text):
-        """Highlight a text block."""
-        for expression, format in self.rules:
-            i = expression.globalMatch(text)
-            while i.hasNext():
-                match = i.next()
-                self.setFormat(match.capturedStart(), match.capturedLength(), format)
-        self.setCurrentBlockState(0)
+        self.expression = None
+        # formats, end expressions and states by group name
+        self.groups = {}
+        # (end expression, format) of multi-line rules by state - 1
+        self.multiline = []
+        # highest block number that may be highlighted for the first time
+        self.limit = -1
+        # number of the last block to highlight before the others
+        self.visible = None
+        # number of a block before which all blocks are highlighted
+        self.next = 0
+        self.timer = QtCore.QTimer(self)
+        self.timer.timeout.connect(self.highlightChunk)
+        document.contentsChange.connect(self.contentsChanged)
+        self.timer.start()
 
     def addRule(self, pattern, style):
         """Add a rule pattern with given style."""
-        self.rules.append((QtCore.QRegularExpression(pattern), self.styles[style]))
+        self.rules.append((pattern, self.styles[style], None))
+        self.expression = None
+
+    def addMultiLineRule(self, start, end, style):
+        """Add a rule from start pattern to end pattern with given style,
+        which may span several lines."""
+        self.rules.append((start, self.styles[style], re.compile(end)))
+        self.expression = None
+
+    def compile(self):
+        """Combine the rules into one regular expression."""
+        patterns = []
+        self.groups.clear()
+        self.multiline = []
+        for number, (pattern, format, end) in enumerate(self.rules):
+            name = "r%d" % number
+            patterns.append("(?P<%s>%s)" % (name, pattern))
+            state = 0
+            if end is not None:
+                self.multiline.append((end, format))
+                state = len(self.multiline)
+            self.groups[name] = (format, end, state)
+        self.expression = re.compile("|".join(patterns))
+
+    def highlightBlock(self, text):
+        """Highlight a text block, unless it is highlighted later in
+        background."""
+        if self.currentBlockState() == -1 and (
+                self.limit < 0 or self.currentBlock().blockNumber() > self.limit):
+            return
+        if self.expression is None:
+            self.compile()
+        self.setCurrentBlockState(
+            self.tokenize(text, max(self.previousBlockState(), 0)))
+
+    def tokenize(self, text, state):
+        """Set formats of text starting in given state and return the
+        state at the end of text."""
+        offset = get_utf16_offsets(text)
+        pos = 0
+        if state > 0:
+            end, format = self.multiline[state - 1]
+            match = end.search(text)
+            if match is None:
+                self.setFormat(0, self.currentBlock().length(), format)
+                return state
+            pos = match.end()
+            self.setFormat(0, offset(pos) if offset else pos, format)
+        search = self.expression.search
+        groups = self.groups
+        while True:
+            match = search(text, pos)
+            if match is None:
+                return 0
+            start, pos = match.span()
+            format, end, state = groups[match.lastgroup]
+            if end is not None:
+                endmatch = end.search(text, pos)
+                if endmatch is None:
+                    if offset:
+                        start = offset(start)
+                    self.setFormat(start, self.currentBlock().length(), format)
+                    return state
+                pos = endmatch.end()
+            if pos == start:
+                # skip empty matches
+                pos += 1
+            elif offset:
+                self.setFormat(offset(start), offset(pos) - offset(start), format)
+            else:
+                self.setFormat(start, pos - start, format)
+
+    def highlightVisible(self, last):
+        """Highlight the blocks up to given block number, the last visible
+        block, before the other blocks."""
+        self.visible = last
+        self.timer.start()
+
+    def highlightChunk(self):
+        """Highlight the blocks up to the last visible block, or the next
+        chunk of blocks that have not been highlighted."""
+        if self.document() is None:
+            self.timer.stop()
+            return
+        block = self.find_unhighlighted()
+        if not block.isValid():
+            self.visible = None
+            self.timer.stop()
+            return
+        last = block.blockNumber() + ChunkBlocks - 1
+        if self.visible is not None:
+            last = max(last, self.visible)
+            self.visible = None
+        self.limit = last
+        try:
+            # highlights the following blocks while their state changes
+            self.rehighlightBlock(block)
+        finally:
+            self.limit = -1
+
+    def find_unhighlighted(self):
+        """Return first block which has not been highlighted, or an
+        invalid block."""
+        block = self.document().findBlockByNumber(self.next)
+        if not block.isValid():
+            block = self.document().lastBlock()
+        while block.isValid() and block.userState() != -1:
+            block = block.next()
+        if block.isValid():
+            self.next = block.blockNumber()
+        return block
+
+    def contentsChanged(self, position, removed, added):
+        """Highlight new blocks in background."""
+        if self.document() is None:
+            return
+        block = self.document().findBlock(position)
+        if block.isValid():
+            self.next = min(self.next, block.blockNumber())
+        self.timer.start()
 
 
 class XmlHighlighter(Highlighter):
@@ -65,17 +215,17 @@ class XmlHighlighter(Highlighter):
                 'string': format('darkMagenta'),
             }
         )
-        # keywords
-        for reg in ('/>', '>', '<!?[a-zA-Z0-9_]+'):
-            self.addRule(reg, 'keyword')
-        # attributes
-        self.addRule(r"\b[A-Za-z0-9_]+(?=\s*\=)", 'attribute')
+        # comments
+        self.addMultiLineRule(r"<!--", r"-->", 'comment')
+        self.addMultiLineRule(r"<!\[CDATA\[", r"\]\]>", 'string')
         # double-quoted string, possibly containing escape sequences
-        self.addRule(r'"[^"\\]*(\\.[^"\\]*)*"', 'string')
+        self.addRule(r'"[^"\\]*(?:\\.[^"\\]*)*"', 'string')
         # single-quoted string, possibly containing escape sequences
-        self.addRule(r"'[^'\\]*(\\.[^'\\]*)*'", 'string')
-        # comments
-        self.addRule(r"<!--[^>]*-->", 'comment')
+        self.addRule(r"'[^'\\]*(?:\\.[^'\\]*)*'", 'string')
+        # keywords
+        self.addRule(r"</?[!?]?[a-zA-Z0-9_:.-]+|/?>", 'keyword')
+        # attributes
+        self.addRule(r"\b[A-Za-z0-9_:.-]+(?=\s*\=)", 'attribute')
 
 
 # Treat HTML as XML
@@ -95,6 +245,6 @@ class IniHighlighter(Highlighter):
                 'comment': format('darkYellow'),
             }
         )
-        self.addRule(r'\b\[[a-zA-Z0-9_]+\]\b', 'section')
-        self.addRule(r'\b[a-zA-Z0-9_]+\](?=\s*\=)', 'property')
-        self.addRule(r'#[^\n]*', 'comment')
+        self.addRule(r'^\s*[#;].*', 'comment')
+        self.addRule(r'^\s*\[[^\]]*\]', 'section')
+        self.addRule(r'^\s*[^\s=:#;\[][^=:]*?(?=\s*[=:])', 'property')
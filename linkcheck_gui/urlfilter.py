@@ -0,0 +1,267 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+Filter the rows of the URL tree model.
+"""
+from array import array
+import bisect
+
+from PyQt6 import QtCore
+
+from .urlindex import (get_host, get_status, get_text, StatusError,
+                       StatusValid, StatusWarning, UrlIndex)
+
+AllStatus = frozenset((StatusValid, StatusWarning, StatusError))
+
+# status values shown for each entry of the status filter combo box
+FilterStatus = (
+    (_("All results"), AllStatus),
+    (_("Valid"), frozenset((StatusValid,))),
+    (_("Warnings"), frozenset((StatusWarning,))),
+    (_("Errors"), frozenset((StatusError,))),
+    (_("Warnings and errors"), frozenset((StatusWarning, StatusError))),
+)
+
+
+class UrlFilterProxyModel(QtCore.QAbstractProxyModel):
+    """Show the rows of a UrlItemModel matching the filter settings.
+    Matching records are looked up in a UrlIndex which is updated with
+    the rows inserted into the source model, so changing the filter does
+    not have to test every row."""
+
+    def __init__(self, parent=None):
+        """Initialize an inactive filter."""
+        super().__init__(parent)
+        self.urlindex = UrlIndex()
+        self.text = ""
+        self.status = AllStatus
+        self.host = ""
+        self.content_type = ""
+        # set of matching records, None if the filter is inactive
+        self.records = None
+        # ascending source rows of the shown rows, None if the filter
+        # is inactive
+        self.rows = None
+        # source row of each record, computed when needed
+        self.positions = None
+
+    def setSourceModel(self, model):
+        """Set UrlItemModel and connect to its change signals."""
+        super().setSourceModel(model)
+        model.rowsAboutToBeInserted.connect(self.source_rows_about_to_be_inserted)
+        model.rowsInserted.connect(self.source_rows_inserted)
+        model.layoutAboutToBeChanged.connect(self.layoutAboutToBeChanged.emit)
+        model.layoutChanged.connect(self.source_layout_changed)
+        model.modelAboutToBeReset.connect(self.beginResetModel)
+        model.modelReset.connect(self.source_model_reset)
+        model.dataChanged.connect(self.source_data_changed)
+
+    def is_active(self):
+        """Return True if any filter setting is set."""
+        return bool(self.text or self.host or self.content_type
+                    or self.status != AllStatus)
+
+    def set_filter(self, text="", status=AllStatus, host="", content_type=""):
+        """Show only rows matching all given settings:
+        - text is found in the URL, name, parent URL, result or warnings
+        - status is one of the given status values
+        - host is the URL host name or a parent domain of it
+        - content_type is a prefix of the URL content type
+        """
+        self.beginResetModel()
+        self.text = text
+        self.status = status
+        self.host = host.strip().lower()
+        self.content_type = content_type.strip().lower()
+        if self.is_active():
+            self.records = self.find_records()
+            self.rows = self.get_rows()
+        else:
+            self.records = self.rows = None
+        self.endResetModel()
+
+    def find_records(self):
+        """Return set of records matching the filter settings."""
+        store = self.sourceModel().store
+        self.urlindex.update(store)
+        found = []
+        if self.status != AllStatus:
+            found.append(self.urlindex.find_status(self.status))
+        if self.host:
+            found.append(self.urlindex.find_host(self.host))
+        if self.content_type:
+            found.append(self.urlindex.find_content_type(self.content_type))
+        if self.text:
+            found.append(self.urlindex.find_text(self.text))
+        found.sort(key=len)
+        records = found[0]
+        for other in found[1:]:
+            records &= other
+        return records
+
+    def matches(self, url_data):
+        """Return True if given URL data matches the filter settings."""
+        if get_status(url_data) not in self.status:
+            return False
+        if self.host:
+            host = get_host(url_data)
+            if host != self.host and not host.endswith("." + self.host):
+                return False
+        if self.content_type:
+            content_type = (url_data.content_type or "").lower()
+            if not content_type.startswith(self.content_type):
+                return False
+        if self.text and self.text.lower() not in get_text(url_data):
+            return False
+        return True
+
+    def get_rows(self):
+        """Return source rows of the matching records."""
+        records = self.records
+        order = self.sourceModel().order
+        if len(records) == len(order):
+            return array("L", range(len(order)))
+        if len(records) * 8 < len(order):
+            positions = self.get_positions()
+            return array("L", sorted(positions[record] for record in records))
+        return array("L", [row for row, record in enumerate(order)
+                           if record in records])
+
+    def get_positions(self):
+        """Return source row of each record. The positions are kept until
+        the source rows change, so typing a filter text looks up each
+        matching record instead of testing all rows."""
+        if self.positions is None:
+            order = self.sourceModel().order
+            positions = array("L", bytes(order.itemsize * len(order)))
+            for row, record in enumerate(order):
+                positions[record] = row
+            self.positions = positions
+        return self.positions
+
+    def source_rows_about_to_be_inserted(self, parent, first, last):
+        """Forward row insertion if the filter is inactive."""
+        if self.rows is None:
+            self.beginInsertRows(QtCore.QModelIndex(), first, last)
+
+    def source_rows_inserted(self, parent, first, last):
+        """Index inserted rows and show the matching ones."""
+        source = self.sourceModel()
+        self.urlindex.update(source.store)
+        self.positions = None
+        if self.rows is None:
+            self.endInsertRows()
+            return
+        count = last - first + 1
+        pos = bisect.bisect_left(self.rows, first)
+        # the source rows of following shown rows moved down
+        self.rows[pos:] = array("L", [row + count for row in self.rows[pos:]])
+        new_rows = []
+        for row in range(first, last + 1):
+            record = source.order[row]
+            if self.matches(source.store.url_data[record]):
+                self.records.add(record)
+                new_rows.append(row)
+        if new_rows:
+            self.beginInsertRows(QtCore.QModelIndex(), pos, pos + len(new_rows) - 1)
+            self.rows[pos:pos] = array("L", new_rows)
+            self.endInsertRows()
+
+    def source_layout_changed(self):
+        """Update shown rows after the source model has been sorted."""
+        self.positions = None
+        if self.rows is not None:
+            self.rows = self.get_rows()
+        self.layoutChanged.emit()
+
+    def source_model_reset(self):
+        """Clear the index and shown rows after the source model has been
+        reset."""
+        self.urlindex.clear()
+        self.positions = None
+        if self.rows is not None:
+            self.records = set()
+            self.rows = array("L")
+        self.endResetModel()
+
+    def source_data_changed(self, topLeft, bottomRight, roles=()):
+        """Forward changed data of shown rows."""
+        first = self.mapFromSource(topLeft)
+        last = self.mapFromSource(bottomRight)
+        if first.isValid() and last.isValid():
+            self.dataChanged.emit(first, last, roles)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """Return number of shown rows."""
+        if parent.isValid() or self.sourceModel() is None:
+            return 0
+        if self.rows is None:
+            return self.sourceModel().rowCount()
+        return len(self.rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        """Return number of header columns."""
+        if self.sourceModel() is None:
+            return 0
+        return self.sourceModel().columnCount()
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        """Return index of shown row and column."""
+        if parent.isValid() or not (0 <= row < self.rowCount()):
+            return QtCore.QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, child=QtCore.QModelIndex()):
+        """Return empty QModelIndex since the URL list is not hierarchical."""
+        return QtCore.QModelIndex()
+
+    def mapToSource(self, index):
+        """Return source model index of given shown index."""
+        if not index.isValid():
+            return QtCore.QModelIndex()
+        row = index.row()
+        if self.rows is not None:
+            if row >= len(self.rows):
+                return QtCore.QModelIndex()
+            row = self.rows[row]
+        return self.sourceModel().index(row, index.column())
+
+    def mapFromSource(self, index):
+        """Return shown index of given source model index, or an invalid
+        index if it is filtered out."""
+        if not index.isValid():
+            return QtCore.QModelIndex()
+        row = index.row()
+        if self.rows is not None:
+            pos = bisect.bisect_left(self.rows, row)
+            if pos >= len(self.rows) or self.rows[pos] != row:
+                return QtCore.QModelIndex()
+            row = pos
+        return self.createIndex(row, index.column())
+
+    def headerData(self, section, orientation, role):
+        """Return header column data of source model."""
+        if self.sourceModel() is None:
+            return None
+        return self.sourceModel().headerData(section, orientation, role)
+
+    def sort(self, column, order=QtCore.Qt.SortOrder.AscendingOrder):
+        """Sort the source model."""
+        self.sourceModel().sort(column, order)
+
+    def getUrlItem(self, index):
+        """Get URL item object at given shown index."""
+        return self.sourceModel().getUrlItem(self.mapToSource(index))
@@ -0,0 +1,198 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+Search indexes over the records of a URL store.
+"""
+from array import array
+import re
+
+# status values of URL records
+StatusValid = "valid"
+StatusWarning = "warning"
+StatusError = "error"
+
+# words of searchable texts
+get_tokens = re.compile(r"[^\W_]+").findall
+
+
+def get_host(url_data):
+    """Return lowercase host name of URL data or an empty string."""
+    netloc = (url_data.domain or "").rpartition("@")[2].lower()
+    if netloc.startswith("["):
+        # IPv6 address
+        return netloc[1:netloc.find("]")]
+    return netloc.partition(":")[0]
+
+
+def get_status(url_data):
+    """Return status value of given URL data."""
+    if not url_data.valid:
+        return StatusError
+    if url_data.warnings:
+        return StatusWarning
+    return StatusValid
+
+
+def get_texts(url_data):
+    """Return searchable texts of given URL data: the URL, name, parent
+    URL, result and warning messages."""
+    texts = [
+        url_data.url or "",
+        url_data.name or "",
+        url_data.parent_url or "",
+        url_data.result or "",
+    ]
+    texts.extend(warning[1] for warning in url_data.warnings or [])
+    return texts
+
+
+def get_text(url_data):
+    """Return lowercase searchable text of given URL data."""
+    return "\n".join(get_texts(url_data)).lower()
+
+
+class UrlIndex:
+    """Inverted indexes mapping status values, hosts, content types and
+    words to the record numbers of a URL store. The indexes are updated
+    incrementally with the records added to the store. Texts are not
+    kept; the texts of the records found in the word index are read from
+    the store."""
+
+    def __init__(self):
+        """Initialize empty indexes."""
+        self.clear()
+
+    def clear(self):
+        """Remove all indexed records."""
+        # number of indexed records
+        self.size = 0
+        self.status = {}
+        self.hosts = {}
+        self.content_types = {}
+        self.words = {}
+        # indexed store
+        self.store = None
+        # words of texts shared by many records, eg. parent URLs
+        self.shared_words = {}
+        # cache for incremental search: {query word: matching index words}
+        self.last_match = {}
+
+    def update(self, store):
+        """Index the records added to given store since the last update."""
+        self.store = store
+        if self.size >= len(store):
+            return
+        self.last_match = {}
+        words = self.words
+        for record in range(self.size, len(store)):
+            url_data = store.url_data[record]
+            add(self.status, get_status(url_data), record)
+            add(self.hosts, get_host(url_data), record)
+            add(self.content_types, (url_data.content_type or "").lower(), record)
+            texts = get_texts(url_data)
+            record_words = set(get_tokens(texts[0].lower()))
+            record_words.update(get_tokens(texts[1].lower()))
+            for text in texts[2:]:
+                record_words |= self.get_shared_words(text)
+            for word in record_words:
+                postings = words.get(word)
+                if postings is None:
+                    postings = words[word] = array("L")
+                postings.append(record)
+        self.size = len(store)
+
+    def get_shared_words(self, text):
+        """Return cached set of words of a text shared by many records."""
+        text_words = self.shared_words.get(text)
+        if text_words is None:
+            text_words = frozenset(get_tokens(text.lower()))
+            self.shared_words[text] = text_words
+        return text_words
+
+    def find_status(self, statuses):
+        """Return set of records with one of the given status values."""
+        records = set()
+        for status in statuses:
+            records.update(self.status.get(status, ()))
+        return records
+
+    def find_host(self, host):
+        """Return set of records of given host or its subdomains."""
+        host = host.strip().lower()
+        suffix = "." + host
+        records = set()
+        for name, postings in self.hosts.items():
+            if name == host or name.endswith(suffix):
+                records.update(postings)
+        return records
+
+    def find_content_type(self, content_type):
+        """Return set of records whose content type starts with given
+        text, eg. "image" finds image/png and image/jpeg."""
+        content_type = content_type.strip().lower()
+        records = set()
+        for name, postings in self.content_types.items():
+            if name.startswith(content_type):
+                records.update(postings)
+        return records
+
+    def find_words(self, word):
+        """Return list of indexed words containing given word. Searches
+        are narrowed when the word extends a word of the previous search."""
+        candidates = self.words
+        for last_word, last_words in self.last_match.items():
+            if last_word in word and len(last_words) < len(candidates):
+                candidates = last_words
+        return [name for name in candidates if word in name]
+
+    def find_text(self, text):
+        """Return set of records whose URL, name, parent URL, result or
+        warnings contain given text, ignoring case. Each word of the text
+        is part of an indexed word of a matching record, so the word index
+        gives the records containing the most selective query word, and
+        only their texts are read from the store and searched for the
+        whole query. Texts without words are searched in all records."""
+        text = text.lower()
+        tokens = set(get_tokens(text))
+        matches = {token: self.find_words(token) for token in tokens}
+        self.last_match = matches
+        postings = None
+        size = None
+        for words in matches.values():
+            token_postings = [self.words[word] for word in words]
+            token_size = sum(map(len, token_postings))
+            if size is None or token_size < size:
+                postings, size = token_postings, token_size
+        if postings is None:
+            records = range(self.size)
+        else:
+            records = set()
+            for records_of_word in postings:
+                records.update(records_of_word)
+            if tokens == {text}:
+                # the word index gives the exact answer
+                return records
+        url_data = self.store.url_data if self.store is not None else []
+        return {record for record in records
+                if text in get_text(url_data[record])}
+
+
+def add(index, key, record):
+    """Add record to postings of key in given index."""
+    postings = index.get(key)
+    if postings is None:
+        postings = index[key] = array("L")
+    postings.append(record)
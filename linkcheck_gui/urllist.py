@@ -0,0 +1,117 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+Read URL list files while checking.
+"""
+import gzip
+import io
+import os
+import time
+
+from linkcheck import checker as linkchecker_checker
+from PyQt6 import QtCore
+
+# extensions of URL list files, one URL per line
+UrlListExtensions = (".lst", ".lst.gz")
+# reading pauses while this many URLs are queued
+MaxQueuedUrls = 10000
+# seconds to wait before looking at the queue size again
+QueueWait = 0.05
+# minimum seconds between progress signals
+ProgressInterval = 0.25
+
+
+def is_url_list(url):
+    """Return True if given URL is a local URL list file."""
+    return ((url.startswith("file://") or os.path.exists(url))
+            and url.endswith(UrlListExtensions))
+
+
+def open_url_list(fileobj):
+    """Return text stream of given binary file object, decompressing
+    gzip data."""
+    if fileobj.peek(2)[:2] == b"\x1f\x8b":
+        fileobj = gzip.GzipFile(fileobj=fileobj)
+    return io.TextIOWrapper(fileobj, encoding="utf-8", errors="replace")
+
+
+class UrlListReader(QtCore.QThread):
+    """Add the URLs of a URL list file to the URL queue of a running check
+    line by line. Reading pauses while MaxQueuedUrls URLs are queued, so
+    memory use does not grow with the size of the list. The queue is kept
+    unfinished until the list has been read."""
+
+    # number of read URLs, read and total bytes of the list file
+    progress = QtCore.pyqtSignal(int, int, int)
+    # error message if the list could not be read
+    error = QtCore.pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        """Reset reader variables."""
+        super().__init__(parent)
+        self.url_data = None
+        self.filename = None
+        self.maxqueued = MaxQueuedUrls
+
+    def read(self, url_data):
+        """Start reading the URL list file of given URL data, adding its
+        URLs to the queue of the URL data aggregate."""
+        self.url_data = url_data
+        self.filename = url_data.get_os_filename()
+        url_data.aggregate.urlqueue.add_producer()
+        self.start()
+
+    def run(self):
+        """Read the URL list file."""
+        urlqueue = self.url_data.aggregate.urlqueue
+        try:
+            self.read_urls(urlqueue)
+        except OSError as msg:
+            self.error.emit(str(msg))
+        finally:
+            urlqueue.remove_producer()
+
+    def read_urls(self, urlqueue):
+        """Add the URLs of the list file to given URL queue."""
+        url_data = self.url_data
+        total = os.path.getsize(self.filename)
+        urls = 0
+        last = time.monotonic()
+        with open(self.filename, "rb") as raw:
+            with open_url_list(raw) as fp:
+                for lineno, line in enumerate(fp, 1):
+                    line = line.strip()
+                    if not line or line.startswith("#"):
+                        continue
+                    while (len(urlqueue.queue) >= self.maxqueued
+                           and not urlqueue.shutdown):
+                        time.sleep(QueueWait)
+                    if urlqueue.shutdown:
+                        break
+                    urlqueue.put(linkchecker_checker.get_url_from(
+                        line,
+                        url_data.recursion_level + 1,
+                        url_data.aggregate,
+                        parent_url=url_data.url,
+                        line=lineno,
+                        column=0,
+                    ))
+                    urls += 1
+                    now = time.monotonic()
+                    if now - last >= ProgressInterval:
+                        last = now
+                        self.progress.emit(urls, raw.tell(), total)
+                self.progress.emit(urls, raw.tell(), total)
@@ -13,60 +13,79 @@
 # You should have received a copy of the GNU General Public License along
 # with this program; if not, write to the Free Software Foundation, Inc.,
 # 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
-import operator
+from array import array
+from collections import OrderedDict
 from PyQt6 import QtCore, QtGui
 from linkcheck import strformat
+from .urlstore import SortIndex, UrlStore
 
 
 Headers = [_("Parent"), _("URL"), _("Name"), _("Result")]
 EmptyQVariant = QtCore.QVariant()
+# number of URL items with formatted texts kept for displayed rows
+ItemCacheSize = 4096
 
 
 class UrlItem:
     """URL item storing info to be displayed."""
 
+    __slots__ = ("url_data", "_display", "_tooltips", "_result_color")
+
     def __init__(self, url_data):
-        """Save given URL data and initialize display and tooltip texts."""
+        """Save given URL data. Display and tooltip texts are formatted
+        on first access."""
         # url_data is of type CompactUrlData
         self.url_data = url_data
-        # format display and tooltips
-        self.init_display()
-        self.init_tooltips()
-
-    def __getitem__(self, key):
-        """Define easy index access (used for sorting):
-           0: Parent URL
-           1: URL
-           2: URL name
-           3: Result
-        """
-        if not isinstance(key, int):
-            raise TypeError("invalid index %r" % key)
-        if key == 0:
-            return (self.url_data.parent_url, self.url_data.line, self.url_data.column)
-        elif key == 1:
-            return self.url_data.url
-        elif key == 2:
-            return self.url_data.name
-        elif key == 3:
-            return (self.url_data.valid, self.url_data.result)
-        raise IndexError("invalid index %d" % key)
+        self._display = None
+        self._tooltips = None
+        self._result_color = None
+
+    @property
+    def display(self):
+        """Return cached display texts, formatting them when needed."""
+        if self._display is None:
+            self.init_display()
+        return self._display
+
+    @property
+    def tooltips(self):
+        """Return cached tooltip texts, formatting them when needed."""
+        if self._tooltips is None:
+            self.init_tooltips()
+        return self._tooltips
+
+    @property
+    def result_color(self):
+        """Return cached color of the result column."""
+        if self._result_color is None:
+            self.init_display()
+        return self._result_color
+
+    def data(self, column, role):
+        """Return item data of given column for given role."""
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return QtCore.QVariant(self.display[column])
+        elif role == QtCore.Qt.ItemDataRole.ToolTipRole:
+            return QtCore.QVariant(self.tooltips[column])
+        elif role == QtCore.Qt.ItemDataRole.ForegroundRole and column == 3:
+            return QtGui.QColor(self.result_color)
+        return EmptyQVariant
 
     def init_display(self):
         """Store formatted display texts from URL data."""
         # result
         if self.url_data.valid:
             if self.url_data.warnings:
-                self.result_color = QtCore.Qt.GlobalColor.darkYellow
+                self._result_color = QtCore.Qt.GlobalColor.darkYellow
                 text = "\n".join(x[1] for x in self.url_data.warnings)
                 result = "Warning: %s" % strformat.limit(text, length=25)
             else:
-                self.result_color = QtCore.Qt.GlobalColor.darkGreen
+                self._result_color = QtCore.Qt.GlobalColor.darkGreen
                 result = "Valid"
                 if self.url_data.result:
                     result += ": %s" % self.url_data.result
         else:
-            self.result_color = QtCore.Qt.GlobalColor.darkRed
+            self._result_color = QtCore.Qt.GlobalColor.darkRed
             result = "Error"
             if self.url_data.result:
                 result += ": %s" % self.url_data.result
@@ -80,7 +99,7 @@ class UrlItem:
         else:
             parent = ""
         # display values
-        self.display = [
+        self._display = [
             # Parent URL
             parent,
             # URL
@@ -99,7 +118,7 @@ class UrlItem:
             result = strformat.wrap(text, 60)
         else:
             result = ""
-        self.tooltips = [
+        self._tooltips = [
             # Parent URL
             "",
             # URL
@@ -115,14 +134,31 @@ class UrlItemModel(QtCore.QAbstractItemModel):
     """Model class for list of URL items."""
 
     def __init__(self, parent=None):
-        """Set empty URL item list."""
+        """Set empty URL store."""
         super().__init__(parent)
-        # list of UrlItem objects
-        self.urls = []
+        # column oriented URL data
+        self.store = UrlStore()
+        # store record number of each displayed row
+        self.order = array("L")
+        # recently displayed URL items with formatted texts by record number
+        self.items = OrderedDict()
+        # current sort column or None if unsorted
+        self.sort_column = None
+        self.sort_order = QtCore.Qt.SortOrder.AscendingOrder
+        # SortIndex objects by column number
+        self.sort_indexes = {}
+
+    @property
+    def urls(self):
+        """Iterate over URL items in display order."""
+        url_data = self.store.url_data
+        return (UrlItem(url_data[record]) for record in self.order)
 
     def rowCount(self, parent=QtCore.QModelIndex()):
         """Return number of URL items."""
-        return len(self.urls)
+        if parent.isValid():
+            return 0
+        return len(self.order)
 
     def columnCount(self, parent=QtCore.QModelIndex()):
         """Return number of header columns."""
@@ -138,19 +174,10 @@ class UrlItemModel(QtCore.QAbstractItemModel):
 
     def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
         """Return URL item data at given index for given role."""
-        V = QtCore.QVariant
-        if not index.isValid() or not (0 <= index.row() < len(self.urls)):
-            return EmptyQVariant
-        urlitem = self.urls[index.row()]
-        column = index.column()
-        if role == QtCore.Qt.ItemDataRole.DisplayRole:
-            return V(urlitem.display[column])
-        elif role == QtCore.Qt.ItemDataRole.ToolTipRole:
-            return V(urlitem.tooltips[column])
-        elif role == QtCore.Qt.ItemDataRole.ForegroundRole and column == 3:
-            return QtGui.QColor(urlitem.result_color)
-        else:
+        urlitem = self.getUrlItem(index)
+        if urlitem is None:
             return EmptyQVariant
+        return urlitem.data(index.column(), role)
 
     def headerData(self, section, orientation, role):
         """Return header column data for given parameters."""
@@ -169,26 +196,80 @@ class UrlItemModel(QtCore.QAbstractItemModel):
     def clear(self):
         """Empty the URL item list."""
         self.beginResetModel()
-        self.urls = []
+        self.store.clear()
+        self.order = array("L")
+        self.items.clear()
+        self.sort_indexes = {}
         self.endResetModel()
 
     def log_url(self, url_data):
         """Add URL data to tree model."""
-        row = self.rowCount()
-        self.beginInsertRows(QtCore.QModelIndex(), row, row)
-        self.urls.append(UrlItem(url_data))
-        self.endInsertRows()
+        return self.log_urls([url_data])
+
+    def log_urls(self, url_datas):
+        """Add a list of URL data to tree model. If the model is sorted,
+        the URL data is inserted at its sorted position, else it is
+        appended with one row insertion."""
+        if not url_datas:
+            return False
+        if self.sort_column is None:
+            row = self.rowCount()
+            self.beginInsertRows(QtCore.QModelIndex(), row, row + len(url_datas) - 1)
+            self.order.extend(self.store.append(url_data) for url_data in url_datas)
+            self.endInsertRows()
+            return True
+        index = self.get_sort_index(self.sort_column)
+        for url_data in url_datas:
+            self.store.append(url_data)
+        descending = self.sort_order == QtCore.Qt.SortOrder.DescendingOrder
+        for row, records in index.insert(self.store, descending):
+            self.beginInsertRows(QtCore.QModelIndex(), row, row + len(records) - 1)
+            self.order[row:row] = array("L", records)
+            self.endInsertRows()
         return True
 
+    def get_url_datas(self):
+        """Return list of URL data in display order."""
+        url_data = self.store.url_data
+        return [url_data[record] for record in self.order]
+
     def getUrlItem(self, index):
         """Get URL item object at given index."""
-        if not index.isValid() or not (0 <= index.row() < len(self.urls)):
+        if not index.isValid() or not (0 <= index.row() < len(self.order)):
             return None
-        return self.urls[index.row()]
+        return self.get_item(self.order[index.row()])
+
+    def get_item(self, record):
+        """Return URL item for given store record. Recently used items
+        are cached together with their formatted texts."""
+        urlitem = self.items.get(record)
+        if urlitem is None:
+            urlitem = UrlItem(self.store.url_data[record])
+            self.items[record] = urlitem
+            if len(self.items) > ItemCacheSize:
+                self.items.popitem(last=False)
+        else:
+            self.items.move_to_end(record)
+        return urlitem
+
+    def get_sort_index(self, column):
+        """Return up-to-date sort index for given column."""
+        index = self.sort_indexes.get(column)
+        if index is None:
+            index = self.sort_indexes[column] = SortIndex(column)
+        index.update(self.store)
+        return index
 
     def sort(self, column, order=QtCore.Qt.SortOrder.AscendingOrder):
-        """Sort URL items by given column and order."""
+        """Sort URL items by given column and order. The sorted order of
+        each column is computed once and kept up-to-date afterwards."""
         self.layoutAboutToBeChanged.emit()
-        reverse = order == QtCore.Qt.SortOrder.DescendingOrder
-        self.urls.sort(key=operator.itemgetter(column), reverse=reverse)
+        if column < 0:
+            self.sort_column = None
+            self.order = array("L", range(len(self.store)))
+        else:
+            self.sort_column = column
+            self.sort_order = order
+            descending = order == QtCore.Qt.SortOrder.DescendingOrder
+            self.order = self.get_sort_index(column).get_records(descending)
         self.layoutChanged.emit()
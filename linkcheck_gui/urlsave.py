@@ -13,7 +13,10 @@
 # You should have received a copy of the GNU General Public License along
 # with this program; if not, write to the Free Software Foundation, Inc.,
 # 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
-from PyQt6 import QtWidgets
+import copy
+import os
+
+from PyQt6 import QtCore, QtWidgets
 
 FilterHtml = _("HTML output (*.html)")
 FilterText = _("Text output (*.txt)")
@@ -42,23 +45,84 @@ Logtype2FileExt = {
     "csv": ".csv",
 }
 
+# number of written URLs between progress signals
+ProgressStep = 500
 
-def urlsave(parent, config, urls):
-    """Save URL results in file."""
-    filename, logtype = get_save_filename(parent)
-    if not filename:
-        # user canceled
-        return
-    kwargs = dict(fileoutput=1, filename=filename, encoding="utf_8_sig")
-    logger = config.logger_new(logtype, **kwargs)
+
+def write_urls(logger, url_datas, stats, progress=None, canceled=None):
+    """Write URL data with given logger. The optional progress function
+    is called with the number of written and total URLs, the optional
+    canceled function stops writing when it returns True. Without given
+    statistics, the statistics of the written URLs are printed.
+    Return False if writing has been canceled, else True."""
+    total = len(url_datas)
     logger.start_output()
-    for urlitem in urls:
+    for i, url_data in enumerate(url_datas):
+        if i % ProgressStep == 0:
+            if canceled is not None and canceled():
+                logger.close_fileoutput()
+                return False
+            if progress is not None:
+                progress(i, total)
         do_print = True
-        logger.log_filter_url(urlitem.url_data, do_print)
-    # inject the saved statistics before printing them
-    logger.stats = config['logger'].stats
+        logger.log_filter_url(url_data, do_print)
+    if stats is not None:
+        # inject the saved statistics before printing them
+        logger.stats = stats
     logger.end_output()
-    return logtype
+    return True
+
+
+class UrlSaveThread(QtCore.QThread):
+    """Write a snapshot of URL results to a file in a separate thread."""
+
+    # number of written and total URLs
+    progress = QtCore.pyqtSignal(int, int)
+
+    def __init__(self, parent=None):
+        """Reset save variables."""
+        super().__init__(parent)
+        self.logger = None
+        self.url_datas = []
+        self.stats = None
+        self.filename = None
+        self.canceled = False
+        self.saved = False
+
+    def save(self, logger, url_datas, stats, filename):
+        """Set save variables and start the thread. The URL data list
+        and statistics must not be changed while saving."""
+        self.logger = logger
+        self.url_datas = url_datas
+        self.stats = copy.copy(stats)
+        self.filename = filename
+        self.canceled = False
+        self.saved = False
+        self.start()
+
+    def cancel(self):
+        """Set stop flag."""
+        self.canceled = True
+
+    def is_canceled(self):
+        """Return stop flag."""
+        return self.canceled
+
+    def run(self):
+        """Write URL data and remove the file if saving was canceled."""
+        self.saved = write_urls(self.logger, self.url_datas, self.stats,
+                                progress=self.progress.emit,
+                                canceled=self.is_canceled)
+        if not self.saved and os.path.isfile(self.filename):
+            os.remove(self.filename)
+        self.logger = None
+        self.url_datas = []
+
+
+def get_logger(config, filename, logtype):
+    """Return a new logger of given type writing to filename."""
+    kwargs = dict(fileoutput=1, filename=filename, encoding="utf_8_sig")
+    return config.logger_new(logtype, **kwargs)
 
 
 def get_save_filename(parent):
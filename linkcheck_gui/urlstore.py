@@ -0,0 +1,294 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+Column oriented storage of logged URL data.
+"""
+from array import array
+import bisect
+import collections
+import heapq
+import itertools
+import operator
+
+from linkcheck.checker.urlbase import urlDataAttr
+
+# URL data attributes stored in the columns of a UrlStore only
+ColumnAttrs = ("valid", "result", "parent_url", "line", "column")
+
+# columns of a UrlStore read by StoredUrlData objects
+StoreFields = collections.namedtuple(
+    "StoreFields", ("strings", "parents", "results", "valid", "lines", "columns"))
+
+
+class StoredUrlData:
+    """URL data of a UrlStore record with the attributes of CompactUrlData.
+    The attributes in ColumnAttrs are read from the columns of the store
+    instead of being stored again in each object."""
+
+    __slots__ = ("fields", "record") + tuple(
+        attr for attr in urlDataAttr if attr not in ColumnAttrs)
+
+    def __init__(self, url_data, fields, record):
+        """Copy the attributes of given URL data which are not stored in
+        given store columns at given record number."""
+        self.fields = fields
+        self.record = record
+        for attr in self.__slots__[2:]:
+            setattr(self, attr, getattr(url_data, attr))
+
+    @property
+    def valid(self):
+        """Return True if the URL is valid."""
+        return bool(self.fields.valid[self.record])
+
+    @property
+    def result(self):
+        """Return result string."""
+        return self.fields.strings[self.fields.results[self.record]]
+
+    @property
+    def parent_url(self):
+        """Return parent URL."""
+        return self.fields.strings[self.fields.parents[self.record]]
+
+    @property
+    def line(self):
+        """Return line number of the link or None."""
+        line = self.fields.lines[self.record]
+        return None if line < 0 else line
+
+    @property
+    def column(self):
+        """Return column number of the link or None."""
+        column = self.fields.columns[self.record]
+        return None if column < 0 else column
+
+
+class UrlStore:
+    """Store logged URL data in columns. Each logged URL gets a record
+    number which indexes all columns. Parent URLs and results are
+    interned in a string table, so equal strings are stored once. The
+    StoredUrlData objects of the records read validity, result, parent
+    URL, line and column from the columns."""
+
+    __slots__ = (
+        "strings", "string_ids", "url_data", "parents", "results",
+        "valid", "warnings", "lines", "columns", "fields",
+    )
+
+    def __init__(self):
+        """Initialize empty columns."""
+        self.clear()
+
+    def clear(self):
+        """Remove all records. StoredUrlData objects of removed records
+        keep the columns they read from."""
+        # string table, index 0 is the empty string
+        self.strings = [""]
+        self.string_ids = {"": 0}
+        # StoredUrlData objects, needed for URL properties and saving
+        self.url_data = []
+        # string table indexes of parent URLs and results
+        self.parents = array("L")
+        self.results = array("L")
+        # boolean flags stored as bytes
+        self.valid = array("b")
+        self.warnings = array("b")
+        # line and column numbers, -1 if unknown
+        self.lines = array("l")
+        self.columns = array("l")
+        self.fields = StoreFields(self.strings, self.parents, self.results,
+                                  self.valid, self.lines, self.columns)
+
+    def __len__(self):
+        """Return number of records."""
+        return len(self.url_data)
+
+    def intern(self, s):
+        """Return string table index of given string, adding it to the
+        table if needed."""
+        if not s:
+            return 0
+        string_id = self.string_ids.get(s)
+        if string_id is None:
+            string_id = len(self.strings)
+            self.strings.append(s)
+            self.string_ids[s] = string_id
+        return string_id
+
+    def append(self, url_data):
+        """Add a CompactUrlData object as StoredUrlData and return its
+        record number."""
+        record = len(self.url_data)
+        self.parents.append(self.intern(url_data.parent_url))
+        self.results.append(self.intern(url_data.result))
+        self.valid.append(bool(url_data.valid))
+        self.warnings.append(bool(url_data.warnings))
+        self.lines.append(-1 if url_data.line is None else url_data.line)
+        self.columns.append(-1 if url_data.column is None else url_data.column)
+        self.url_data.append(StoredUrlData(url_data, self.fields, record))
+        return record
+
+    def parent_url(self, record):
+        """Return parent URL of given record."""
+        return self.strings[self.parents[record]]
+
+    def result(self, record):
+        """Return result string of given record."""
+        return self.strings[self.results[record]]
+
+    def sort_keys(self, column, start=0):
+        """Return list of sort keys for the records from start on for the
+        given URL tree column:
+           0: Parent URL, line and column
+           1: URL
+           2: URL name
+           3: Validity and result
+        """
+        strings = self.strings
+        if column == 0:
+            return [
+                (strings[parent], line, col)
+                for parent, line, col in zip(
+                    self.parents[start:], self.lines[start:], self.columns[start:])
+            ]
+        elif column == 1:
+            return [url_data.url or "" for url_data in self.url_data[start:]]
+        elif column == 2:
+            return [url_data.name or "" for url_data in self.url_data[start:]]
+        elif column == 3:
+            return [
+                (valid, strings[result])
+                for valid, result in zip(self.valid[start:], self.results[start:])
+            ]
+        raise IndexError("invalid column %d" % column)
+
+
+class SortIndex:
+    """Records of a UrlStore in ascending order of the sort keys of one
+    URL tree column. The sort keys are computed once per record and new
+    records are merged or inserted without sorting all records again."""
+
+    __slots__ = ("column", "keys", "records", "sorted_keys")
+
+    def __init__(self, column):
+        """Initialize an empty index for given column."""
+        self.column = column
+        # sort key of each record, indexed by record number
+        self.keys = []
+        # record numbers in ascending key order
+        self.records = array("L")
+        # sort keys in ascending order, parallel to self.records
+        self.sorted_keys = []
+
+    def update_keys(self, store):
+        """Compute sort keys of records added to the store."""
+        if len(self.keys) < len(store):
+            self.keys.extend(store.sort_keys(self.column, start=len(self.keys)))
+
+    def get_new_records(self, store):
+        """Return records added to the store since the last update in
+        ascending key order."""
+        self.update_keys(store)
+        return sorted(range(len(self.records), len(store)), key=self.keys.__getitem__)
+
+    def update(self, store):
+        """Merge records added to the store since the last update."""
+        new = self.get_new_records(store)
+        if not new:
+            return
+        keys = self.keys
+        if self.records:
+            # records with equal keys keep their record number order
+            merged = list(heapq.merge(
+                zip(self.sorted_keys, self.records),
+                ((keys[record], record) for record in new),
+                key=operator.itemgetter(0),
+            ))
+            self.sorted_keys = [key for key, record in merged]
+            self.records = array("L", [record for key, record in merged])
+        else:
+            self.sorted_keys = [keys[record] for record in new]
+            self.records = array("L", new)
+
+    def get_records(self, descending=False):
+        """Return array of all records in ascending or descending key
+        order. Records with equal keys are in record number order in both
+        orders, like a stable sort."""
+        if not descending:
+            return array("L", self.records)
+        return get_descending(self.sorted_keys, self.records)
+
+    def insert(self, store, descending=False):
+        """Insert records added to the store since the last update.
+        Return a list of (row, records) tuples with the rows of the new
+        records in ascending or descending key order, grouping new records
+        with adjacent rows. Each row is valid after the preceding groups
+        have been inserted. Records with equal keys are in record number
+        order in both orders."""
+        new = self.get_new_records(store)
+        keys = self.keys
+        sorted_keys = self.sorted_keys
+        groups = []
+        i = 0
+        while i < len(new):
+            key = keys[new[i]]
+            pos = bisect.bisect_right(sorted_keys, key)
+            tie = pos > 0 and sorted_keys[pos - 1] == key
+            j = i + 1
+            if tie:
+                # new records follow the old records with the same key
+                while j < len(new) and keys[new[j]] == key:
+                    j += 1
+            elif pos < len(sorted_keys):
+                limit = sorted_keys[pos]
+                while j < len(new) and keys[new[j]] < limit:
+                    j += 1
+            else:
+                j = len(new)
+            group = new[i:j]
+            group_keys = [keys[record] for record in group]
+            if not descending:
+                groups.append((pos, group))
+            elif tie:
+                start = bisect.bisect_left(sorted_keys, key, 0, pos)
+                groups.append((len(sorted_keys) - start, group))
+            else:
+                groups.append((len(sorted_keys) - pos,
+                               get_descending(group_keys, group)))
+            self.records[pos:pos] = array("L", group)
+            sorted_keys[pos:pos] = group_keys
+            i = j
+        return groups
+
+
+def get_descending(sorted_keys, records):
+    """Return array of given records in ascending order of given keys in
+    descending key order. Records with equal keys keep their order."""
+    result = array("L", records[::-1])
+    keys = sorted_keys[::-1]
+    # positions of the keys equal to the preceding key
+    ties = itertools.compress(range(1, len(keys)), map(operator.eq, keys[1:], keys))
+    start = end = None
+    for pos in ties:
+        if pos != end:
+            if end is not None:
+                result[start:end] = result[start:end][::-1]
+            start = pos - 1
+        end = pos + 1
+    if end is not None:
+        result[start:end] = result[start:end][::-1]
+    return result
@@ -0,0 +1,246 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+URL tree model grouping checked URLs under their parent URL.
+"""
+from array import array
+
+from PyQt6 import QtCore, QtGui
+
+from .urlmodel import EmptyQVariant, Headers
+
+# number of child rows added to an expanded parent URL at once
+FetchSize = 256
+
+
+class UrlGroup:
+    """Checked URLs of one parent URL."""
+
+    __slots__ = ("row", "parent_url", "children", "fetched", "errors", "warnings")
+
+    def __init__(self, row, parent_url):
+        """Initialize empty group at given top level row."""
+        self.row = row
+        self.parent_url = parent_url
+        # store records ordered by line and column in the parent URL
+        self.children = array("L")
+        # number of children shown in the tree
+        self.fetched = 0
+        self.errors = 0
+        self.warnings = 0
+
+    def find(self, record, lines, columns):
+        """Return position of record in the children ordered by line and
+        column."""
+        key = (lines[record], columns[record])
+        children = self.children
+        lo, hi = 0, len(children)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            child = children[mid]
+            if key < (lines[child], columns[child]):
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    def get_result(self):
+        """Return result summary text and color."""
+        total = len(self.children)
+        text = _n("%d URL", "%d URLs", total) % total
+        if self.errors:
+            text += _n(", %d error", ", %d errors", self.errors) % self.errors
+            color = QtCore.Qt.GlobalColor.darkRed
+        elif self.warnings:
+            text += _n(", %d warning", ", %d warnings", self.warnings) % self.warnings
+            color = QtCore.Qt.GlobalColor.darkYellow
+        else:
+            color = QtCore.Qt.GlobalColor.darkGreen
+        return text, color
+
+
+class UrlTreeModel(QtCore.QAbstractItemModel):
+    """Model showing the URLs of a UrlItemModel grouped under their parent
+    URL. The parent to children index is updated with the rows inserted
+    into the URL model, and children are fetched when a parent URL is
+    expanded, so expanding costs O(children) and not O(rows)."""
+
+    def __init__(self, model, parent=None):
+        """Group the URLs of given UrlItemModel."""
+        super().__init__(parent)
+        self.model = model
+        self.clear_groups()
+        model.rowsInserted.connect(self.update)
+        model.modelAboutToBeReset.connect(self.beginResetModel)
+        model.modelReset.connect(self.reset)
+
+    def clear_groups(self):
+        """Remove all groups."""
+        # number of grouped store records
+        self.size = 0
+        # UrlGroup objects in top level row order
+        self.groups = []
+        # UrlGroup objects by string table index of the parent URL
+        self.group_ids = {}
+
+    def reset(self):
+        """Remove all groups after the URL model has been reset."""
+        self.clear_groups()
+        self.endResetModel()
+
+    def update(self, *args):
+        """Group the records added to the URL store since the last update."""
+        store = self.model.store
+        if self.size >= len(store):
+            return
+        new_groups = []
+        changed = set()
+        for record in range(self.size, len(store)):
+            parent_id = store.parents[record]
+            group = self.group_ids.get(parent_id)
+            if group is None:
+                row = len(self.groups) + len(new_groups)
+                group = UrlGroup(row, store.strings[parent_id])
+                self.group_ids[parent_id] = group
+                new_groups.append(group)
+            group.errors += not store.valid[record]
+            group.warnings += store.warnings[record]
+            pos = group.find(record, store.lines, store.columns)
+            if group.row < len(self.groups):
+                changed.add(group)
+                shown = group.fetched and group.fetched == len(group.children)
+                if pos < group.fetched or (shown and pos == group.fetched):
+                    # show the new row among the fetched rows
+                    parent = self.createIndex(group.row, 0, None)
+                    self.beginInsertRows(parent, pos, pos)
+                    group.children.insert(pos, record)
+                    group.fetched += 1
+                    self.endInsertRows()
+                    continue
+            group.children.insert(pos, record)
+        self.size = len(store)
+        last = len(Headers) - 1
+        for group in changed:
+            self.dataChanged.emit(self.createIndex(group.row, 0, None),
+                                  self.createIndex(group.row, last, None))
+        if new_groups:
+            row = len(self.groups)
+            self.beginInsertRows(QtCore.QModelIndex(), row, row + len(new_groups) - 1)
+            self.groups.extend(new_groups)
+            self.endInsertRows()
+
+    def get_group(self, index):
+        """Return group of given top level index or None."""
+        if not index.isValid() or index.internalPointer() is not None:
+            return None
+        return self.groups[index.row()]
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """Return number of parent URLs or fetched children."""
+        if not parent.isValid():
+            return len(self.groups)
+        group = self.get_group(parent)
+        return 0 if group is None else group.fetched
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        """Return number of header columns."""
+        return len(Headers)
+
+    def hasChildren(self, parent=QtCore.QModelIndex()):
+        """Return True if given index has child URLs, fetched or not."""
+        if not parent.isValid():
+            return bool(self.groups)
+        group = self.get_group(parent)
+        return group is not None and bool(group.children)
+
+    def canFetchMore(self, parent):
+        """Return True if children of given parent URL are not fetched yet."""
+        group = self.get_group(parent)
+        return group is not None and group.fetched < len(group.children)
+
+    def fetchMore(self, parent):
+        """Add the next children of given parent URL."""
+        group = self.get_group(parent)
+        if group is None:
+            return
+        count = min(FetchSize, len(group.children) - group.fetched)
+        if count <= 0:
+            return
+        self.beginInsertRows(parent, group.fetched, group.fetched + count - 1)
+        group.fetched += count
+        self.endInsertRows()
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        """Return index of parent URL or child URL in given row and column."""
+        if not parent.isValid():
+            if 0 <= row < len(self.groups):
+                return self.createIndex(row, column, None)
+            return QtCore.QModelIndex()
+        group = self.get_group(parent)
+        if group is None or not (0 <= row < group.fetched):
+            return QtCore.QModelIndex()
+        return self.createIndex(row, column, group)
+
+    def parent(self, child=QtCore.QModelIndex()):
+        """Return parent URL index of given child URL index."""
+        if not child.isValid():
+            return QtCore.QModelIndex()
+        group = child.internalPointer()
+        if group is None:
+            return QtCore.QModelIndex()
+        return self.createIndex(group.row, 0, None)
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        """Return parent or child URL data at given index for given role."""
+        if not index.isValid():
+            return EmptyQVariant
+        group = self.get_group(index)
+        if group is None:
+            urlitem = self.getUrlItem(index)
+            if urlitem is None:
+                return EmptyQVariant
+            return urlitem.data(index.column(), role)
+        column = index.column()
+        if role in (QtCore.Qt.ItemDataRole.DisplayRole,
+                    QtCore.Qt.ItemDataRole.ToolTipRole):
+            if column == 0:
+                return QtCore.QVariant(group.parent_url or _("Start URLs"))
+            if column == 3:
+                return QtCore.QVariant(group.get_result()[0])
+        elif role == QtCore.Qt.ItemDataRole.ForegroundRole and column == 3:
+            return QtGui.QColor(group.get_result()[1])
+        return EmptyQVariant
+
+    def headerData(self, section, orientation, role):
+        """Return header column data for given parameters."""
+        return self.model.headerData(section, orientation, role)
+
+    def flags(self, index):
+        """Return flags that given valid item index is enabled and
+        selected."""
+        if not index.isValid():
+            return QtCore.Qt.ItemFlag.NoItemFlags
+        return QtCore.Qt.ItemFlag.ItemIsEnabled | QtCore.Qt.ItemFlag.ItemIsSelectable
+
+    def getUrlItem(self, index):
+        """Get URL item object of the child URL at given index, or None for
+        parent URLs."""
+        if not index.isValid():
+            return None
+        group = index.internalPointer()
+        if group is None or not (0 <= index.row() < group.fetched):
+            return None
+        return self.model.get_item(group.children[index.row()])
@@ -0,0 +1,45 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+import random
+import unittest
+
+from linkcheck_gui.library.sketch import QuantileSketch
+
+
+class TestQuantileSketch(unittest.TestCase):
+    """Test sketch module."""
+
+    def test_quantile(self):
+        sketch = QuantileSketch()
+        assert sketch.quantile(0.5) is None
+        rnd = random.Random(42)
+        values = [rnd.lognormvariate(-2, 1.5) for _i in range(20000)]
+        for value in values:
+            sketch.add(value)
+        assert len(sketch) == len(values)
+        values.sort()
+        for q in (0.5, 0.95, 0.99):
+            exact = values[int(q * (len(values) - 1))]
+            assert abs(sketch.quantile(q) - exact) <= exact * 0.01
+        assert sketch.quantile(1) == values[-1]
+
+    def test_bounded(self):
+        sketch = QuantileSketch()
+        sketch.add(0)
+        for i in range(100000):
+            sketch.add(1e-6 + i * 0.864)
+        assert len(sketch.buckets) <= 1260
+        assert sketch.quantile(0) == 0.0
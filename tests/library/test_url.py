@@ -0,0 +1,119 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+import unittest
+
+from linkcheck_gui.library.url import Fetcher
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Serve pages with ETag revalidation and a cookie, counting the sent
+    bodies and the received cookies."""
+
+    def do_GET(self):
+        server = self.server
+        server.cookies.append(self.headers.get("Cookie"))
+        etag = '"%s"' % self.path
+        if self.path == "/nocache":
+            etag = None
+        if etag and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = ("<html>%s</html>" % self.path).encode("ascii")
+        content_type = "text/html"
+        if self.path == "/xml":
+            # no declared encoding
+            body = "<p>Grüße aus Köln</p>".encode("utf-16")
+            content_type = "application/xml"
+        server.bodies.append(self.path)
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Set-Cookie", "visited=%s" % self.path)
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestFetcher(unittest.TestCase):
+    """Test the cached fetcher of URL contents."""
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.bodies = []
+        self.server.cookies = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base = "http://127.0.0.1:%d" % self.server.server_address[1]
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_revalidate(self):
+        fetcher = Fetcher()
+        for _i in range(3):
+            text, headers = fetcher.get_content(self.base + "/page")
+            assert text == "<html>/page</html>"
+            assert headers["Content-Type"] == "text/html"
+        assert self.server.bodies == ["/page"]
+        fetcher.get_content(self.base + "/nocache")
+        fetcher.get_content(self.base + "/nocache")
+        assert self.server.bodies == ["/page", "/nocache", "/nocache"]
+        # extra headers are not cached
+        fetcher.get_content(self.base + "/page", addheaders={"Accept": "*/*"})
+        assert self.server.bodies[-1] == "/page"
+
+    def test_bounded(self):
+        fetcher = Fetcher(maxpages=2, maxsize=40)
+        for path in ("/a", "/b", "/a", "/c"):
+            fetcher.get_content(self.base + path)
+        # /b was the least recently used page
+        assert [key[0][-2:] for key in fetcher.cache] == ["/a", "/c"]
+        assert fetcher.size == 2 * len("<html>/a</html>")
+        fetcher.get_content(self.base + "/" + "x" * 40)
+        assert len(fetcher.cache) == 2
+        fetcher.clear()
+        assert (fetcher.cache, fetcher.size) == ({}, 0)
+
+    def test_sessions(self):
+        fetcher = Fetcher()
+        fetcher.get_content(self.base + "/nocache")
+        fetcher.get_content(self.base + "/nocache")
+        assert self.server.cookies == [None, None]
+        sessions = []
+        thread = threading.Thread(
+            target=lambda: sessions.append(fetcher.get_session()))
+        thread.start()
+        thread.join()
+        assert sessions[0] is fetcher.get_session()
+
+    def test_encoding(self):
+        fetcher = Fetcher()
+        parts = []
+        text, headers = fetcher.get_content(self.base + "/xml", receive=parts.append)
+        assert text == "".join(parts) == "<p>Grüße aus Köln</p>"
+        assert fetcher.get_content(self.base + "/xml")[0] == text
+
+    def test_error(self):
+        text, msg = Fetcher().get_content("http://127.0.0.1:1/")
+        assert text is None
+        assert msg
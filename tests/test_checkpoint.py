@@ -0,0 +1,205 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+import datetime
+import os
+import sqlite3
+import tempfile
+from types import SimpleNamespace
+import unittest
+
+from linkcheck.cache.results import ResultCache
+
+from linkcheck_gui.checkpoint import (Checkpoint, CheckpointUrlQueue,
+                                      add_cached_results)
+from linkcheck_gui.history import CheckedUrl, CheckHistory, get_unchanged
+from linkcheck_gui.resultdb import ResultDB, to_queue_row
+from linkcheck_gui.urlstore import UrlStore
+
+from .test_urlmodel import get_url_data
+
+
+def get_queued_url(aggregate, i):
+    """Return object with the attributes of a queued URL."""
+    return SimpleNamespace(
+        aggregate=aggregate, has_result=False, url="http://example.com/%d" % i,
+        cache_url="http://example.com/%d" % i, base_url="/%d" % i,
+        recursion_level=1, parent_url="http://example.com/", base_ref="",
+        line=i, column=1, page=0, name="link %d" % i, extern=None)
+
+
+class TestCheckpoint(unittest.TestCase):
+    """Test result database and checkpoints of running checks."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, "data", "checkpoint.sqlite")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_resultdb(self):
+        url_data = get_url_data(
+            warnings=[("tag", "moved")], extern=(1, 0), size=12, checktime=0.5,
+            modified=datetime.datetime(2026, 1, 2, 3, 4, 5,
+                                       tzinfo=datetime.timezone.utc),
+            valid=False, cache_url="http://example.com/a")
+        os.makedirs(os.path.dirname(self.filename))
+        db = ResultDB(self.filename)
+        db.add_results([url_data, get_url_data(url="http://example.com/b")])
+        db.set_meta("url", "http://example.com/")
+        db.close()
+        db = ResultDB(self.filename)
+        assert db.count_results() == 2
+        assert db.get_meta("url") == "http://example.com/"
+        result = db.get_results()[0]
+        for attr in ("valid", "warnings", "extern", "size", "checktime",
+                     "modified", "url", "line"):
+            assert getattr(result, attr) == getattr(url_data, attr)
+        db.close()
+
+    def test_resume(self):
+        aggregate = SimpleNamespace(result_cache=ResultCache(100))
+        urlqueue = CheckpointUrlQueue()
+        for i in range(4):
+            urlqueue.put(get_queued_url(aggregate, i))
+        checkpoint = Checkpoint(self.filename)
+        assert not checkpoint.is_resumable()
+        checkpoint.start("http://example.com/")
+        store = UrlStore()
+        # URL 0 is checked, URL 1 is being checked
+        first = urlqueue.get()
+        second = urlqueue.get()
+        urlqueue.task_done(first)
+        checkpoint.save(store, urlqueue)
+        store.append(get_url_data(url=first.url, cache_url=first.cache_url))
+        checkpoint.save(store, urlqueue)
+        # the check is canceled while URL 1 is being checked
+        urlqueue.do_shutdown()
+        checkpoint.save(store, urlqueue)
+        assert checkpoint.is_resumable()
+        checkpoint.close()
+        checkpoint = Checkpoint(self.filename)
+        url, results, queue = checkpoint.load()
+        assert url == "http://example.com/"
+        assert [url_data.url for url_data in results] == [first.url]
+        assert sorted(data["cache_url"] for data in queue) == [
+            "http://example.com/1", "http://example.com/2", "http://example.com/3"]
+        assert queue[0]["base_url"] == "/2"
+        assert second.cache_url in {data["cache_url"] for data in queue}
+        checkpoint.finish()
+        assert not checkpoint.is_resumable()
+        checkpoint.close()
+
+    def test_save_rows(self):
+        aggregate = SimpleNamespace(result_cache=ResultCache(100))
+        rows = [to_queue_row(get_queued_url(aggregate, i)) for i in range(3)]
+        checkpoint = Checkpoint(self.filename)
+        checkpoint.start("http://example.com/")
+        store = UrlStore()
+        for i in range(3):
+            store.append(get_url_data(url="http://example.com/%d" % i,
+                                      cache_url="http://example.com/%d" % i))
+        # URL 2 was logged after the snapshot of the rows
+        checkpoint.save_rows(store, rows[1:], ["http://example.com/2"])
+        url, results, queue = checkpoint.load()
+        assert [url_data.url for url_data in results] == [
+            "http://example.com/0", "http://example.com/1"]
+        assert [data["cache_url"] for data in queue] == ["http://example.com/2"]
+        checkpoint.save_rows(store, [])
+        url, results, queue = checkpoint.load()
+        assert len(results) == 3
+        assert queue == []
+        checkpoint.close()
+
+    def test_stop_tracking(self):
+        aggregate = SimpleNamespace(result_cache=ResultCache(100))
+        urlqueue = CheckpointUrlQueue()
+        for i in range(3):
+            urlqueue.put(get_queued_url(aggregate, i))
+        urlqueue.task_done(urlqueue.get())
+        urlqueue.get()
+        urlqueue.stop_tracking()
+        assert (urlqueue.active, urlqueue.done) == ({}, [])
+        urlqueue.task_done(urlqueue.get())
+        urlqueue.do_shutdown()
+        assert (urlqueue.active, urlqueue.done, urlqueue.canceled) == ({}, [], [])
+
+    def test_add_cached_results(self):
+        result_cache = ResultCache(1)
+        add_cached_results(result_cache, [("a", None), ("b", None), ("c", None)])
+        assert sorted(result_cache.cache) == ["a", "b", "c"]
+        # the check keeps room for its own results
+        result_cache.add_result("d", None)
+        assert "d" in result_cache.cache
+
+    def test_upgrade(self):
+        os.makedirs(os.path.dirname(self.filename))
+        conn = sqlite3.connect(self.filename)
+        conn.execute("CREATE TABLE history (id INTEGER PRIMARY KEY, url, cache_url,"
+                     " valid, warning, modified, size, parent_url)")
+        conn.close()
+        db = ResultDB(self.filename)
+        db.add_history([("u", "u", True, False, None, 1, None, None)])
+        assert db.get_history() == [("u", "u", 1, 0, None, 1, None, None)]
+        db.close()
+
+    def test_history(self):
+        now = datetime.datetime(2026, 3, 1, tzinfo=datetime.timezone.utc)
+        checked = (now - datetime.timedelta(days=1)).isoformat()
+        old = (now - datetime.timedelta(days=30)).isoformat()
+        entries = [
+            CheckedUrl("http://example.com/", "http://example.com/", True,
+                       False, None, 100, None, checked),
+            CheckedUrl("http://example.com/ok", "http://example.com/ok", True,
+                       False, "2026-01-02T03:04:05+00:00", 10, "http://example.com/",
+                       checked),
+            CheckedUrl("http://example.com/bad", "http://example.com/bad", False,
+                       False, None, 0, "http://example.com/", checked),
+            CheckedUrl("http://example.com/warn", "http://example.com/warn", True,
+                       True, None, 5, "http://example.com/", checked),
+            # a cached URL which failed when checked from another parent
+            CheckedUrl("http://example.com/twice", "http://example.com/twice", True,
+                       False, None, 5, "http://example.com/", checked),
+            CheckedUrl("http://example.com/twice#a", "http://example.com/twice", False,
+                       False, None, 5, "http://example.com/", checked),
+            CheckedUrl("http://example.com/page", "http://example.com/page", True,
+                       False, None, 50, "http://example.com/", checked),
+            CheckedUrl("http://example.com/img", "http://example.com/img", True,
+                       False, None, 20, "http://example.com/page", checked),
+        ]
+        assert get_unchanged(entries, now) == {
+            "http://example.com/ok", "http://example.com/img"}
+        # URLs are checked again after some time
+        entries.append(CheckedUrl("http://example.com/old", "http://example.com/old",
+                                  True, False, None, 5, "http://example.com/", old))
+        assert "http://example.com/old" not in get_unchanged(entries, now)
+        assert get_unchanged(entries, now, maxage=60) == set()
+        checkpoint = Checkpoint(self.filename)
+        assert checkpoint.load_history("http://example.com/") is None
+        checkpoint.start("http://example.com/", entries[:2])
+        history = CheckHistory()
+        history.add(get_url_data(url="http://example.com/new",
+                                 cache_url="http://example.com/new"))
+        checkpoint.save(UrlStore(), CheckpointUrlQueue(), history)
+        assert history.take() == []
+        assert checkpoint.load_history("http://example.com/") is None
+        checkpoint.finish()
+        assert checkpoint.load_history("http://example.com/other") is None
+        results, loaded = checkpoint.load_history("http://example.com/")
+        assert results == []
+        assert loaded[:2] == entries[:2]
+        assert loaded[2].url == "http://example.com/new"
+        checkpoint.close()
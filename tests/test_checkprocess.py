@@ -0,0 +1,209 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+import os
+import signal
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+import unittest
+from unittest.mock import MagicMock, patch
+
+from linkcheck import checker as linkchecker_checker
+from linkcheck import configuration as linkchecker_configuration
+from linkcheck import director
+
+from linkcheck_gui import checkprocess
+from linkcheck_gui.checkprocess import CheckProcess, get_config_values, MaxRestarts
+from linkcheck_gui.logger import SignalLogger, StatusLogger
+from linkcheck_gui.resultdb import get_values, QueueAttrs, to_queue_row
+
+from .test_logger import MockSignal
+from .test_urlmodel import get_url_data
+
+
+class MockConnection:
+    """Connection receiving given messages."""
+
+    def __init__(self, messages):
+        self.messages = list(messages)
+
+    def poll(self, timeout):
+        return True
+
+    def recv(self):
+        return self.messages.pop(0)
+
+
+class MockSender:
+    """PipeSender collecting the sent messages."""
+
+    def __init__(self):
+        self.sent = []
+
+    def send(self, kind, data):
+        self.sent.append((kind, data))
+
+
+class TestCheckProcess(unittest.TestCase):
+    """Test checking in a separate process."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.urls = MockSignal()
+        self.stats = MockSignal()
+        config = linkchecker_configuration.Configuration()
+        config["logger"] = SignalLogger(signal=self.urls, stats=self.stats)
+        config["status"] = True
+        # stopping each idle checker thread takes up to a second
+        config["threads"] = 1
+        config.set_status_logger(StatusLogger())
+        self.aggregate = director.get_aggregate(config)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write_file(self, name, content):
+        """Write HTML file and return its filename."""
+        filename = os.path.join(self.tmpdir.name, name)
+        with open(filename, "w") as fp:
+            fp.write(content)
+        return filename
+
+    def put_file(self, name, content):
+        """Write HTML file and queue its URL."""
+        filename = self.write_file(name, content)
+        url_data = linkchecker_checker.get_url_from(
+            filename, 0, self.aggregate, extern=(0, 0))
+        self.aggregate.urlqueue.put(url_data)
+        return url_data
+
+    def test_config_values(self):
+        config = self.aggregate.config
+        config["unpicklable"] = threading.Lock()
+        values = get_config_values(config)
+        assert "logger" not in values
+        assert "unpicklable" not in values
+        assert values["threads"] == config["threads"]
+
+    def test_check(self):
+        url_data = self.put_file(
+            "index.html", '<a href="missing.html">missing</a><a href="ok.html">ok</a>')
+        self.write_file("ok.html", "")
+        # cached URLs are not checked again
+        self.aggregate.result_cache.add_result(
+            url_data.cache_url.replace("index", "ok"), None)
+        self.aggregate.config["verbose"] = True
+        self.aggregate.logger = director.logger.Logger(self.aggregate.config)
+        CheckProcess(self.aggregate).run()
+        url_datas = [data for urls in self.urls.emitted for data in urls]
+        assert sorted(data.url.rsplit("/", 1)[1] for data in url_datas) == [
+            "index.html", "missing.html"]
+        assert [data.valid for data in url_datas
+                if data.url.endswith("missing.html")] == [False]
+        stats = self.stats.emitted[0]
+        assert (stats.number, stats.errors) == (2, 1)
+
+    def test_snapshot(self):
+        first = get_url_data(url="http://example.com/1",
+                             cache_url="http://example.com/1")
+        second = get_url_data(url="http://example.com/2",
+                              cache_url="http://example.com/2")
+        process = CheckProcess(self.aggregate)
+        process.snapshot = {"old": ("old",), "kept": ("kept",)}
+        conn = MockConnection([
+            ("urls", [get_values(first)]),
+            ("queue", (["old"], [("new",)], False)),
+            ("urls", [get_values(second)]),
+            ("queue", ([], [("row",)], True)),
+            ("urls", [get_values(first)]),
+            ("done", None),
+        ])
+        assert process.receive(conn) == (True, {})
+        # the changes are applied with the final message of a snapshot, and
+        # the URLs logged before it are folded into a set
+        assert process.checked == {first.cache_url, second.cache_url}
+        assert process.logged == [first.cache_url]
+        assert process.get_snapshot() == (
+            [("kept",), ("new",), ("row",)], [first.cache_url])
+
+    @patch.object(checkprocess, "SnapshotRows", 2)
+    @patch.object(checkprocess, "SnapshotInterval", 0)
+    def test_send_snapshots(self):
+        url_datas = [SimpleNamespace(**dict(dict.fromkeys(QueueAttrs),
+                                            cache_url="http://example.com/%d" % i))
+                     for i in range(5)]
+        urlqueue = MagicMock()
+        urlqueue.snapshot.side_effect = [url_datas[1:], url_datas[1:], []]
+        sender = MockSender()
+        done = MagicMock()
+        done.wait.side_effect = [False, False, False, True]
+        checkprocess.send_snapshots(sender, urlqueue, done,
+                                    [to_queue_row(url_datas[0])])
+        keys = ["http://example.com/%d" % i for i in range(5)]
+        assert [(removed, [row[0] for row in added], final)
+                for kind, (removed, added, final) in sender.sent] == [
+            (keys[:1], keys[1:3], False),
+            ([], keys[3:], True),
+            # unchanged URLs are not sent again
+            ([], [], True),
+            (keys[1:3], [], False),
+            (keys[3:], [], True),
+        ]
+
+    def test_cancel(self):
+        self.put_file("index.html", "")
+        process = CheckProcess(self.aggregate)
+        process.cancel()
+        process.run()
+        assert len(self.stats.emitted) == 1
+
+    def start(self, process):
+        """Run given CheckProcess in a thread and return the thread and the
+        first started process."""
+        thread = threading.Thread(target=process.run)
+        thread.start()
+        for _i in range(1000):
+            if process.process is not None:
+                break
+            time.sleep(0.01)
+        return thread, process.process
+
+    def test_restart(self):
+        self.put_file("index.html", '<a href="missing.html">missing</a>')
+        warnings = []
+        process = CheckProcess(self.aggregate, warn=warnings.append)
+        thread, child = self.start(process)
+        # the process crashes before it sends results
+        os.kill(child.pid, signal.SIGKILL)
+        thread.join()
+        assert warnings == ["Check process crashed, restarting it (1 of %d)."
+                            % MaxRestarts]
+        url_datas = [data for urls in self.urls.emitted for data in urls]
+        assert [data.url.rsplit("/", 1)[1] for data in url_datas] == ["missing.html"]
+        assert not self.aggregate.urlqueue.shutdown
+
+    def test_abort_timeout(self):
+        self.put_file("index.html", "")
+        self.aggregate.config["aborttimeout"] = 1
+        process = CheckProcess(self.aggregate)
+        thread, child = self.start(process)
+        # a stopped process does not react to the cancel message
+        os.kill(child.pid, signal.SIGSTOP)
+        process.cancel()
+        thread.join(30)
+        assert not thread.is_alive()
+        assert not child.is_alive()
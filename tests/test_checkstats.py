@@ -0,0 +1,70 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+from types import SimpleNamespace
+import unittest
+
+from linkcheck_gui.checkstats import CheckStats
+
+
+def get_url_data(domain, checktime=0.1, dltime=0.05, size=1000, valid=True):
+    return SimpleNamespace(domain=domain, checktime=checktime,
+                           dltime=dltime, size=size, valid=valid)
+
+
+class TestCheckStats(unittest.TestCase):
+    """Test live statistics of checked URLs."""
+
+    def setUp(self):
+        self.now = 100.0
+        self.stats = CheckStats(window=4, maxhosts=4, clock=lambda: self.now)
+
+    def test_rates(self):
+        assert self.stats.get_rates() == (0.0, 0.0)
+        for second in range(6):
+            for _i in range(second + 1):
+                self.stats.add(get_url_data("example.com", size=-1))
+                self.stats.add(get_url_data("example.org"))
+            self.now += 1
+        # seconds 2 to 5 of the window with 3 + 4 + 5 + 6 URLs per host
+        assert self.stats.get_rates() == (9.0, 4500.0)
+        self.stats.clear()
+        assert self.stats.get_rates() == (0.0, 0.0)
+
+    def test_quantiles(self):
+        for i in range(1, 101):
+            self.stats.add(get_url_data("example.com", checktime=i / 100,
+                                        dltime=None))
+        checktimes, dltimes = self.stats.get_quantiles()
+        for value, exact in zip(checktimes, (0.5, 0.95, 0.99)):
+            assert abs(value - exact) <= exact * 0.02
+        assert dltimes == [None, None, None]
+
+    def test_slowest_hosts(self):
+        for i in range(1, 6):
+            self.stats.add(get_url_data("host%d.example" % i, checktime=i))
+        # the host with the least check time has been pruned
+        assert len(self.stats.hosts) == 3
+        hosts = self.stats.get_slowest_hosts(2)
+        assert [stats.host for stats in hosts] == ["host5.example", "host4.example"]
+        self.stats.add(get_url_data("user@host4.example:8080", checktime=2))
+        stats = self.stats.get_slowest_hosts(1)[0]
+        assert (stats.host, stats.count) == ("host5.example", 1)
+        assert self.stats.hosts["host4.example"].max_checktime == 4
+        self.stats.add(get_url_data("host4.example", checktime=3, dltime=-1,
+                                    size=-1, valid=False))
+        stats = self.stats.hosts["host4.example"]
+        assert (stats.count, stats.errors, stats.dltime, stats.size) == (
+            3, 1, 0.1, 2000)
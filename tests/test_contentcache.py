@@ -0,0 +1,101 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+import os
+import tempfile
+import unittest
+
+from linkcheck import checker as linkchecker_checker
+from linkcheck import configuration as linkchecker_configuration
+from linkcheck import director
+
+from linkcheck_gui.contentcache import add_plugin, ContentCache
+from linkcheck_gui.logger import SignalLogger
+
+from .test_logger import MockSignal
+
+
+class TestContentCache(unittest.TestCase):
+    """Test the cache of parsed page contents."""
+
+    def test_spill(self):
+        cache = ContentCache(maxmemory=10, maxdisk=20)
+        cache.add("a", "aaaaaa", "text/html")
+        cache.add("b", "bbbbbb", "text/css")
+        # the least recently used page is written to disk
+        assert list(cache.memory) == ["b"]
+        assert list(cache.disk) == ["a"]
+        assert cache.get("a") == ("aaaaaa", "text/html")
+        cache.add("c", "cccccc€", "text/html")
+        cache.add("d", "dddddd", "text/html")
+        # the disk limit removes the oldest files
+        assert list(cache.disk) == ["b", "c"]
+        assert cache.get("a") is None
+        assert cache.get("c") == ("cccccc€", "text/html")
+        # adding a URL again replaces it
+        cache.add("c", "new", "text/plain")
+        assert cache.get("c") == ("new", "text/plain")
+        assert len(cache) == 3
+        directory = cache.directory
+        cache.clear()
+        assert len(cache) == 0
+        assert not os.path.exists(directory)
+
+    def test_spill_unlocked(self):
+        cache = ContentCache(maxmemory=5, maxdisk=100)
+        written = []
+
+        def spill(url, entry, filename):
+            # the lock is free and the page can be read while it is written
+            assert cache.lock.acquire(blocking=False)
+            cache.lock.release()
+            assert cache.get(url) == entry
+            written.append(url)
+            ContentCache.spill(cache, url, entry, filename)
+
+        cache.spill = spill
+        cache.add("a", "aaa\udce4", "text/html")
+        cache.add("b", "bbbb", "text/html")
+        assert written == ["a"]
+        # lone surrogates of undecodable content are kept on disk
+        assert cache.get("a") == ("aaa\udce4", "text/html")
+        filename = cache.disk["a"][0]
+        with open(filename, "wb") as f:
+            f.write(b"\xff")
+        # a file that cannot be decoded is a cache miss
+        assert cache.get("a") is None
+        assert "a" not in cache.disk
+        assert not os.path.exists(filename)
+        cache.clear()
+
+    def test_check(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            content = '<html>\n<a href="missing.html">missing</a>\n</html>'
+            filename = os.path.join(tmpdir, "index.html")
+            with open(filename, "w") as fp:
+                fp.write(content)
+            config = linkchecker_configuration.Configuration()
+            config["logger"] = SignalLogger(signal=MockSignal(), stats=MockSignal())
+            config["threads"] = 0
+            aggregate = director.get_aggregate(config)
+            cache = ContentCache()
+            add_plugin(aggregate, cache)
+            url_data = linkchecker_checker.get_url_from(
+                filename, 0, aggregate, extern=(0, 0))
+            aggregate.urlqueue.put(url_data)
+            director.check_urls(aggregate)
+            # only the parsed page is cached
+            assert len(cache) == 1
+            assert cache.get(url_data.url) == (content, "text/html")
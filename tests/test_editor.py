@@ -0,0 +1,40 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from linkcheck_gui import editor
+
+
+class TestReadFile(unittest.TestCase):
+    """Test reading files in parts."""
+
+    def test_read_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "test.html")
+            text = "äöü€" * 10
+            with open(filename, "w", encoding="utf-8") as fp:
+                fp.write(text)
+            # parts end within multibyte characters
+            with patch.object(editor, "ChunkSize", 7):
+                assert "".join(editor.read_file(filename)) == text
+                assert list(editor.split_text("abcdefghij")) == [
+                    "abcdefg", "hij"]
+            with open(filename, "w") as fp:
+                pass
+            assert list(editor.read_file(filename)) == []
@@ -13,9 +13,12 @@
 # You should have received a copy of the GNU General Public License along
 # with this program; if not, write to the Free Software Foundation, Inc.,
 # 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+from http.server import ThreadingHTTPServer
 import os
 import shutil
 import tempfile
+import threading
+from types import SimpleNamespace
 import unittest
 from unittest.mock import patch
 
@@ -29,6 +32,7 @@ except ImportError:
 from linkcheck import configuration as linkchecker_configuration
 
 from . import has_pyqt, has_x11
+from .library.test_url import Handler
 
 
 @pytest.mark.skipif(not has_pyqt, reason="PyQt required")
@@ -41,6 +45,11 @@ class TestGui(unittest.TestCase):
         os.environ["HOME"] = self.home_dir
 
     def tearDown(self):
+        # delete the windows of the test before the application object
+        for widget in QtWidgets.QApplication.topLevelWidgets():
+            widget.deleteLater()
+        QtWidgets.QApplication.sendPostedEvents(
+            None, QtCore.QEvent.Type.DeferredDelete)
         del self.app
         shutil.rmtree(self.home_dir)
 
@@ -59,6 +68,252 @@ class TestGui(unittest.TestCase):
         self.app.exec()
         del window
 
+    @patch("PyQt6.QtWidgets.QFileDialog.getSaveFileName")
+    def test_stream_results(self, mock_get_save_filename):
+        """ Write results while checking """
+        from linkcheck_gui import LinkCheckerMain
+
+        html_file = os.path.join(self.home_dir, "test.html")
+        with open(html_file, "w") as fp:
+            fp.write('<a href="missing.html">missing</a>')
+        save_file = os.path.join(self.home_dir, "test_stream.csv")
+        mock_get_save_filename.side_effect = \
+            lambda parent, title, filename, filters: (save_file, "CSV output (*.csv)")
+        window = LinkCheckerMain()
+        window.checker.finished.connect(window.close)
+        window.actionStreamResults.setChecked(True)
+        window.urlinput.setText(html_file)
+        window.show()
+        QtTest.QTest.qWaitForWindowExposed(window)
+        QtTest.QTest.mouseClick(window.controlButton, QtCore.Qt.MouseButton.LeftButton)
+        self.app.exec()
+        with open(save_file, encoding="utf_8_sig") as fp:
+            assert "missing.html" in fp.read()
+        del window
+
+    @patch("PyQt6.QtWidgets.QFileDialog.getOpenFileName")
+    @patch("PyQt6.QtWidgets.QFileDialog.getSaveFileName")
+    def test_database(self, mock_get_save_filename, mock_get_open_filename):
+        """ File/{Write,Open} results database """
+        from linkcheck_gui import LinkCheckerMain
+
+        html_file = os.path.join(self.home_dir, "test.html")
+        with open(html_file, "w") as fp:
+            fp.write('<a href="missing.html">missing</a>')
+        db_file = os.path.join(self.home_dir, "results.sqlite")
+        mock_get_save_filename.side_effect = \
+            lambda parent, title, filename, filters: (db_file, filters)
+        mock_get_open_filename.side_effect = \
+            lambda parent, title, filename, filters: (db_file, filters)
+        window = LinkCheckerMain()
+        window.checker.finished.connect(self.app.quit)
+        window.actionWriteDatabase.setChecked(True)
+        window.urlinput.setText(html_file)
+        window.show()
+        QtTest.QTest.qWaitForWindowExposed(window)
+        QtTest.QTest.mouseClick(window.controlButton, QtCore.Qt.MouseButton.LeftButton)
+        self.app.exec()
+        window.dbwriter.wait()
+        window.actionOpenDatabase.trigger()
+        assert window.treeView.model() is window.dbmodel
+        assert window.dbmodel.rowCount() == 1
+        # the check was not canceled
+        assert window.dbmodel.complete
+        window.filtertext.setText("other")
+        assert window.dbmodel.rowCount() == 0
+        # saving writes the results of the database
+        save_file = os.path.join(self.home_dir, "database.csv")
+        mock_get_save_filename.side_effect = \
+            lambda parent, title, filename, filters: (save_file, "CSV output (*.csv)")
+        window.actionSave.trigger()
+        window.saver.wait()
+        with open(save_file, encoding="utf_8_sig") as fp:
+            assert "missing.html" in fp.read()
+        window.close_database()
+        assert window.treeView.model() is window.proxy
+        window.filtertext.setText("")
+        window.actionCompareDatabase.trigger()
+        assert window.diffdock.diffmodel.rowCount() == 0
+        assert [diff.category for diff in window.diffdock.diffmodel.diffs] == [3]
+        del window
+
+    def test_url_list(self):
+        """ Check a gzip compressed URL list file """
+        import gzip
+
+        from linkcheck_gui import LinkCheckerMain
+
+        list_file = os.path.join(self.home_dir, "urls.lst.gz")
+        with gzip.open(list_file, "wt") as fp:
+            fp.write("# URLs\n\nmissing.html\n")
+        window = LinkCheckerMain()
+        window.checker.finished.connect(self.app.quit)
+        window.urlinput.setText(list_file)
+        window.show()
+        QtTest.QTest.qWaitForWindowExposed(window)
+        QtTest.QTest.mouseClick(window.controlButton, QtCore.Qt.MouseButton.LeftButton)
+        self.app.exec()
+        assert window.checkstats.count == 2
+        errors = [url_data for url_data in window.model.store.url_data
+                  if not url_data.valid]
+        assert [url_data.line for url_data in errors] == [3]
+        window.close()
+        del window
+
+    def test_resume(self):
+        """ File/Resume check """
+        from linkcheck_gui import LinkCheckerMain
+
+        html_file = os.path.join(self.home_dir, "test.html")
+        with open(html_file, "w") as fp:
+            fp.write('<a href="missing.html">missing</a>')
+        window = LinkCheckerMain()
+        window.checker.finished.connect(self.app.quit)
+        window.urlinput.setText(html_file)
+        window.show()
+        QtTest.QTest.qWaitForWindowExposed(window)
+        QtTest.QTest.mouseClick(window.controlButton, QtCore.Qt.MouseButton.LeftButton)
+        self.app.exec()
+        assert window.model.rowCount() == 1
+        assert not window.actionResume.isEnabled()
+        # pretend the check was interrupted before checking other.html
+        parent_url = window.model.store.url_data[0].parent_url
+        window.checkpoint.open().set_meta("status", "unfinished")
+        window.checkpoint.open().set_queue([SimpleNamespace(
+            cache_url=parent_url[:-9] + "other.html", base_url="other.html",
+            recursion_level=1, parent_url=parent_url, base_ref="", line=2,
+            column=1, page=0, name="other", extern=None)])
+        window.update_resume_action()
+        assert window.actionResume.isEnabled()
+        window.actionResume.trigger()
+        self.app.exec()
+        urls = [url_data.url for url_data in window.model.store.url_data]
+        assert len(urls) == 2
+        assert urls[1].endswith("other.html")
+        assert not window.actionResume.isEnabled()
+        window.close()
+        del window
+
+    def test_recheck(self):
+        """ File/Recheck changed and failed URLs """
+        from linkcheck_gui import LinkCheckerMain
+
+        html_file = os.path.join(self.home_dir, "test.html")
+        with open(html_file, "w") as fp:
+            fp.write('<a href="missing.html">missing</a><a href="other.html">other</a>')
+        with open(os.path.join(self.home_dir, "other.html"), "w") as fp:
+            fp.write("other")
+        window = LinkCheckerMain()
+        window.checker.finished.connect(self.app.quit)
+        window.urlinput.setText(html_file)
+        window.show()
+        QtTest.QTest.qWaitForWindowExposed(window)
+        window.options.statusinterval.setValue(2)
+        window.actionRecheck.trigger()
+        self.app.exec()
+        assert window.checkstats.count == 3
+        assert window.status_timer.interval() == 2000
+        # other.html is skipped, the page and the missing link are checked
+        window.actionRecheck.trigger()
+        self.app.exec()
+        assert window.checkstats.count == 2
+        assert window.model.rowCount() == 1
+        # the skipped URL is remembered for the next incremental check
+        window.actionRecheck.trigger()
+        self.app.exec()
+        assert window.checkstats.count == 2
+        window.close()
+        del window
+
+    def test_check_process(self):
+        """ Check in separate process """
+        from linkcheck_gui import LinkCheckerMain
+
+        html_file = os.path.join(self.home_dir, "test.html")
+        with open(html_file, "w") as fp:
+            fp.write('<a href="missing.html">missing</a><a href="other.html">other</a>')
+        with open(os.path.join(self.home_dir, "other.html"), "w") as fp:
+            fp.write("other")
+        window = LinkCheckerMain()
+        window.options.checkprocess.setChecked(True)
+        window.checker.finished.connect(self.app.quit)
+        window.urlinput.setText(html_file)
+        window.show()
+        QtTest.QTest.qWaitForWindowExposed(window)
+        window.actionRecheck.trigger()
+        self.app.exec()
+        assert window.checkstats.count == 3
+        assert window.model.rowCount() == 1
+        # the URLs skipped in the GUI process are not checked by the process
+        window.actionRecheck.trigger()
+        self.app.exec()
+        assert window.checkstats.count == 2
+        assert window.model.rowCount() == 1
+        window.close()
+        del window
+
+    def test_jobs(self):
+        """ Jobs dock """
+        from linkcheck_gui import LinkCheckerMain
+        from linkcheck_gui.jobs import Job, JobStatus
+
+        html_files = []
+        for name in ("a", "b"):
+            html_files.append(os.path.join(self.home_dir, name + ".html"))
+            with open(html_files[-1], "w") as fp:
+                fp.write('<a href="missing.html">missing</a>')
+        window = LinkCheckerMain()
+        window.show()
+        QtTest.QTest.qWaitForWindowExposed(window)
+        jobmodel = window.jobsdock.jobmodel
+        jobmodel.add_jobs([Job(html_files[0]), Job(""), Job(html_files[1])])
+        window.jobsdock.run_jobs.emit()
+        for i in range(100):
+            if (jobmodel.next_job() is None and window.job is None
+                    and not window.checker.isRunning()):
+                break
+            QtTest.QTest.qWait(100)
+        assert [job.status for job in jobmodel.jobs] == [
+            JobStatus.finished, JobStatus.failed, JobStatus.finished]
+        assert [job.errors for job in jobmodel.jobs] == [1, None, 1]
+        assert jobmodel.jobs[0].checked == 2
+        window.close()
+        del window
+
+    def test_sessions(self):
+        """ Concurrent check sessions """
+        from linkcheck_gui import LinkCheckerMain
+        from linkcheck_gui.sessions import SessionState
+
+        html_files = []
+        for name in ("a", "b", "c"):
+            html_files.append(os.path.join(self.home_dir, name + ".html"))
+            with open(html_files[-1], "w") as fp:
+                fp.write('<a href="missing.html">missing</a>')
+        window = LinkCheckerMain()
+        window.show()
+        QtTest.QTest.qWaitForWindowExposed(window)
+        window.threadbudget.total = window.config["threads"]
+        window.urlinput.setText(html_files[0])
+        window.check()
+        # the main check uses all threads, so the sessions wait
+        window.new_session(html_files[1])
+        window.new_session(html_files[2])
+        sessions = window.sessionsdock.sessions
+        assert [session.state for session in sessions] == [SessionState.waiting] * 2
+        for i in range(300):
+            if not window.checker.isRunning() and not window.sessionsdock.is_running():
+                break
+            QtTest.QTest.qWait(100)
+        assert [session.model.rowCount() for session in sessions] == [1, 1]
+        assert window.model.rowCount() == 1
+        assert window.threadbudget.used == 0
+        window.sessionsdock.close_session(0)
+        QtTest.QTest.qWait(10)
+        assert window.sessionsdock.sessions == [sessions[1]]
+        window.close()
+        del window
+
     @patch("PyQt6.QtWidgets.QFileDialog.getOpenFileName")
     @patch("PyQt6.QtWidgets.QFileDialog.getSaveFileName")
     def test_project(self, mock_get_save_filename, mock_get_open_filename):
@@ -78,6 +333,27 @@ class TestGui(unittest.TestCase):
         projects.openproject(window)
         del window
 
+    @patch("PyQt6.QtWidgets.QFileDialog.getOpenFileName")
+    @patch("PyQt6.QtWidgets.QFileDialog.getSaveFileName")
+    def test_project_options(self, mock_get_save_filename, mock_get_open_filename):
+        """ Project round trip of checkprocess and contentcache """
+        from linkcheck_gui import LinkCheckerMain, projects
+
+        project_file = os.path.join(self.home_dir, "options.lcp")
+        mock_get_save_filename.return_value = (project_file, "lcp")
+        mock_get_open_filename.return_value = (project_file, "lcp")
+        window = LinkCheckerMain()
+        options = window.options
+        options.checkprocess.setChecked(True)
+        options.contentcache.setChecked(False)
+        projects.saveproject(window, "http://localhost/linkcheck-gui")
+        options.checkprocess.setChecked(False)
+        options.contentcache.setChecked(True)
+        projects.openproject(window)
+        self.assertTrue(options.checkprocess.isChecked())
+        self.assertFalse(options.contentcache.isChecked())
+        del window
+
     @patch("linkcheck.log.warn")
     def test_view_source(self, mock_log_warn):
         """ View Source """
@@ -89,7 +365,68 @@ class TestGui(unittest.TestCase):
         QtTest.QTest.qWaitForWindowExposed(window)
         window.view_source("http://localhost/linkcheck-gui", 1, 1)
         QtTest.QTest.qWaitForWindowExposed(window.editor)
-        window.editor.editor.setModified(False)
+        for i in range(100):
+            if window.sourcefetch is None:
+                break
+            QtTest.QTest.qWait(100)
+        assert window.editor.editor.text().startswith("An error occurred")
+        # the download runs in background and is shown while it arrives
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        server.bodies = []
+        server.cookies = []
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = "http://127.0.0.1:%d/page" % server.server_address[1]
+        window.view_source(url, 1, 1)
+        for i in range(100):
+            if window.sourcefetch is None:
+                break
+            QtTest.QTest.qWait(100)
+        assert window.editor.editor.text() == "<html>/page</html>"
+        assert window.editor.windowTitle() == "View %s" % url
+        # closing the editor cancels the download
+        window.view_source(url, 1, 1)
+        sourcefetch = window.sourcefetch
+        window.editor.close()
+        assert window.sourcefetch is None
+        assert sourcefetch.canceled
+        sourcefetch.thread.join()
+        # pages parsed by the checker are shown without downloading
+        window.contentcache.add(url, "<p>cached</p>", "text/html")
+        window.view_source(url, 1, 1)
+        assert window.sourcefetch is None
+        assert window.editor.editor.text() == "<p>cached</p>"
+        assert window.editor.windowTitle() == "View %s" % url
+        window.editor.close()
+        server.shutdown()
+        server.server_close()
+        del window
+
+    def test_view_file_source(self):
+        """ View source of a large local file """
+        from linkcheck_gui import LinkCheckerMain
+        from linkcheck_gui.editor import ChunkSize
+
+        filename = os.path.join(self.home_dir, "large.html")
+        line = "<p>%s</p>\n" % ("x" * 93)
+        content = line * (3 * ChunkSize // len(line))
+        with open(filename, "w") as fp:
+            fp.write(content)
+        window = LinkCheckerMain()
+        window.show()
+        QtTest.QTest.qWaitForWindowExposed(window)
+        window.view_source("file://" + filename, 100, 4)
+        # the target line is shown before the whole file is loaded
+        assert window.editor.editor.getCursorPosition() == (99, 3)
+        assert window.editor.parts is not None
+        assert len(window.editor.editor.text()) < len(content)
+        assert window.editor.windowTitle() == "View file://%s" % filename
+        for i in range(100):
+            if window.editor.parts is None:
+                break
+            QtTest.QTest.qWait(100)
+        assert window.editor.editor.text() == content
+        assert window.editor.editor.getCursorPosition() == (99, 3)
+        assert not window.editor.editor.isModified()
         window.editor.close()
         del window
 
@@ -141,6 +478,13 @@ class TestGui(unittest.TestCase):
         window = editor_qt.Editor(None)
         window.show()
         QtTest.QTest.qWaitForWindowExposed(window)
+        window.setText("<p>text</p>\n" * 100)
+        window.highlight(editor_qt.ContentTypeLexers["text/html"])
+        lexer = window.lexer
+        QtTest.QTest.qWait(10)
+        assert window.document().lastBlock().userState() == 0
+        window.highlight(None)
+        assert lexer.document() is None
         del window
 
     def test_configuration(self):
@@ -158,6 +502,29 @@ class TestGui(unittest.TestCase):
         x = syntax.XmlHighlighter(testDoc)
         x.highlightBlock("test")
         syntax.IniHighlighter(testDoc)
+        # comments spanning lines are tracked with block states
+        doc = QtGui.QTextDocument()
+        doc.setDocumentLayout(QtWidgets.QPlainTextDocumentLayout(doc))
+        doc.setPlainText('<a href="x">\n<!-- a\n<b> -->\n<p>\n' * 1000)
+        highlighter = syntax.XmlHighlighter(doc)
+        highlighter.highlightVisible(10)
+        QtTest.QTest.qWait(1)
+        assert doc.findBlockByNumber(10).userState() == 0
+        for i in range(100):
+            if not highlighter.timer.isActive():
+                break
+            QtTest.QTest.qWait(10)
+
+        def get_states():
+            return [doc.findBlockByNumber(i).userState() for i in range(8)]
+
+        assert get_states() == [0, 1, 0, 0] * 2
+        assert doc.lastBlock().userState() == 0
+        formats = doc.findBlockByNumber(2).layout().formats()
+        assert [(f.start, f.length) for f in formats] == [(0, 7)]
+        # only the blocks whose state changes are highlighted again
+        QtGui.QTextCursor(doc.findBlockByNumber(3)).insertText("<!-- ")
+        assert get_states() == [0, 1, 0, 1, 1, 1, 0, 0]
 
     def test_validator(self):
         """ PyRegexValidator """
@@ -167,18 +534,41 @@ class TestGui(unittest.TestCase):
         state, pos = v.validate(r"\d", 0)
         assert state == QtGui.QValidator.State.Acceptable
 
-    @patch("PyQt6.QtWidgets.QFileDialog.getSaveFileName")
-    def test_urlsave(self, mock_get_save_filename):
-        """ urlsave """
-        from linkcheck_gui import urlmodel, urlsave
+    def test_urlsave(self):
+        """ write_urls """
+        from linkcheck_gui.urlsave import get_logger, write_urls
+        from .test_urlmodel import get_url_data
+
+        save_file = os.path.join(self.home_dir, "test_urlsave.csv")
+        config = linkchecker_configuration.Configuration()
+        config["logger"] = config.logger_new("none")
+        url_datas = [get_url_data(url="http://example.com/%d" % i)
+                     for i in range(3)]
+        progress = []
+        logger = get_logger(config, save_file, "csv")
+        assert write_urls(logger, url_datas, None,
+                          progress=lambda *args: progress.append(args))
+        assert progress == [(0, 3)]
+        assert logger.stats.number == 3
+        with open(save_file, encoding="utf_8_sig") as fp:
+            assert "http://example.com/2" in fp.read()
+        logger = get_logger(config, save_file, "csv")
+        assert not write_urls(logger, url_datas, None, canceled=lambda: True)
 
-        class MockParent:
-            saveresultas = None
+    def test_urlsave_thread(self):
+        """ Save results in background thread """
+        from linkcheck_gui.urlsave import get_logger, UrlSaveThread
+        from .test_urlmodel import get_url_data
 
-        save_file = os.path.join(self.home_dir, "test_urlsave.html")
-        mock_get_save_filename.side_effect = \
-            lambda parent, title, filename, filters: (save_file, "HTML output (*.html)")
+        save_file = os.path.join(self.home_dir, "test_urlsave.csv")
         config = linkchecker_configuration.Configuration()
         config["logger"] = config.logger_new("none")
-        m = urlmodel.UrlItemModel()
-        urlsave(MockParent(), config, m.urls)
+        logger = get_logger(config, save_file, "csv")
+        url_datas = [get_url_data(url="http://example.com/%d" % i)
+                     for i in range(3)]
+        saver = UrlSaveThread()
+        saver.save(logger, url_datas, config["logger"].stats, save_file)
+        saver.wait()
+        assert saver.saved
+        with open(save_file, encoding="utf_8_sig") as fp:
+            assert "http://example.com/2" in fp.read()
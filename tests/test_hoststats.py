@@ -0,0 +1,109 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+import os
+import tempfile
+import unittest
+
+from linkcheck import checker as linkchecker_checker
+from linkcheck import configuration as linkchecker_configuration
+from linkcheck import director
+from PyQt6 import QtCore
+
+from linkcheck_gui.checkstats import CheckStats
+from linkcheck_gui.hoststats import HostStatsModel
+from linkcheck_gui.logger import SignalLogger
+
+from .test_logger import MockSignal
+from .test_urlmodel import get_url_data
+
+
+class TestHostStats(unittest.TestCase):
+    """Test check results aggregated by host."""
+
+    def setUp(self):
+        self.checkstats = CheckStats()
+        self.hoststats = HostStatsModel(self.checkstats)
+
+    def get_values(self, row):
+        return [self.hoststats.data(self.hoststats.index(row, column),
+                                    QtCore.Qt.ItemDataRole.UserRole)
+                for column in range(self.hoststats.columnCount())]
+
+    def add(self, url_datas):
+        for url_data in url_datas:
+            self.checkstats.add(url_data)
+        self.hoststats.update()
+
+    def test_aggregate(self):
+        self.add([
+            get_url_data(domain="a.example", checktime=1.0, dltime=0.5, size=100),
+            get_url_data(domain="b.example:8080", checktime=0.5, dltime=-1, size=-1),
+            get_url_data(domain="a.example", checktime=3.0, dltime=1.5, size=300,
+                         valid=False),
+        ])
+        assert self.hoststats.rowCount() == 2
+        assert self.get_values(0) == [
+            "a.example", 2, 0.5, 4.0, 2.0, 3.0, 2.0, 1.0, 400]
+        assert self.get_values(1) == [
+            "b.example", 1, 0.0, 0.5, 0.5, 0.5, 0.0, 0.0, 0]
+        assert self.hoststats.data(self.hoststats.index(0, 2)) == "1 (50.0%)"
+        changed = []
+        self.hoststats.dataChanged.connect(
+            lambda first, last: changed.append((first.row(), last.row())))
+        self.add([
+            get_url_data(domain="b.example", checktime=1.5),
+            get_url_data(domain="c.example", checktime=1.0),
+        ])
+        assert changed == [(1, 1)]
+        assert self.hoststats.rowCount() == 3
+        assert self.get_values(1)[:2] == ["b.example", 2]
+        self.checkstats.clear()
+        self.hoststats.update()
+        assert self.hoststats.rowCount() == 0
+
+    def test_bounded(self):
+        self.checkstats.maxhosts = 4
+        self.add([get_url_data(domain="host%d.example" % i, checktime=i)
+                  for i in range(4)])
+        assert self.hoststats.rowCount() == 4
+        self.add([get_url_data(domain="host4.example", checktime=0.5)])
+        # the two hosts with the least check time are forgotten
+        assert [self.get_values(row)[0] for row in range(3)] == [
+            "host2.example", "host3.example", "host4.example"]
+        assert self.hoststats.rowCount() == 3
+
+    def test_not_verbose(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "index.html")
+            with open(filename, "w") as fp:
+                fp.write('<a href="ok.txt">ok</a><a href="missing.html">missing</a>')
+            with open(os.path.join(tmpdir, "ok.txt"), "w") as fp:
+                fp.write("ok")
+            urls = MockSignal()
+            config = linkchecker_configuration.Configuration()
+            config["logger"] = SignalLogger(signal=urls, stats=MockSignal(),
+                                            checkstats=self.checkstats)
+            config["threads"] = 1
+            aggregate = director.get_aggregate(config)
+            aggregate.urlqueue.put(linkchecker_checker.get_url_from(
+                filename, 0, aggregate, extern=(0, 0)))
+            director.check_urls(aggregate)
+        # only the error is shown, but all checked URLs are counted
+        assert [url_data.valid for batch in urls.emitted
+                for url_data in batch] == [False]
+        self.hoststats.update()
+        assert self.hoststats.rowCount() == 1
+        assert self.get_values(0)[1:3] == [3, 1 / 3]
@@ -0,0 +1,48 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+import unittest
+
+from linkcheck_gui.jobs import get_urls, Job, JobModel, JobStatus
+
+
+class TestJobs(unittest.TestCase):
+    """Test the job queue."""
+
+    def test_get_urls(self):
+        assert get_urls(" http://a.example/ \n\n# comment\nb.example\n") == [
+            "http://a.example/", "b.example"]
+
+    def test_model(self):
+        model = JobModel()
+        model.add_jobs([Job("a"), Job("b"), Job("c")])
+        assert model.rowCount() == 3
+        assert model.move_job(2, -1) == 1
+        assert model.move_job(0, -1) == 0
+        assert model.move_job(0, 5) == 2
+        assert [job.url for job in model.jobs] == ["c", "b", "a"]
+        job = model.next_job()
+        assert job.url == "c"
+        job.set_running()
+        job.set_progress(10, 5)
+        assert model.data(model.index(0, 1)) == "Running"
+        assert model.data(model.index(0, 2)) == "10"
+        assert not model.remove_job(0)
+        job.set_done(JobStatus.finished)
+        assert model.data(model.index(0, 3)) == ""
+        model.jobs[1].set_done(JobStatus.canceled)
+        assert model.next_job().url == "a"
+        assert model.remove_job(0)
+        assert [job.url for job in model.jobs] == ["b", "a"]
@@ -0,0 +1,75 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+import time
+import unittest
+
+from linkcheck_gui.logger import get_progress, SignalLogger, StatusLogger
+
+
+class MockSignal:
+    """Record emitted values."""
+
+    def __init__(self):
+        self.emitted = []
+
+    def emit(self, value):
+        self.emitted.append(value)
+
+
+class TestSignalLogger(unittest.TestCase):
+    """Test batched URL signals of SignalLogger."""
+
+    def get_logger(self, **kwargs):
+        self.urls = MockSignal()
+        self.stats = MockSignal()
+        return SignalLogger(signal=self.urls, stats=self.stats, **kwargs)
+
+    def test_batchsize(self):
+        logger = self.get_logger(batchsize=3, batchinterval=60)
+        for i in range(7):
+            logger.log_url(i)
+        assert self.urls.emitted == [[0, 1, 2], [3, 4, 5]]
+        logger.end_output()
+        assert self.urls.emitted == [[0, 1, 2], [3, 4, 5], [6]]
+        assert self.stats.emitted == [logger.stats]
+
+    def test_batchinterval(self):
+        logger = self.get_logger(batchsize=100, batchinterval=0.01)
+        logger.log_url(0)
+        logger.log_url(1)
+        for _i in range(100):
+            if self.urls.emitted:
+                break
+            time.sleep(0.01)
+        assert self.urls.emitted == [[0, 1]]
+        logger.end_output()
+        assert self.urls.emitted == [[0, 1]]
+
+
+class TestStatusLogger(unittest.TestCase):
+    """Test coalesced status of StatusLogger."""
+
+    def test_latest_status(self):
+        logger = StatusLogger()
+        assert logger.get_status() is None
+        logger.log_status(10, 2, 30, 5.0, 12)
+        logger.log_status(20, 2, 18, 10.0, 22)
+        assert logger.get_status() == (20, 2, 18, 10.0, 22)
+        assert logger.get_status() is None
+
+    def test_progress(self):
+        assert get_progress(0, 1, 10, 1.0) == (0.0, None)
+        assert get_progress(20, 2, 18, 10.0) == (2.0, 10.0)
@@ -0,0 +1,102 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+import os
+import tempfile
+import unittest
+
+from PyQt6 import QtCore
+
+from linkcheck_gui.resultdb import ResultDB
+from linkcheck_gui.resultdiff import (compare, count_categories, DiffFixed,
+                                      DiffModel, DiffNew, DiffNotRechecked,
+                                      DiffRegressed, DiffUnchanged,
+                                      get_db_entries, get_entries)
+
+from .test_urlmodel import get_url_data
+
+
+def get_entry(url, valid=True, checktime=0.1):
+    """Return compared values of a result of given URL."""
+    return ("http://example.com/" + url, "http://example.com/", valid,
+            "" if valid else "404 Not Found", checktime)
+
+
+class TestResultDiff(unittest.TestCase):
+    """Test comparing two result sets."""
+
+    def test_compare(self):
+        old = [
+            get_entry("broken", valid=False),
+            get_entry("fixed", valid=False),
+            get_entry("gone", valid=False),
+            get_entry("slow"),
+            get_entry("same"),
+            # one failed link makes the URL an old error
+            get_entry("twice"),
+            get_entry("twice", valid=False),
+        ]
+        new = [
+            get_entry("broken", valid=False),
+            get_entry("fixed"),
+            get_entry("new", valid=False),
+            get_entry("slow", checktime=2.0),
+            get_entry("same", checktime=0.2),
+            get_entry("twice"),
+        ]
+        diffs = compare(old, new, complete=True)
+        categories = {diff.new[0] if diff.new else diff.old[0]: diff.category
+                      for diff in diffs}
+        assert categories == {
+            "http://example.com/broken": DiffUnchanged,
+            "http://example.com/fixed": DiffFixed,
+            "http://example.com/gone": DiffFixed,
+            "http://example.com/new": DiffNew,
+            "http://example.com/slow": DiffRegressed,
+            "http://example.com/same": DiffUnchanged,
+            "http://example.com/twice": DiffFixed,
+        }
+        assert count_categories(diffs) == [1, 3, 1, 2, 0]
+        # missing old errors of incomplete results might not be checked again
+        diffs = compare(old, new)
+        assert [diff.old[0] for diff in diffs
+                if diff.category == DiffNotRechecked] == ["http://example.com/gone"]
+        assert count_categories(diffs) == [1, 2, 1, 2, 1]
+
+    def test_database(self):
+        url_datas = [get_url_data(url="http://example.com/a", checktime=0.5),
+                     get_url_data(url="http://example.com/b", valid=False)]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = ResultDB(os.path.join(tmpdir, "results.sqlite"))
+            db.add_results(url_datas)
+            assert list(get_db_entries(db)) == list(get_entries(url_datas))
+            db.close()
+
+    def test_model(self):
+        model = DiffModel()
+        model.set_diffs(compare(
+            [get_entry("a", valid=False), get_entry("b")],
+            [get_entry("b", valid=False), get_entry("c")]))
+        # unchanged URLs are hidden by default
+        assert model.rowCount() == 2
+        assert model.data(model.index(0, 0)) == "New error"
+        assert model.data(model.index(0, 3)) == ""
+        assert model.data(model.index(0, 4)) == "404 Not Found"
+        assert model.data(model.index(1, 1)) == "http://example.com/a"
+        assert model.data(model.index(1, 6)) == ""
+        assert model.data(model.index(1, 6), QtCore.Qt.ItemDataRole.UserRole) == -1.0
+        model.set_categories({DiffUnchanged})
+        assert model.rowCount() == 1
+        assert model.data(model.index(0, 6)) == "100 ms"
@@ -0,0 +1,36 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+import unittest
+
+from linkcheck_gui.sessions import ThreadBudget
+
+
+class TestSessions(unittest.TestCase):
+    """Test the thread budget of check sessions."""
+
+    def test_budget(self):
+        budget = ThreadBudget(total=10)
+        assert budget.acquire(6) == 6
+        assert budget.acquire(6) == 4
+        assert budget.acquire(6) == 0
+        assert budget.acquire(3, force=True) == 3
+        budget.release(6)
+        assert budget.acquire(6) == 3
+        budget.release(3)
+        budget.release(4)
+        budget.release(3)
+        assert budget.used == 0
+        assert budget.acquire(6) == 6
@@ -0,0 +1,131 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from PyQt6 import QtCore
+
+from linkcheck_gui import sqlmodel
+from linkcheck_gui.resultdb import get_order
+from linkcheck_gui.urlfilter import FilterStatus, UrlFilterProxyModel
+from linkcheck_gui.urlmodel import UrlItemModel
+
+from .test_urlmodel import get_url_data
+
+
+def get_url_datas(num):
+    return [get_url_data(
+        url="http://%s.example.com/%03d" % ("www" if i % 2 else "img", i),
+        domain="%s.example.com" % ("www" if i % 2 else "img"),
+        name="Link %d" % (num - i), valid=i % 5 != 0,
+        warnings=[("tag", "moved")] if i % 3 == 0 else [],
+        content_type="text/html" if i % 2 else "image/png",
+        line=i // 10 + 1, column=i % 10 + 1) for i in range(num)]
+
+
+class TestSqlModel(unittest.TestCase):
+    """Test writing and showing a results database."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, "results.sqlite")
+        self.url_datas = get_url_datas(50)
+        writer = sqlmodel.ResultWriter()
+        writer.write(self.filename, "http://example.com/", self.url_datas[:10])
+        writer.add(self.url_datas[10:])
+        writer.finish()
+        writer.wait()
+        assert not writer.failed
+        self.model = sqlmodel.SqlResultModel(self.filename)
+
+    def tearDown(self):
+        self.model.close()
+        self.tmpdir.cleanup()
+
+    def get_urls(self, model):
+        return [model.getUrlItem(model.index(row, 0)).url_data.url
+                for row in range(model.rowCount())]
+
+    @patch.object(sqlmodel, "PageSize", 8)
+    @patch.object(sqlmodel, "MaxPages", 2)
+    def test_pages(self):
+        assert self.model.url == "http://example.com/"
+        assert not self.model.complete
+        assert self.model.rowCount() == 50
+        urls = [url_data.url for url_data in self.url_datas]
+        assert self.get_urls(self.model) == urls
+        assert len(self.model.pages) == 2
+        self.model.sort(2, QtCore.Qt.SortOrder.AscendingOrder)
+        names = [self.model.data(self.model.index(row, 2)).value() for row in range(50)]
+        assert names == sorted(names)
+        self.model.sort(1, QtCore.Qt.SortOrder.DescendingOrder)
+        urls = self.get_urls(self.model)
+        assert urls == sorted(urls, reverse=True)
+
+    @patch.object(sqlmodel, "PageSize", 4)
+    @patch.object(sqlmodel, "MaxPages", 2)
+    def test_keyset(self):
+        url_datas = [get_url_data(
+            url="http://example.com/%d" % (i % 6),
+            parent_url=None if i % 7 == 0 else "http://example.com/%d" % (i % 3),
+            line=None if i % 4 == 0 else i % 5, column=i % 2,
+            name="" if i % 3 else "Link", valid=i % 5 != 0,
+            result=None if i % 6 == 0 else "result %d" % (i % 2))
+            for i in range(30)]
+        filename = os.path.join(self.tmpdir.name, "keyset.sqlite")
+        writer = sqlmodel.ResultWriter()
+        writer.write(filename, "http://example.com/", url_datas)
+        writer.finish()
+        writer.wait()
+        model = sqlmodel.SqlResultModel(filename)
+        self.addCleanup(model.close)
+        for column in range(4):
+            for descending in (False, True):
+                model.sort(column, QtCore.Qt.SortOrder.DescendingOrder
+                           if descending else QtCore.Qt.SortOrder.AscendingOrder)
+                expected = [url_data.url for url_data in model.db.get_results(
+                    order=get_order(column, descending))]
+                # reading the last rows first finds the page keys
+                rows = [model.getUrlItem(model.index(row, 0)).url_data.url
+                        for row in reversed(range(30))]
+                assert rows[::-1] == expected, (column, descending)
+                assert self.get_urls(model) == expected
+        model.set_filter(text="result 1")
+        assert model.rowCount() == 15
+        assert model.getUrlItem(model.index(14, 0)) is not None
+        assert model.get_page(4) == []
+
+    def test_filter(self):
+        urlmodel = UrlItemModel()
+        proxy = UrlFilterProxyModel()
+        proxy.setSourceModel(urlmodel)
+        urlmodel.log_urls(self.url_datas)
+        for settings in (
+            dict(text="LINK 4"),
+            dict(status=FilterStatus[2][1]),
+            dict(status=FilterStatus[4][1], host="example.com"),
+            dict(host="www.example.com", content_type="text"),
+            dict(text="moved", status=FilterStatus[1][1]),
+        ):
+            self.model.set_filter(**settings)
+            proxy.set_filter(**settings)
+            assert self.model.is_active()
+            assert self.get_urls(self.model) == self.get_urls(proxy), settings
+        self.model.set_filter()
+        assert not self.model.is_active()
+        assert self.model.rowCount() == self.model.total == 50
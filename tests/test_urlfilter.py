@@ -0,0 +1,131 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+import unittest
+
+from PyQt6 import QtCore
+
+from linkcheck_gui.urlfilter import UrlFilterProxyModel
+from linkcheck_gui.urlindex import StatusError, StatusWarning, UrlIndex
+from linkcheck_gui.urlmodel import UrlItemModel
+from linkcheck_gui.urlstore import UrlStore
+
+from .test_urlmodel import get_url_data
+
+
+def get_url_datas():
+    """Return URL data with different hosts, status and content types."""
+    return [
+        get_url_data(url="http://example.com/index.html", domain="example.com",
+                     content_type="text/html"),
+        get_url_data(url="http://www.example.com/logo.png", domain="www.example.com",
+                     content_type="image/png",
+                     warnings=[("http-moved", "Moved permanently")]),
+        get_url_data(url="http://example.org/missing.html", domain="example.org",
+                     valid=False, result="404 Not Found", content_type="text/html"),
+        get_url_data(url="https://example.org/photo.jpg", domain="example.org",
+                     content_type="image/jpeg", name="Holiday photo"),
+    ]
+
+
+def get_urls(model):
+    """Return URLs of shown rows."""
+    return [model.getUrlItem(model.index(row, 0)).url_data.url
+            for row in range(model.rowCount())]
+
+
+class TestUrlIndex(unittest.TestCase):
+    """Test URL search index."""
+
+    def setUp(self):
+        self.store = UrlStore()
+        self.index = UrlIndex()
+        for url_data in get_url_datas():
+            self.store.append(url_data)
+        self.index.update(self.store)
+
+    def test_find(self):
+        index = self.index
+        assert index.find_status([StatusError]) == {2}
+        assert index.find_status([StatusWarning, StatusError]) == {1, 2}
+        assert index.find_host("example.com") == {0, 1}
+        assert index.find_host("www.example.com") == {1}
+        assert index.find_content_type("image") == {1, 3}
+
+    def test_find_text(self):
+        index = self.index
+        assert index.find_text("missing") == {2}
+        assert index.find_text("MOVED") == {1}
+        assert index.find_text("not found") == {2}
+        assert index.find_text("oto.j") == {3}
+        assert index.find_text("ph") == {3}
+        assert index.find_text("pho") == {3}
+        assert index.find_text("example") == {0, 1, 2, 3}
+        assert index.find_text("") == {0, 1, 2, 3}
+        assert index.find_text("://") == {0, 1, 2, 3}
+        assert index.find_text(".jpg") == {3}
+
+    def test_update(self):
+        self.store.append(get_url_data(url="http://example.net/missing",
+                                       domain="example.net"))
+        assert self.index.find_text("missing") == {2}
+        self.index.update(self.store)
+        assert self.index.find_text("missing") == {2, 4}
+
+
+class TestUrlFilter(unittest.TestCase):
+    """Test URL filter proxy model."""
+
+    def setUp(self):
+        self.model = UrlItemModel()
+        self.proxy = UrlFilterProxyModel()
+        self.proxy.setSourceModel(self.model)
+
+    def test_filter(self):
+        self.model.log_urls(get_url_datas())
+        assert self.proxy.rowCount() == 4
+        self.proxy.set_filter(text="example.org")
+        assert get_urls(self.proxy) == [
+            "http://example.org/missing.html", "https://example.org/photo.jpg"]
+        self.proxy.set_filter(text="example.org", content_type="image/")
+        assert get_urls(self.proxy) == ["https://example.org/photo.jpg"]
+        self.proxy.set_filter(status={StatusWarning}, host="EXAMPLE.com")
+        assert get_urls(self.proxy) == ["http://www.example.com/logo.png"]
+        self.proxy.set_filter()
+        assert self.proxy.rowCount() == 4
+
+    def test_insert_and_sort(self):
+        self.model.sort(1)
+        self.proxy.set_filter(content_type="text")
+        self.model.log_urls(get_url_datas())
+        assert get_urls(self.proxy) == [
+            "http://example.com/index.html", "http://example.org/missing.html"]
+        self.model.log_urls([get_url_data(url="http://example.net/a.html",
+                                          domain="example.net",
+                                          content_type="text/html"),
+                             get_url_data(url="http://example.net/b.png",
+                                          domain="example.net",
+                                          content_type="image/png")])
+        assert get_urls(self.proxy) == [
+            "http://example.com/index.html", "http://example.net/a.html",
+            "http://example.org/missing.html"]
+        self.proxy.sort(1, QtCore.Qt.SortOrder.DescendingOrder)
+        assert get_urls(self.proxy) == [
+            "http://example.org/missing.html", "http://example.net/a.html",
+            "http://example.com/index.html"]
+        index = self.proxy.index(1, 1)
+        assert self.proxy.mapFromSource(self.proxy.mapToSource(index)) == index
+        self.model.clear()
+        assert self.proxy.rowCount() == 0
@@ -0,0 +1,103 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+import gzip
+import os
+import tempfile
+import time
+import unittest
+
+from linkcheck import checker as linkchecker_checker
+from linkcheck import configuration as linkchecker_configuration
+from linkcheck import director
+
+from linkcheck_gui.checkpoint import CheckpointUrlQueue
+from linkcheck_gui.urllist import is_url_list, UrlListReader
+
+from . import has_pyqt
+
+
+def get_aggregate():
+    """Return aggregate with a CheckpointUrlQueue."""
+    aggregate = director.get_aggregate(linkchecker_configuration.Configuration())
+    aggregate.urlqueue = CheckpointUrlQueue()
+    return aggregate
+
+
+@unittest.skipIf(not has_pyqt, "PyQt required")
+class TestUrlList(unittest.TestCase):
+    """Test reading URL list files while checking."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.aggregate = get_aggregate()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write_list(self, name, num, compress=False):
+        """Write URL list file with num URLs and return its URL data."""
+        filename = os.path.join(self.tmpdir.name, name)
+        lines = ["# URL list", ""]
+        lines.extend("http://example.com/%d" % i for i in range(num))
+        data = "\n".join(lines).encode("utf-8")
+        with open(filename, "wb") as fp:
+            fp.write(gzip.compress(data) if compress else data)
+        return linkchecker_checker.get_url_from(
+            filename, 0, self.aggregate, extern=(0, 0))
+
+    def test_is_url_list(self):
+        filename = os.path.join(self.tmpdir.name, "urls.lst.gz")
+        assert not is_url_list(filename)
+        open(filename, "w").close()
+        assert is_url_list(filename)
+        assert is_url_list("file:///tmp/urls.lst")
+        assert not is_url_list("http://example.com/urls.lst")
+
+    def test_read(self):
+        for name, compress in (("urls.lst", False), ("urls.lst.gz", True)):
+            self.aggregate = get_aggregate()
+            url_data = self.write_list(name, 5, compress=compress)
+            urlqueue = self.aggregate.urlqueue
+            reader = UrlListReader()
+            progress = []
+            reader.progress.connect(lambda *args: progress.append(args))
+            urlqueue.add_producer()
+            reader.url_data = url_data
+            reader.filename = url_data.get_os_filename()
+            reader.run()
+            assert sorted(data.url for data in urlqueue.queue) == [
+                "http://example.com/%d" % i for i in range(5)]
+            assert urlqueue.queue[-1].line == 3
+            assert urlqueue.queue[-1].parent_url == url_data.url
+            assert progress[-1][0] == 5
+            assert progress[-1][1] == progress[-1][2]
+            assert urlqueue.unfinished_tasks == 5
+
+    def test_backpressure(self):
+        url_data = self.write_list("urls.lst", 20)
+        urlqueue = self.aggregate.urlqueue
+        reader = UrlListReader()
+        reader.maxqueued = 3
+        reader.read(url_data)
+        time.sleep(0.2)
+        assert len(urlqueue.queue) == 3
+        for i in range(20):
+            item = urlqueue.get(timeout=1)
+            urlqueue.task_done(item)
+            assert len(urlqueue.queue) <= 3
+        assert reader.wait(1000)
+        # the queue is finished after the list has been read
+        assert urlqueue.unfinished_tasks == 0
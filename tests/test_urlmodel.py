@@ -0,0 +1,118 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+import operator
+import sys
+import unittest
+
+from linkcheck.checker.urlbase import CompactUrlData, urlDataAttr
+from PyQt6 import QtCore
+
+from linkcheck_gui.urlmodel import UrlItem, UrlItemModel
+
+
+def get_url_data(**kwargs):
+    """Return CompactUrlData with given attributes."""
+    data = dict.fromkeys(urlDataAttr)
+    data.update(
+        valid=True,
+        result="",
+        warnings=[],
+        name="",
+        parent_url="http://example.com/",
+        url="http://example.com/a",
+        line=1,
+        column=1,
+        info=[],
+        page=0,
+    )
+    data.update(kwargs)
+    return CompactUrlData(data)
+
+
+class TestUrlModel(unittest.TestCase):
+    """Test URL tree model."""
+
+    def test_lazy_display(self):
+        urlitem = UrlItem(get_url_data(warnings=[("tag", "moved")]))
+        assert urlitem._display is None
+        assert urlitem._tooltips is None
+        assert urlitem.display[3] == "Warning: moved"
+        assert urlitem._tooltips is None
+        assert urlitem.tooltips[3] == "moved"
+
+    def test_log_urls(self):
+        model = UrlItemModel()
+        model.log_urls([get_url_data(url="http://example.com/%d" % i)
+                        for i in range(3)])
+        assert model.rowCount() == 3
+        urlitem = model.getUrlItem(model.index(2, 0))
+        assert urlitem.url_data.url == "http://example.com/2"
+
+    def test_store(self):
+        model = UrlItemModel()
+        model.log_urls([get_url_data(url="http://example.com/%d" % i,
+                                     parent_url="http://example.com/%d" % (i % 2),
+                                     line=i)
+                        for i in range(4)])
+        store = model.store
+        assert store.parents[0] == store.parents[2]
+        assert store.url_data[0].parent_url is store.url_data[2].parent_url
+        model.sort(0, QtCore.Qt.SortOrder.DescendingOrder)
+        assert list(model.order) == [3, 1, 2, 0]
+        urls = [urlitem.url_data.url for urlitem in model.urls]
+        assert urls[0] == "http://example.com/3"
+        url_data = store.url_data[3]
+        assert (url_data.valid, url_data.result, url_data.line, url_data.column) == (
+            True, "", 3, 1)
+        # the attributes stored in columns are not stored again per row
+        original = get_url_data()
+        assert sys.getsizeof(url_data) < sys.getsizeof(original)
+        model.clear()
+        assert url_data.parent_url == "http://example.com/1"
+
+    def test_sorted_insert(self):
+        model = UrlItemModel()
+        model.sort(1, QtCore.Qt.SortOrder.DescendingOrder)
+        numbers = [5, 3, 9, 1, 7, 3, 8, 0, 2, 6]
+        for i in range(0, len(numbers), 3):
+            model.log_urls([get_url_data(url="http://example.com/%d" % n)
+                            for n in numbers[i:i + 3]])
+        urls = [urlitem.url_data.url for urlitem in model.urls]
+        assert urls == sorted(urls, reverse=True)
+        model.sort(0)
+        model.sort(1)
+        urls = [urlitem.url_data.url for urlitem in model.urls]
+        assert urls == sorted(urls)
+
+    def test_sort_equal_keys(self):
+        # equal keys stay in the order the URLs were added, like the
+        # stable sorted() of list models
+        url_datas = [get_url_data(url="http://example.com/%d" % i,
+                                  name="abcab"[i % 5]) for i in range(10)]
+        for order in (QtCore.Qt.SortOrder.AscendingOrder,
+                      QtCore.Qt.SortOrder.DescendingOrder):
+            reverse = order == QtCore.Qt.SortOrder.DescendingOrder
+            expected = [url_data.url for url_data in sorted(
+                url_datas, key=operator.attrgetter("name"), reverse=reverse)]
+            model = UrlItemModel()
+            model.log_urls(url_datas[:4])
+            model.sort(2, order)
+            for i in range(4, 10, 3):
+                model.log_urls(url_datas[i:i + 3])
+            assert [url_data.url for url_data in model.get_url_datas()] == expected
+            model.sort(1)
+            model.sort(2, order)
+            assert [url_data.url for url_data in model.get_url_datas()] == expected
@@ -0,0 +1,80 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+import unittest
+
+from PyQt6 import QtCore
+
+from linkcheck_gui import urltree
+from linkcheck_gui.urlmodel import UrlItemModel
+
+from .test_urlmodel import get_url_data
+
+
+def get_child_urls(model, parent):
+    """Return URLs of fetched children of given parent index."""
+    return [model.getUrlItem(model.index(row, 0, parent)).url_data.url
+            for row in range(model.rowCount(parent))]
+
+
+class TestUrlTree(unittest.TestCase):
+    """Test URL tree model grouped by parent URL."""
+
+    def setUp(self):
+        self.model = UrlItemModel()
+        self.tree = urltree.UrlTreeModel(self.model)
+
+    def test_groups(self):
+        self.model.log_urls([
+            get_url_data(url="http://example.com/b", line=2),
+            get_url_data(url="http://example.com/c", parent_url="", line=None,
+                         column=None),
+            get_url_data(url="http://example.com/a", line=1, valid=False),
+        ])
+        assert self.tree.rowCount() == 2
+        parent = self.tree.index(0, 0)
+        assert self.tree.data(parent) == "http://example.com/"
+        assert self.tree.data(self.tree.index(0, 3)) == "2 URLs, 1 error"
+        assert self.tree.hasChildren(parent)
+        assert self.tree.rowCount(parent) == 0
+        assert self.tree.canFetchMore(parent)
+        self.tree.fetchMore(parent)
+        assert get_child_urls(self.tree, parent) == [
+            "http://example.com/a", "http://example.com/b"]
+        child = self.tree.index(1, 0, parent)
+        assert self.tree.parent(child) == parent
+        assert self.tree.getUrlItem(parent) is None
+        # new children of a fetched parent are shown
+        self.model.log_urls([get_url_data(url="http://example.com/d", line=3)])
+        assert self.tree.rowCount(parent) == 3
+        self.model.clear()
+        assert self.tree.rowCount() == 0
+
+    def test_fetch_size(self):
+        self.model.log_urls([get_url_data(url="http://example.com/%d" % i, line=i + 1)
+                             for i in range(urltree.FetchSize + 10)])
+        parent = self.tree.index(0, 0)
+        self.tree.fetchMore(parent)
+        assert self.tree.rowCount(parent) == urltree.FetchSize
+        # rows checked later are inserted before the fetched rows
+        self.model.log_urls([get_url_data(url="http://example.com/x", line=0)])
+        assert self.tree.rowCount(parent) == urltree.FetchSize + 1
+        self.tree.fetchMore(parent)
+        assert not self.tree.canFetchMore(parent)
+        urls = get_child_urls(self.tree, parent)
+        assert urls[0] == "http://example.com/x"
+        assert len(urls) == urltree.FetchSize + 11
+        self.model.sort(1, QtCore.Qt.SortOrder.DescendingOrder)
+        assert get_child_urls(self.tree, parent) == urls
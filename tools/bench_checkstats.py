@@ -0,0 +1,62 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+Benchmark adding synthetic check results to the live check statistics
+and the memory they use, which must not grow with the number of URLs.
+
+Usage: PYTHONPATH=. python tools/bench_checkstats.py [number of hosts]
+"""
+import sys
+import time
+import tracemalloc
+
+from bench_urlmodel import make_url_data
+from linkcheck_gui.checkstats import CheckStats
+
+
+def run(urls, hosts):
+    """Add URL data and print elapsed time, memory and a snapshot."""
+    url_datas = [make_url_data(i) for i in range(1000)]
+    tracemalloc.start()
+    checkstats = CheckStats()
+    elapsed = 0.0
+    for i in range(urls):
+        url_data = url_datas[i % 1000]
+        url_data.domain = "www%d.example.com" % (i % hosts)
+        start = time.perf_counter()
+        checkstats.add(url_data)
+        elapsed += time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    checkstats.get_rates()
+    checktimes = checkstats.get_quantiles()[0]
+    checkstats.get_slowest_hosts()
+    snapshot = time.perf_counter() - start
+    tracemalloc.stop()
+    print("%8d URLs %6d hosts %6.2f us/URL %8.1f KB snapshot %6.2f ms"
+          " p50/p95/p99 %s" % (
+              urls, hosts, elapsed / urls * 1e6, memory / 1e3, snapshot * 1e3,
+              "/".join("%.3f" % value for value in checktimes)))
+
+
+def main(hosts):
+    """Run and print benchmarks."""
+    for urls in (100000, 1000000):
+        run(urls, hosts)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,80 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+Benchmark writing synthetic check results to a results database and
+paging, sorting and filtering them in the SQL result model.
+
+Usage: PYTHONPATH=. python tools/bench_resultdb.py [number of rows]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from PyQt6 import QtCore
+
+from bench_urlmodel import BatchSize, make_url_data
+from linkcheck_gui.sqlmodel import ResultWriter, SqlResultModel
+
+
+def timed(func, *args, **kwargs):
+    """Return seconds needed to call func."""
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main(rows):
+    """Run and print benchmarks."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "bench.sqlite")
+        writer = ResultWriter()
+        start = time.perf_counter()
+        writer.write(filename, "http://www.example.com/")
+        for i in range(0, rows, BatchSize):
+            writer.add([make_url_data(j) for j in range(i, min(i + BatchSize, rows))])
+        writer.finish()
+        writer.wait()
+        elapsed = time.perf_counter() - start
+        size = os.path.getsize(filename) / 1e6
+        print("write  %8d rows %8.3f s %8.1f us/row %8.1f MB"
+              " (including creating the rows)"
+              % (rows, elapsed, elapsed / rows * 1e6, size))
+        model = SqlResultModel(filename)
+        for column in range(model.columnCount()):
+            model.sort(column, QtCore.Qt.SortOrder.DescendingOrder)
+            for row in (0, rows // 2, rows - 1):
+                elapsed = timed(model.getUrlItem, model.index(row, 0))
+                print("page   column %d row %8d %8.2f ms" % (
+                    column, row, elapsed * 1e3))
+        for text in ("doc/12345", "moved", "zzz"):
+            elapsed = timed(model.set_filter, text=text)
+            print("filter %-10s %8d rows %8.2f ms" % (
+                text, model.rowCount(), elapsed * 1e3))
+        model.set_filter()
+        # scroll through all rows
+        tracemalloc.start()
+        for row in range(0, rows, 100):
+            model.getUrlItem(model.index(row, 0))
+        memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print("peak memory scrolling through all rows %.1f MB" % (memory / 1e6))
+        model.close()
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,75 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+Benchmark comparing two synthetic result sets by URL.
+
+Usage: PYTHONPATH=. python tools/bench_resultdiff.py [number of rows]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from bench_urlmodel import BatchSize, make_url_data
+from linkcheck_gui.resultdb import ResultDB
+from linkcheck_gui.resultdiff import compare, count_categories, get_db_entries
+
+
+def make_entries(rows, shift):
+    """Return list of entries with errors depending on shift; with a
+    shift, every 13th check time is one second longer."""
+    return [("http://www.example.com/doc/%d.html" % i,
+             "http://www.example.com/page/%d.html" % (i // 50),
+             (i + shift) % 7 != 0, "200 OK",
+             0.001 * (i % 1000) + (shift and i % 13 == 0))
+            for i in range(rows)]
+
+
+def write_db(filename, rows, shift):
+    """Write a results database with synthetic rows."""
+    db = ResultDB(filename)
+    for i in range(0, rows, BatchSize * 10):
+        db.add_results([make_url_data(j + shift)
+                        for j in range(i, min(i + BatchSize * 10, rows))])
+    db.close()
+
+
+def main(rows):
+    """Run and print benchmarks."""
+    old = make_entries(rows, 0)
+    new = make_entries(rows, 1)
+    start = time.perf_counter()
+    diffs = compare(old, new)
+    elapsed = time.perf_counter() - start
+    print("memory %8d rows %8.3f s %8.2f us/row %s"
+          % (rows, elapsed, elapsed / rows * 1e6, count_categories(diffs)))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        oldfile = os.path.join(tmpdir, "old.sqlite")
+        newfile = os.path.join(tmpdir, "new.sqlite")
+        write_db(oldfile, rows, 0)
+        write_db(newfile, rows, rows // 10)
+        olddb, newdb = ResultDB(oldfile), ResultDB(newfile)
+        start = time.perf_counter()
+        diffs = compare(get_db_entries(olddb), get_db_entries(newdb))
+        elapsed = time.perf_counter() - start
+        print("sqlite %8d rows %8.3f s %8.2f us/row %s"
+              % (rows, elapsed, elapsed / rows * 1e6, count_categories(diffs)))
+        olddb.close()
+        newdb.close()
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500000)
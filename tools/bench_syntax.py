@@ -0,0 +1,164 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+Benchmark the syntax highlighters of the Qt editor on large synthetic
+HTML and INI files: the time until the visible lines are highlighted,
+until the whole file is highlighted, and to highlight again after an
+edit, compared with one regular expression per rule like the
+highlighters up to 10.x.
+
+Usage: PYTHONPATH=. python tools/bench_syntax.py [number of lines]
+Set QT_QPA_PLATFORM=offscreen to run it without a display.
+"""
+import sys
+import time
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+from linkcheck_gui.syntax import format, IniHighlighter, XmlHighlighter
+
+# number of lines shown in the editor
+VisibleLines = 50
+
+# rules of the highlighters up to 10.x
+XmlRules = [
+    ('/>', 'darkBlue'),
+    ('>', 'darkBlue'),
+    ('<!?[a-zA-Z0-9_]+', 'darkBlue'),
+    (r"\b[A-Za-z0-9_]+(?=\s*\=)", 'darkGreen'),
+    (r'"[^"\\]*(\\.[^"\\]*)*"', 'darkMagenta'),
+    (r"'[^'\\]*(\\.[^'\\]*)*'", 'darkMagenta'),
+    (r"<!--[^>]*-->", 'darkYellow'),
+]
+IniRules = [
+    (r'\b\[[a-zA-Z0-9_]+\]\b', 'darkBlue'),
+    (r'\b[a-zA-Z0-9_]+\](?=\s*\=)', 'darkGreen'),
+    (r'#[^\n]*', 'darkYellow'),
+]
+
+
+class RuleHighlighter(QtGui.QSyntaxHighlighter):
+    """Highlighter matching each rule separately over every block."""
+
+    def __init__(self, document, rules):
+        """Compile the rules."""
+        super().__init__(document)
+        self.rules = [(QtCore.QRegularExpression(pattern), format(color))
+                      for pattern, color in rules]
+
+    def highlightBlock(self, text):
+        """Highlight a text block."""
+        for expression, fmt in self.rules:
+            i = expression.globalMatch(text)
+            while i.hasNext():
+                match = i.next()
+                self.setFormat(match.capturedStart(), match.capturedLength(), fmt)
+        self.setCurrentBlockState(0)
+
+
+def make_html(lines):
+    """Return synthetic HTML text with given number of lines."""
+    parts = ["<html>\n<head><title>Benchmark</title></head>\n<body>\n"]
+    for i in range(lines // 5):
+        parts.append(
+            '<div class="row" id="row%d">\n'
+            '  <a href="http://www.example.com/doc/%d.html" title=\'Doc\'>Link %d</a>\n'
+            '  <!-- comment %d\n'
+            '       spanning two lines -->\n'
+            '</div>\n' % (i, i, i, i))
+    parts.append("</body>\n</html>\n")
+    return "".join(parts)
+
+
+def make_ini(lines):
+    """Return synthetic INI text with given number of lines."""
+    parts = []
+    for i in range(lines // 5):
+        parts.append(
+            "# section %d\n"
+            "[section%d]\n"
+            "url=http://www.example.com/%d\n"
+            "timeout = %d\n"
+            "\n" % (i, i, i, i % 60))
+    return "".join(parts)
+
+
+def make_document(text):
+    """Return document with given text and the layout of the Qt editor,
+    so changes are highlighted like in the editor."""
+    document = QtGui.QTextDocument()
+    document.setDocumentLayout(QtWidgets.QPlainTextDocumentLayout(document))
+    document.setPlainText(text)
+    return document
+
+
+def edit(document):
+    """Insert a line in the middle of the document and return elapsed
+    seconds of the insertion and the highlighting of the changed
+    blocks."""
+    block = document.findBlockByNumber(document.blockCount() // 2)
+    cursor = QtGui.QTextCursor(block)
+    start = time.perf_counter()
+    cursor.insertText('<p class="new">\n')
+    return time.perf_counter() - start
+
+
+def bench_rules(name, text, rules):
+    """Highlight text with one expression per rule and print elapsed
+    seconds."""
+    document = make_document(text)
+    highlighter = RuleHighlighter(document, rules)
+    start = time.perf_counter()
+    highlighter.rehighlight()
+    elapsed = time.perf_counter() - start
+    print("%-22s %8d lines %8.3f s visible %8.3f s all %8.2f ms edit" % (
+        "%s rules" % name, document.blockCount(), elapsed, elapsed,
+        edit(document) * 1e3))
+
+
+def bench_tokenizer(name, text, highlighterclass):
+    """Highlight text with the combined tokenizer, showing the middle of
+    the document first, and print elapsed seconds."""
+    document = make_document(text)
+    start = time.perf_counter()
+    highlighter = highlighterclass(document)
+    first = document.blockCount() // 2
+    highlighter.highlightVisible(first + VisibleLines)
+    while highlighter.visible is not None:
+        QtCore.QCoreApplication.processEvents()
+    visible = time.perf_counter() - start
+    while highlighter.timer.isActive():
+        QtCore.QCoreApplication.processEvents()
+    elapsed = time.perf_counter() - start
+    print("%-22s %8d lines %8.3f s visible %8.3f s all %8.2f ms edit" % (
+        "%s tokenizer" % name, document.blockCount(), visible, elapsed,
+        edit(document) * 1e3))
+
+
+def main(lines):
+    """Run and print benchmarks."""
+    app = QtWidgets.QApplication(sys.argv)
+    html = make_html(lines)
+    bench_rules("HTML", html, XmlRules)
+    bench_tokenizer("HTML", html, XmlHighlighter)
+    ini = make_ini(lines)
+    bench_rules("INI", ini, IniRules)
+    bench_tokenizer("INI", ini, IniHighlighter)
+    del app
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
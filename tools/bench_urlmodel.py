@@ -0,0 +1,222 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+Benchmark inserting, sorting, filtering and grouping synthetic check
+results in the URL tree model and the memory used per row.
+
+Usage: PYTHONPATH=. python tools/bench_urlmodel.py [number of rows]
+"""
+import re
+import sys
+import time
+import tracemalloc
+
+from linkcheck.checker.urlbase import CompactUrlData, urlDataAttr
+from PyQt6 import QtCore
+
+from linkcheck_gui.urlfilter import UrlFilterProxyModel
+from linkcheck_gui.urlindex import get_text
+from linkcheck_gui.urlmodel import UrlItem, UrlItemModel
+from linkcheck_gui.urltree import UrlTreeModel
+
+BatchSize = 100
+
+
+def make_url_data(i):
+    """Return synthetic URL data for row number i."""
+    data = dict.fromkeys(urlDataAttr)
+    data.update(
+        valid=i % 7 != 0,
+        extern=(0, 0),
+        result="200 OK" if i % 7 else "404 Not Found",
+        warnings=[("http-moved-permanent", "Moved permanently " * 5)]
+        if i % 11 == 0 else [],
+        name="Link %d" % i,
+        title="",
+        parent_url="http://www.example.com/page/%d.html" % (i // 50),
+        base_ref="",
+        base_url="/doc/%d.html" % i,
+        url="http://www.example.com/doc/%d.html" % i,
+        domain="www.example.com",
+        checktime=0.001 * (i % 1000),
+        dltime=0.0005 * (i % 1000),
+        size=1024 + i % 4096,
+        info=[],
+        line=i % 500 + 1,
+        column=i % 80 + 1,
+        page=0,
+        cache_url="http://www.example.com/doc/%d.html" % i,
+        content_type="text/html",
+        level=1,
+    )
+    return CompactUrlData(data)
+
+
+def make_url_datas(rows):
+    """Return list of synthetic URL data."""
+    return [make_url_data(i) for i in range(rows)]
+
+
+def insert(url_datas, eager=False):
+    """Insert URL data in batches and return elapsed seconds."""
+    model = UrlItemModel()
+    start = time.perf_counter()
+    for i in range(0, len(url_datas), BatchSize):
+        model.log_urls(url_datas[i:i + BatchSize])
+        if eager:
+            # format display and tooltips like the model did up to 10.x
+            for record in range(i, min(i + BatchSize, len(url_datas))):
+                urlitem = UrlItem(url_datas[record])
+                urlitem.init_display()
+                urlitem.init_tooltips()
+    return time.perf_counter() - start
+
+
+def sort(url_datas):
+    """Sort all rows by each column twice and print elapsed seconds."""
+    model = UrlItemModel()
+    for i in range(0, len(url_datas), BatchSize):
+        model.log_urls(url_datas[i:i + BatchSize])
+    for run in ("first", "second"):
+        for column in range(model.columnCount()):
+            start = time.perf_counter()
+            model.sort(column, QtCore.Qt.SortOrder.DescendingOrder)
+            elapsed = time.perf_counter() - start
+            print("%-18s %8d rows %8.3f s column %d" % (
+                "%s sort" % run, len(url_datas), elapsed, column))
+    start = time.perf_counter()
+    for i in range(0, len(url_datas), BatchSize):
+        model.log_urls(url_datas[i:i + BatchSize])
+    elapsed = time.perf_counter() - start
+    print("%-18s %8d rows %8.3f s %8.2f us/row" % (
+        "sorted insertion", len(url_datas), elapsed, elapsed * 1e6 / len(url_datas)))
+
+
+def filter_keystrokes(url_datas, text="doc/12345"):
+    """Filter rows after each typed character of text with a regular
+    expression scan and with the filter proxy, and print elapsed
+    milliseconds per keystroke."""
+    model = UrlItemModel()
+    proxy = UrlFilterProxyModel()
+    proxy.setSourceModel(model)
+    start = time.perf_counter()
+    for i in range(0, len(url_datas), BatchSize):
+        model.log_urls(url_datas[i:i + BatchSize])
+    elapsed = time.perf_counter() - start
+    print("%-18s %8d rows %8.3f s %8.2f us/row" % (
+        "indexed insertion", len(url_datas), elapsed,
+        elapsed * 1e6 / len(url_datas)))
+    for name in ("regex scan", "index search"):
+        times = []
+        for i in range(1, len(text) + 1):
+            start = time.perf_counter()
+            if name == "regex scan":
+                pattern = re.compile(re.escape(text[:i]), re.IGNORECASE)
+                shown = len([url_data for url_data in model.get_url_datas()
+                             if pattern.search(get_text(url_data))])
+            else:
+                proxy.set_filter(text=text[:i])
+                shown = proxy.rowCount()
+            times.append(time.perf_counter() - start)
+        print("%-18s %8d rows %8.2f ms/key %8.2f ms last key %6d shown" % (
+            name, len(url_datas), sum(times) * 1e3 / len(times),
+            times[-1] * 1e3, shown))
+
+
+def group(url_datas):
+    """Insert rows grouped by parent URL and expand the last parent URL,
+    and print elapsed seconds."""
+    model = UrlItemModel()
+    tree = UrlTreeModel(model)
+    start = time.perf_counter()
+    for i in range(0, len(url_datas), BatchSize):
+        model.log_urls(url_datas[i:i + BatchSize])
+    elapsed = time.perf_counter() - start
+    print("%-18s %8d rows %8.3f s %8.2f us/row" % (
+        "grouped insertion", len(url_datas), elapsed,
+        elapsed * 1e6 / len(url_datas)))
+    parent = tree.index(tree.rowCount() - 1, 0)
+    start = time.perf_counter()
+    while tree.canFetchMore(parent):
+        tree.fetchMore(parent)
+    elapsed = time.perf_counter() - start
+    print("%-18s %8d rows %8.3f ms %8d children" % (
+        "expand parent", len(url_datas), elapsed * 1e3, tree.rowCount(parent)))
+
+
+def memory_items(rows):
+    """Return bytes used by URL data in a list of formatted URL items,
+    the storage of the model up to 10.x."""
+    tracemalloc.start()
+    urls = []
+    for url_data in make_url_datas(rows):
+        urlitem = UrlItem(url_data)
+        urlitem.init_display()
+        urlitem.init_tooltips()
+        urls.append(urlitem)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size
+
+
+def memory_url_datas(rows):
+    """Return bytes used by a list of the logged URL data objects, which
+    is what a store without columns would keep."""
+    tracemalloc.start()
+    url_datas = make_url_datas(rows)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del url_datas
+    return size
+
+
+def memory_store(rows):
+    """Return bytes used by URL data in the column store of the model."""
+    tracemalloc.start()
+    model = UrlItemModel()
+    url_datas = make_url_datas(rows)
+    for i in range(0, rows, BatchSize):
+        model.log_urls(url_datas[i:i + BatchSize])
+    del url_datas
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size
+
+
+def main(rows):
+    """Run and print benchmarks."""
+    QtCore.QCoreApplication(sys.argv)
+    url_datas = make_url_datas(rows)
+    for name, eager in (("eager formatting", True), ("lazy formatting", False)):
+        elapsed = insert(url_datas, eager=eager)
+        print("%-18s %8d rows %8.3f s %8.2f us/row" % (
+            name, rows, elapsed, elapsed * 1e6 / rows))
+    sort(url_datas)
+    filter_keystrokes(url_datas)
+    group(url_datas)
+    del url_datas
+    items = memory_items(rows) / rows
+    plain = memory_url_datas(rows) / rows
+    store = memory_store(rows) / rows
+    print("%-18s %8d rows %8.0f bytes/row" % ("URL item list", rows, items))
+    print("%-18s %8d rows %8.0f bytes/row" % ("URL data list", rows, plain))
+    print("%-18s %8d rows %8.0f bytes/row" % ("column store", rows, store))
+    print("%-18s %8d rows %8.0f bytes/row" % ("saved", rows, items - store))
+    print("%-18s %8d rows %8.0f bytes/row" % ("saved on data", rows, plain - store))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
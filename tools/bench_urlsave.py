@@ -0,0 +1,56 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+Benchmark saving synthetic check results in each output format with
+the background save thread.
+
+Usage: PYTHONPATH=. python tools/bench_urlsave.py [number of rows]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from linkcheck import configuration as linkchecker_configuration
+from PyQt6 import QtCore
+
+from bench_urlmodel import make_url_datas
+from linkcheck_gui.urlsave import get_logger, Logtype2FileExt, UrlSaveThread
+
+
+def main(rows):
+    """Run and print benchmarks."""
+    app = QtCore.QCoreApplication(sys.argv)
+    config = linkchecker_configuration.Configuration()
+    config["logger"] = config.logger_new("none")
+    url_datas = make_url_datas(rows)
+    saver = UrlSaveThread()
+    saver.finished.connect(app.quit)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for logtype, ext in Logtype2FileExt.items():
+            filename = os.path.join(tmpdir, "bench" + ext)
+            logger = get_logger(config, filename, logtype)
+            start = time.perf_counter()
+            saver.save(logger, url_datas, config["logger"].stats, filename)
+            app.exec()
+            elapsed = time.perf_counter() - start
+            print("%-5s %8d rows %8.3f s %10.0f rows/s %8.1f MB" % (
+                logtype, rows, elapsed, rows / elapsed,
+                os.path.getsize(filename) / 1e6))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)